@@ -0,0 +1,51 @@
+"""
+Per-call cost of regex validation: pattern strings through re.match against the
+precompiled patterns of v2s_common_utils.patterns.
+
+Run from the repository root:
+    python benchmarks/bench_patterns.py [calls]
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from v2s_common_utils.patterns import DIGITS_ONLY, EMAIL, PATTERNS  # noqa: E402
+
+# The anchored strings the validators passed to re.match before the registry.
+CASES = [
+    ('digits_only', r'^\d+$', DIGITS_ONLY, '9876543210'),
+    ('email', r'^[\w.%+-]+@[\w.-]+\.[a-zA-Z]{2,4}$', EMAIL, 'first.last@example.com'),
+]
+
+# More distinct patterns than the re module caches (512), so re.match recompiles.
+MANY_PATTERNS = [rf'^item-{i}-\d+$' for i in range(600)]
+
+
+def per_call_ns(stmt, calls):
+    return min(timeit.repeat(stmt, number=calls, repeat=5)) / calls * 1e9
+
+
+def main(calls=500_000):
+    print(f'{calls} calls each, best of 5, Python {sys.version.split()[0]}')
+    for name, source, compiled, value in CASES:
+        before = per_call_ns(lambda: re.match(source, value), calls)
+        after = per_call_ns(lambda: compiled.fullmatch(value), calls)
+        print(f'{name:12s} re.match(str) {before:7.0f} ns -> compiled fullmatch {after:7.0f} ns')
+
+    cycle_calls = max(calls // 100, len(MANY_PATTERNS))
+    state = {'i': 0}
+
+    def next_pattern():
+        state['i'] = (state['i'] + 1) % len(MANY_PATTERNS)
+        return MANY_PATTERNS[state['i']]
+
+    before = per_call_ns(lambda: re.match(next_pattern(), 'item-7-42'), cycle_calls)
+    after = per_call_ns(lambda: PATTERNS.compile(next_pattern()).match('item-7-42'), cycle_calls)
+    print(f'{len(MANY_PATTERNS)} patterns cycling: re.match {before / 1000:.1f} us -> registry {after / 1000:.1f} us')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,70 @@
+"""
+Cost of validating one payload: the ValidatorHelper.validate_and_collect_errors loop
+against a plan compiled with ValidatorHelper.compile.
+
+Run from the repository root:
+    python benchmarks/bench_validation_plan.py [runs]
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import django  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+settings.configure(
+    INSTALLED_APPS=['rest_framework', 'v2s_common_utils'],
+    V2S_WARMUP={'ENABLED': False},
+)
+django.setup()
+
+from v2s_common_utils.validations import (  # noqa: E402
+    AlphanumericValidator,
+    DigitsOnlyValidator,
+    EmptyValidator,
+    MinMaxLengthValidator,
+    RegexValidator,
+    ValidatorHelper,
+)
+
+# 10 pure validators over 4 fields.
+VALIDATORS = [
+    EmptyValidator('username', error_code='E001', error_message='Username is required.'),
+    MinMaxLengthValidator('username', min_length=3, max_length=30, error_code='E002', error_message='Username length.'),
+    AlphanumericValidator('username', error_code='E003', error_message='Username must be alphanumeric.'),
+    EmptyValidator('email', error_code='E004', error_message='Email is required.'),
+    MinMaxLengthValidator('email', min_length=6, max_length=254, error_code='E005', error_message='Email length.'),
+    RegexValidator('email', validation_method='validate_email', error_code='E006', error_message='Invalid email.'),
+    EmptyValidator('phone', error_code='E007', error_message='Phone is required.'),
+    DigitsOnlyValidator('phone', error_code='E008', error_message='Phone must be digits.'),
+    MinMaxLengthValidator('phone', min_length=10, max_length=10, error_code='E009', error_message='Phone length.'),
+    EmptyValidator('country', error_code='E010', error_message='Country is required.'),
+]
+
+PAYLOADS = {
+    'valid payload': {'username': 'jdoe42', 'email': 'jdoe@example.com', 'phone': '9876543210', 'country': 'IN'},
+    'invalid payload': {'username': 'j d', 'email': 'x', 'phone': 'abc', 'country': ''},
+}
+
+
+def per_run_us(stmt, runs):
+    return min(timeit.repeat(stmt, number=runs, repeat=5)) / runs * 1e6
+
+
+def main(runs=100_000):
+    plan = ValidatorHelper.compile(VALIDATORS)
+    loop = ValidatorHelper.validate_and_collect_errors
+    print(f'{len(VALIDATORS)} validators over {len(plan.fields)} fields, {runs} runs, best of 5, '
+          f'Python {sys.version.split()[0]}')
+    for name, data in PAYLOADS.items():
+        assert plan.run(data) == loop(data, VALIDATORS)
+        before = per_run_us(lambda: loop(data, VALIDATORS), runs)
+        after = per_run_us(lambda: plan.run(data), runs)
+        fail_fast = per_run_us(lambda: plan.run(data, fail_fast=True), runs)
+        print(f'{name:16s} loop {before:5.1f} us -> plan {after:5.1f} us (fail_fast {fail_fast:5.1f} us)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -4,5 +4,5 @@ setup(name="v2s_common_utils",
       description="This is package used for django restframework",
       long_description="",
       author="Vishwajeet Kale",
-      packages=['v2s_common_utils'],
+      packages=['v2s_common_utils', 'v2s_common_utils.management', 'v2s_common_utils.management.commands'],
       install_requires=['djangorestframework', 'drf-yasg'])
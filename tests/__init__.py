@@ -0,0 +1,23 @@
+import django
+from django.conf import settings
+
+# The package has no Django project of its own, so the tests configure a minimal one.
+# Run them with `python -m pytest tests` or `python -m unittest discover -s tests -t .`.
+if not settings.configured:
+    settings.configure(
+        SECRET_KEY='tests',
+        INSTALLED_APPS=[
+            'django.contrib.contenttypes',
+            'django.contrib.auth',
+            'rest_framework',
+            'v2s_common_utils',
+        ],
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        DEFAULT_AUTO_FIELD='django.db.models.AutoField',
+        ROOT_URLCONF=__name__,
+        USE_TZ=True,
+        V2S_WARMUP={'ENABLED': False},
+    )
+    django.setup()
+
+urlpatterns = []
@@ -0,0 +1,37 @@
+import unittest
+
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from v2s_common_utils.custom_validations import check_required_keys
+from v2s_common_utils.utils import generate_response
+
+
+class RequiredKeysView(APIView):
+    authentication_classes = []
+    permission_classes = []
+
+    @check_required_keys(['name', 'email'])
+    def post(self, request):
+        return generate_response(status=200, message='ok')
+
+
+class CheckRequiredKeysTest(unittest.TestCase):
+
+    def post(self, payload):
+        request = APIRequestFactory().post('/', payload, format='json')
+        return RequiredKeysView.as_view()(request)
+
+    def test_present_keys_reach_the_view(self):
+        response = self.post({'name': 'a', 'email': 'a@b.co'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_keys_are_reported_together(self):
+        response = self.post({'name': 'a'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("'email'", str(response.data))
+
+    def test_list_payload_is_a_bad_request(self):
+        response = self.post([{'name': 'a', 'email': 'a@b.co'}])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("'name', 'email'", str(response.data))
@@ -0,0 +1,95 @@
+import json
+import os
+import tempfile
+import unittest
+
+from v2s_common_utils.errors import UNDEFINED_ERROR, ErrorCatalog
+
+
+class ErrorCatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.directory.name, 'cache')
+        self.path = self.write('message.properties', E001='Name is required.', E002='Email is invalid.')
+        self.write('message_pt.properties', E001='Nome obrigatorio.', E002='Email invalido.')
+        self.write('message_pt_BR.properties', E002='E-mail invalido.')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, **messages):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('[errors]\n' + ''.join(f'{code} = {message}\n' for code, message in messages.items()))
+        # Make sure the change is seen even on file systems with coarse timestamps.
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+        return path
+
+    def catalog(self, **kwargs):
+        return ErrorCatalog(self.path, **{'check_interval': None, 'cache_dir': self.cache_dir, **kwargs})
+
+    def test_locale_falls_back_to_language_then_default(self):
+        catalog = self.catalog()
+        self.assertEqual(catalog.get('E001'), 'Name is required.')
+        self.assertEqual(catalog.get('E001', locale='pt_BR'), 'Nome obrigatorio.')
+        self.assertEqual(catalog.get('E002', locale='pt_BR'), 'E-mail invalido.')
+        self.assertEqual(catalog.get('E002', locale='pt-BR'), 'E-mail invalido.')
+        self.assertEqual(catalog.get('E002', locale='pt'), 'Email invalido.')
+        self.assertEqual(catalog.get('E001', locale='fr'), 'Name is required.')
+        self.assertEqual(catalog.get('E999', locale='pt'), UNDEFINED_ERROR)
+        self.assertEqual(catalog.locales(), ['pt', 'pt_BR'])
+
+    def test_nothing_is_read_before_the_first_lookup(self):
+        catalog = self.catalog()
+        self.assertFalse(os.path.exists(self.cache_dir))
+        catalog.get('E001')
+        self.assertTrue(os.listdir(self.cache_dir))
+
+    def test_hot_reload(self):
+        catalog = self.catalog(check_interval=0)
+        self.assertEqual(catalog.get('E001'), 'Name is required.')
+        self.write('message.properties', E001='A name is required.')
+        self.write('message_hi.properties', E001='Naam zaroori hai.')
+        self.assertEqual(catalog.get('E001'), 'A name is required.')
+        self.assertEqual(catalog.get('E001', locale='hi'), 'Naam zaroori hai.')
+        self.assertEqual(catalog.get('E002'), UNDEFINED_ERROR)
+
+    def test_broken_file_keeps_the_previous_messages(self):
+        catalog = self.catalog(check_interval=0)
+        catalog.get('E001')
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write('E003 = no section\n[errors]\nE003 = duplicate section\n')
+        with self.assertLogs('v2s_common_utils.errors', 'ERROR'):
+            self.assertEqual(catalog.get('E001'), 'Name is required.')
+
+    def test_later_catalogs_load_the_parsed_cache(self):
+        self.catalog().get('E001')
+        [cache_name] = os.listdir(self.cache_dir)
+        cache_path = os.path.join(self.cache_dir, cache_name)
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        cached['catalogs']['']['E001'] = 'From the cache.'
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cached, f)
+        self.assertEqual(self.catalog().get('E001'), 'From the cache.')
+
+    @unittest.skipUnless(hasattr(os, 'getuid'), 'cache ownership checks need uids')
+    def test_cache_writable_by_others_is_ignored(self):
+        self.catalog().get('E001')
+        [cache_name] = os.listdir(self.cache_dir)
+        cache_path = os.path.join(self.cache_dir, cache_name)
+        with open(cache_path, encoding='utf-8') as f:
+            cached = json.load(f)
+        cached['catalogs']['']['E001'] = 'Planted.'
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cached, f)
+        os.chmod(cache_path, 0o666)
+        with self.assertLogs('v2s_common_utils.errors', 'WARNING'):
+            self.assertEqual(self.catalog().get('E001'), 'Name is required.')
+
+    def test_missing_file_resolves_to_undefined(self):
+        with self.assertLogs('v2s_common_utils.errors', 'WARNING'):
+            catalog = ErrorCatalog(os.path.join(self.directory.name, 'missing.properties'), cache_dir=None)
+            self.assertEqual(catalog.get('E001'), UNDEFINED_ERROR)
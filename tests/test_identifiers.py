@@ -0,0 +1,50 @@
+import threading
+import unittest
+import uuid
+
+from v2s_common_utils.identifiers import TimeOrderedIdGenerator, extract_timestamp_ms, uuid7
+
+
+class TimeOrderedIdGeneratorTest(unittest.TestCase):
+
+    def test_monotonic_within_one_millisecond(self):
+        generator = TimeOrderedIdGenerator(clock=lambda: 1_700_000_000_000)
+        ids = [generator.generate() for _ in range(1000)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), len(ids))
+        self.assertEqual({extract_timestamp_ms(value) for value in ids}, {1_700_000_000_000})
+
+    def test_clock_going_backwards_keeps_order(self):
+        times = iter([5_000, 4_000, 4_000, 6_000])
+        generator = TimeOrderedIdGenerator(clock=lambda: next(times))
+        ids = [generator.generate() for _ in range(4)]
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual([extract_timestamp_ms(value) for value in ids], [5_000, 5_000, 5_000, 6_000])
+
+    def test_random_part_overflow_advances_the_timestamp(self):
+        generator = TimeOrderedIdGenerator(clock=lambda: 10)
+        first = generator.generate()
+        generator._last_rand = (1 << 74) - 1
+        second = generator.generate()
+        self.assertLess(first, second)
+        self.assertEqual(extract_timestamp_ms(second), 11)
+
+    def test_generate_many_is_sorted_and_version_7(self):
+        ids = TimeOrderedIdGenerator(clock=lambda: 42).generate_many(500)
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual({(value.version, value.variant) for value in ids}, {(7, uuid.RFC_4122)})
+
+    def test_unique_across_threads(self):
+        generator = TimeOrderedIdGenerator(clock=lambda: 1)
+        results = []
+        threads = [threading.Thread(target=lambda: results.extend(generator.generate_many(200))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(results)), 800)
+
+    def test_extract_timestamp_rejects_other_versions(self):
+        with self.assertRaises(ValueError):
+            extract_timestamp_ms('12345678-1234-4678-9234-567812345678')
+        self.assertGreater(extract_timestamp_ms(str(uuid7())), 0)
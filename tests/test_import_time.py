@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in milliseconds, measured with `python -X importtime` in a
+# fresh interpreter (best of RUNS). They are several times the times measured on a
+# developer machine, so only real regressions fail.
+IMPORT_BUDGETS_MS = {
+    'v2s_common_utils': 20,
+    'v2s_common_utils.message': 25,
+    'v2s_common_utils.constants': 25,
+    'v2s_common_utils.swagger': 40,
+    'v2s_common_utils.patterns': 60,
+    'v2s_common_utils.logger': 150,
+    'v2s_common_utils.concurrency': 120,
+    'v2s_common_utils.errors': 150,
+    'v2s_common_utils.metrics': 120,
+    'v2s_common_utils.timing': 200,
+    'v2s_common_utils.profiling': 150,
+}
+
+# Heavy packages that the light modules above must not import.
+HEAVY_PACKAGES = ('rest_framework', 'drf_yasg', 'django.db.models', 'django.conf')
+
+RUNS = 3
+
+
+def measure_import(module):
+    """
+    Imports module in a fresh interpreter with -X importtime.
+
+    Returns:
+        tuple: The cumulative import time of the module and its parent packages in
+            milliseconds, and the set of every module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        parts = line.split('|')
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            cumulative[parts[2].strip()] = int(parts[1]) / 1000
+    package = module.split('.')[0]
+    total = cumulative[package] + (cumulative[module] if module != package else 0)
+    return total, set(cumulative)
+
+
+class ImportTimeTest(unittest.TestCase):
+
+    def test_imports_stay_within_budget(self):
+        for module, budget in IMPORT_BUDGETS_MS.items():
+            with self.subTest(module=module):
+                best, imported = min(measure_import(module) for _ in range(RUNS))
+                self.assertLessEqual(best, budget, f"{module} took {best:.1f} ms to import, over its {budget} ms budget.")
+                heavy = sorted(name for name in imported if name in HEAVY_PACKAGES)
+                self.assertEqual(heavy, [], f"{module} imports {', '.join(heavy)}.")
+
+
+if __name__ == '__main__':
+    for name in IMPORT_BUDGETS_MS:
+        ms, _ = min(measure_import(name) for _ in range(RUNS))
+        print(f'{name:32s} {ms:8.1f} ms  (budget {IMPORT_BUDGETS_MS[name]} ms)')
@@ -0,0 +1,322 @@
+import gzip
+import json
+import logging
+import os
+import tempfile
+import threading
+import unittest
+import uuid
+from decimal import Decimal
+
+from v2s_common_utils.logger import (
+    LOG_SAMPLE_RATES,
+    BatchFlushFileHandler,
+    JsonFormatter,
+    LoggerMessage,
+    LogWriter,
+    RotatingLogHandler,
+    _BoundedQueueHandler,
+    _compressor,
+    _writers,
+    _writers_lock,
+    get_logger,
+    log_event,
+    logging_stats,
+    prune_rotated_logs,
+    set_sample_rate,
+)
+
+
+class BlockingHandler(logging.Handler):
+    """Handler whose emit() waits until released, to keep the writer thread busy."""
+
+    def __init__(self):
+        super().__init__()
+        self.entered = threading.Event()
+        self.resume = threading.Event()
+        self.messages = []
+
+    def emit(self, record):
+        self.entered.set()
+        self.resume.wait(5)
+        self.messages.append(record.getMessage())
+
+
+def make_record(message):
+    return logging.LogRecord('x', logging.INFO, __file__, 1, message, None, None)
+
+
+class LogWriterTest(unittest.TestCase):
+    """Records are written by a background thread, and overflow follows the policy."""
+
+    def fill_while_busy(self, overflow):
+        handler = BlockingHandler()
+        writer = LogWriter(handler, queue_size=2, overflow=overflow, block_timeout=0.01)
+        writer.enqueue(make_record('busy'))
+        self.assertTrue(handler.entered.wait(5))
+        for message in ('a', 'b', 'c'):
+            writer.enqueue(make_record(message))
+        stats = writer.stats()
+        handler.resume.set()
+        writer.stop()
+        return stats, handler.messages
+
+    def test_drop_newest(self):
+        stats, messages = self.fill_while_busy('drop_newest')
+        self.assertEqual((stats['dropped'], stats['queued']), (1, 2))
+        self.assertEqual(messages, ['busy', 'a', 'b'])
+
+    def test_drop_oldest(self):
+        stats, messages = self.fill_while_busy('drop_oldest')
+        self.assertEqual(stats['dropped'], 1)
+        self.assertEqual(messages, ['busy', 'b', 'c'])
+
+    def test_block_drops_after_the_timeout(self):
+        stats, messages = self.fill_while_busy('block')
+        self.assertEqual(stats['dropped'], 1)
+        self.assertEqual(messages, ['busy', 'a', 'b'])
+
+    def test_unknown_overflow_policy(self):
+        with self.assertRaises(ValueError):
+            LogWriter(logging.NullHandler(), overflow='wait')
+
+    def test_stop_writes_every_queued_record(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'drain.log')
+            handler = BatchFlushFileHandler(path)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            writer = LogWriter(handler, batch_size=16)
+            for i in range(1000):
+                writer.enqueue(make_record(str(i)))
+            writer.stop()
+            with open(path, encoding='utf-8') as log_file:
+                self.assertEqual(log_file.read().splitlines(), [str(i) for i in range(1000)])
+            self.assertEqual(writer.stats()['written'], 1000)
+
+
+class GetLoggerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'nested', 'core.log')
+
+    def tearDown(self):
+        with _writers_lock:
+            writer = _writers.pop(os.path.abspath(self.path), None)
+        if writer is not None:
+            writer.stop()
+        self.directory.cleanup()
+
+    def test_loggers_share_one_writer_and_attach_once(self):
+        first = get_logger('tests.logger.first', log_file_path=self.path)
+        get_logger('tests.logger.first', log_file_path=self.path)
+        second = get_logger('tests.logger.second', log_file_path=self.path)
+        self.assertEqual(len([h for h in first.handlers if isinstance(h, _BoundedQueueHandler)]), 1)
+        self.assertIs(first.handlers[-1].writer, second.handlers[-1].writer)
+        first.propagate = second.propagate = False
+        first.info('one')
+        second.info('two')
+        self.assertIn(os.path.abspath(self.path), logging_stats())
+        first.handlers[-1].writer.stop()
+        with open(self.path, encoding='utf-8') as log_file:
+            lines = log_file.read().splitlines()
+        self.assertEqual([line.rsplit(' - ', 1)[1] for line in lines], ['one', 'two'])
+        for logger in (first, second):
+            logger.handlers.clear()
+
+
+class QueuedRecordFormattingTest(unittest.TestCase):
+    """Records queued for the writer thread are written as logging would format them inline."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.log')
+        handler = BatchFlushFileHandler(self.path)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        self.writer = LogWriter(handler)
+        self.queue_handler = _BoundedQueueHandler(self.writer)
+        self.logger = logging.getLogger(f'tests.logger.{self.id()}')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.queue_handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.queue_handler)
+        self.writer.stop()
+        self.directory.cleanup()
+
+    def written_lines(self):
+        self.writer.stop()
+        with open(self.path, encoding='utf-8') as log_file:
+            return log_file.read().splitlines()
+
+    def test_numeric_formats_with_decimal(self):
+        self.logger.info("total %d items, ratio %.2f", Decimal(5), Decimal('1.5'))
+        self.assertEqual(self.written_lines(), ['total 5 items, ratio 1.50'])
+
+    def test_repr_of_uuid(self):
+        value = uuid.UUID('12345678-1234-5678-1234-567812345678')
+        self.logger.info("id %r", value)
+        self.assertEqual(self.written_lines(), [f'id {value!r}'])
+
+    def test_mapping_args(self):
+        self.logger.info("%(count)d rows", {'count': Decimal(3)})
+        self.assertEqual(self.written_lines(), ['3 rows'])
+
+    def test_plain_args_are_formatted_on_the_writer_thread(self):
+        record = logging.LogRecord('x', logging.INFO, __file__, 1, LoggerMessage('GET_DETAILS', 'user', 7), None, None)
+        prepared = self.queue_handler.prepare(record)
+        self.assertIsInstance(prepared.msg, LoggerMessage)
+
+    def test_other_args_are_formatted_on_the_calling_thread(self):
+        items = [1, 2]
+        record = logging.LogRecord('x', logging.INFO, __file__, 1, "items %s", (items,), None)
+        prepared = self.queue_handler.prepare(record)
+        items.append(3)
+        self.assertEqual((prepared.msg, prepared.args), ('items [1, 2]', None))
+
+    def test_logger_message_is_written_from_its_template(self):
+        self.logger.info(LoggerMessage('GET_DETAILS', 'user', 7))
+        self.assertEqual(self.written_lines(), ['Getting user details for ID 7.'])
+
+
+class ListHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+class JsonLoggingTest(unittest.TestCase):
+    """log_event() records rendered by JsonFormatter, and per-key sampling."""
+
+    def setUp(self):
+        self.handler = ListHandler()
+        self.handler.setFormatter(JsonFormatter())
+        self.logger = logging.getLogger(f'tests.logger.{self.id()}')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.handler)
+        self.saved_rates = dict(LOG_SAMPLE_RATES)
+
+    def tearDown(self):
+        LOG_SAMPLE_RATES.clear()
+        LOG_SAMPLE_RATES.update(self.saved_rates)
+
+    def entries(self):
+        return [json.loads(line) for line in self.handler.lines]
+
+    def test_event_and_fields(self):
+        self.assertTrue(log_event(self.logger, 'GET_DETAILS', 'user', 7, user_id=7, message='clash'))
+        [entry] = self.entries()
+        self.assertEqual(entry['message'], 'Getting user details for ID 7.')
+        self.assertEqual((entry['event'], entry['sample_rate'], entry['user_id']), ('GET_DETAILS', 1.0, 7))
+        self.assertEqual(entry['fields'], {'message': 'clash'})
+        self.assertEqual(entry['level'], 'INFO')
+
+    def test_exception_is_written_as_a_string(self):
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            self.logger.exception('failed')
+        [entry] = self.entries()
+        self.assertIn('ValueError: boom', entry['exc_info'])
+
+    def test_sampled_out_and_disabled_events_are_not_logged(self):
+        set_sample_rate('GET_ALL', 0.0)
+        self.assertFalse(log_event(self.logger, 'GET_ALL', 'user'))
+        self.assertFalse(log_event(self.logger, 'GET_ALL', 'group', level=logging.DEBUG))
+        self.assertEqual(self.handler.lines, [])
+        with self.assertRaises(ValueError):
+            set_sample_rate('GET_ALL', 1.5)
+
+
+class RotationRaceTest(unittest.TestCase):
+    """Two handlers on one file, as in two worker processes, rotate it once per period."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'shared.log')
+        self.handlers = [
+            RotatingLogHandler(self.path, rotate_interval=2, backup_count=0, compress=False) for _ in range(2)
+        ]
+        for handler in self.handlers:
+            handler.setFormatter(logging.Formatter('%(message)s'))
+
+    def tearDown(self):
+        for handler in self.handlers:
+            handler.close()
+        self.directory.cleanup()
+
+    def write(self, handler, message):
+        handler.emit(logging.LogRecord('x', logging.INFO, __file__, 1, message, None, None))
+        handler.flush_batch()
+
+    def read(self, name):
+        with open(os.path.join(self.directory.name, name), encoding='utf-8') as log_file:
+            return log_file.read().splitlines()
+
+    def test_second_handler_reopens_instead_of_rotating_again(self):
+        first, second = self.handlers
+        self.write(first, 'one')
+        self.write(second, 'two')
+        # The period ends for both processes.
+        first._next_rollover = second._next_rollover = first._next_rollover - 10
+        self.write(first, 'three')
+        self.write(second, 'four')
+        rotated = sorted(name for name in os.listdir(self.directory.name) if name.startswith('shared.log.2'))
+        self.assertEqual(len(rotated), 1)
+        self.assertEqual(self.read(rotated[0]), ['one', 'two'])
+        self.assertEqual(self.read('shared.log'), ['three', 'four'])
+
+
+class SizeRotationTest(unittest.TestCase):
+    """Files are rotated before they grow past max_bytes, then gzipped and pruned in the background."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'size.log')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def rotated(self):
+        return sorted(name for name in os.listdir(self.directory.name) if name.startswith('size.log.2'))
+
+    def test_rotates_compresses_and_prunes(self):
+        handler = RotatingLogHandler(self.path, max_bytes=100, backup_count=2)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        for i in range(5):
+            handler.emit(make_record(f'{i}' * 59))
+            handler.flush_batch()
+        handler.close()
+        _compressor.wait()
+        rotated = self.rotated()
+        self.assertEqual(len(rotated), 2)
+        self.assertTrue(all(name.endswith('.gz') for name in rotated))
+        with gzip.open(os.path.join(self.directory.name, rotated[-1]), 'rt', encoding='utf-8') as rotated_file:
+            self.assertEqual(rotated_file.read(), '3' * 59 + '\n')
+        with open(self.path, encoding='utf-8') as log_file:
+            self.assertEqual(log_file.read(), '4' * 59 + '\n')
+
+    def test_a_batch_is_never_split(self):
+        handler = RotatingLogHandler(self.path, max_bytes=100, backup_count=0, compress=False)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        for i in range(3):
+            handler.emit(make_record(f'{i}' * 59))
+        handler.flush_batch()
+        handler.close()
+        self.assertEqual(self.rotated(), [])
+        with open(self.path, encoding='utf-8') as log_file:
+            self.assertEqual(len(log_file.read().splitlines()), 3)
+
+    def test_prune_keeps_the_newest(self):
+        names = ['size.log.20240101-000000-000000.gz', 'size.log.20240101-000000-000000-1.gz',
+                 'size.log.20240102-000000-000000', 'size.log.lock', 'other.log.20230101-000000-000000']
+        for name in names:
+            open(os.path.join(self.directory.name, name), 'w').close()
+        prune_rotated_logs(self.path, 2)
+        self.assertEqual(sorted(os.listdir(self.directory.name)), sorted(names[1:]))
@@ -0,0 +1,28 @@
+import time
+import unittest
+
+from django.contrib.auth.models import Group
+
+from v2s_common_utils.lookup_cache import MISSING, LookupCache
+
+
+class NegativeCachingTest(unittest.TestCase):
+    """Misses are cached briefly, so rows created by other processes are found soon."""
+
+    def test_found_ids_use_the_ttl(self):
+        cache = LookupCache(ttl=60, negative_ttl=0.01)
+        cache.set_many(Group, 'name', {'admins': 1, 'editors': None})
+        time.sleep(0.02)
+        self.assertEqual(cache.get(Group, 'name', 'admins'), 1)
+        self.assertIs(cache.get(Group, 'name', 'editors'), MISSING)
+
+    def test_misses_are_cached_for_negative_ttl(self):
+        cache = LookupCache(ttl=60, negative_ttl=60)
+        cache.set(Group, 'name', 'editors', None)
+        self.assertIsNone(cache.get(Group, 'name', 'editors'))
+
+    def test_zero_negative_ttl_does_not_cache_misses(self):
+        cache = LookupCache(negative_ttl=0)
+        cache.set(Group, 'name', 'editors', None)
+        self.assertIs(cache.get(Group, 'name', 'editors'), MISSING)
+        self.assertEqual(cache.stats()['size'], 0)
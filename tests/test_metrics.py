@@ -0,0 +1,95 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from v2s_common_utils.metrics import MetricsRegistry, merge_snapshots, render_prometheus
+
+
+def dead_pid():
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+    return process.pid
+
+
+class RenderPrometheusTest(unittest.TestCase):
+
+    def test_counter_gauge_and_histogram(self):
+        registry = MetricsRegistry()
+        requests = registry.counter('app_requests_total', 'Requests handled.', ['view'])
+        registry.gauge('app_in_flight', 'Requests in flight.').set(3)
+        latency = registry.histogram('app_seconds', 'Latency.', buckets=(0.1, 1.0))
+        requests.inc(view='list')
+        requests.inc(2, view='say "hi"\n')
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5)
+        self.assertEqual(render_prometheus(registry.collect()), '\n'.join([
+            '# HELP app_in_flight Requests in flight.',
+            '# TYPE app_in_flight gauge',
+            'app_in_flight 3.0',
+            '# HELP app_requests_total Requests handled.',
+            '# TYPE app_requests_total counter',
+            'app_requests_total{view="list"} 1.0',
+            'app_requests_total{view="say \\"hi\\"\\n"} 2.0',
+            '# HELP app_seconds Latency.',
+            '# TYPE app_seconds histogram',
+            'app_seconds_bucket{le="0.1"} 1',
+            'app_seconds_bucket{le="1.0"} 2',
+            'app_seconds_bucket{le="+Inf"} 3',
+            'app_seconds_sum 5.55',
+            'app_seconds_count 3',
+        ]) + '\n')
+
+    def test_labels_must_match(self):
+        counter = MetricsRegistry().counter('app_total', 'Total.', ['view'])
+        with self.assertRaises(ValueError):
+            counter.inc(method='GET')
+
+    def test_same_name_returns_the_same_metric(self):
+        registry = MetricsRegistry()
+        self.assertIs(registry.counter('app_total', 'Total.'), registry.counter('app_total', 'Total.'))
+        with self.assertRaises(ValueError):
+            registry.gauge('app_total', 'Total.')
+
+
+class MergeSnapshotsTest(unittest.TestCase):
+
+    def snapshots(self, requests, latency_buckets, peak, in_flight):
+        registry = MetricsRegistry()
+        registry.counter('app_requests_total', 'Requests.', ['view']).inc(requests, view='list')
+        histogram = registry.histogram('app_seconds', 'Latency.', buckets=(1.0,))
+        for value, count in zip((0.5, 5.0), latency_buckets):
+            for _ in range(count):
+                histogram.observe(value)
+        registry.gauge('app_peak', 'Peak.', multiprocess_mode='max').set(peak)
+        registry.gauge('app_low', 'Low.', multiprocess_mode='min').set(peak)
+        registry.gauge('app_in_flight', 'In flight.').set(in_flight)
+        return registry.collect()
+
+    def test_merges_by_type_and_mode(self):
+        merged = merge_snapshots({
+            os.getpid(): self.snapshots(requests=2, latency_buckets=(1, 0), peak=4, in_flight=1),
+            dead_pid(): self.snapshots(requests=3, latency_buckets=(1, 2), peak=9, in_flight=7),
+        })
+        samples = {name: metric['samples'] for name, metric in merged.items()}
+        self.assertEqual(samples['app_requests_total'], [[['list'], 5]])
+        self.assertEqual(samples['app_seconds'], [[[], [[2, 2], 11.0, 4]]])
+        self.assertEqual(samples['app_peak'], [[[], 9]])
+        self.assertEqual(samples['app_low'], [[[], 4]])
+        # 'livesum' gauges of processes that have exited are left out.
+        self.assertEqual(samples['app_in_flight'], [[[], 1]])
+
+    def test_render_combines_the_shared_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            registry = MetricsRegistry()
+            registry.directory = directory
+            registry.counter('app_requests_total', 'Requests.').inc(2)
+            other = MetricsRegistry()
+            other.counter('app_requests_total', 'Requests.').inc(3)
+            with open(os.path.join(directory, f'metrics-{dead_pid()}.json'), 'w', encoding='utf-8') as f:
+                json.dump(other.collect(), f)
+            self.assertIn('app_requests_total 5.0\n', registry.render())
+            self.assertIn(f'metrics-{os.getpid()}.json', os.listdir(directory))
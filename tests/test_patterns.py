@@ -0,0 +1,23 @@
+import unittest
+
+from v2s_common_utils.patterns import PatternRegistry
+
+
+class PatternRegistryTest(unittest.TestCase):
+
+    def test_adhoc_patterns_are_bounded(self):
+        registry = PatternRegistry(adhoc_maxsize=2)
+        for i in range(10):
+            registry.compile(rf'item-{i}')
+        self.assertEqual(registry._compile_adhoc.cache_info().currsize, 2)
+
+    def test_named_patterns_are_kept(self):
+        registry = PatternRegistry(adhoc_maxsize=1)
+        digits = registry.register('digits', r'\d+')
+        for i in range(10):
+            registry.compile(rf'item-{i}')
+        self.assertIs(registry.get('digits'), digits)
+
+    def test_adhoc_patterns_are_cached(self):
+        registry = PatternRegistry()
+        self.assertIs(registry.compile(r'\w+'), registry.compile(r'\w+'))
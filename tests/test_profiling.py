@@ -0,0 +1,48 @@
+import cProfile
+import io
+import os
+import tempfile
+import unittest
+
+from django.core.management import CommandError, call_command
+
+from v2s_common_utils.profiling import prune_spool
+
+
+def write_profile(path):
+    profiler = cProfile.Profile()
+    profiler.runcall(sum, range(10))
+    profiler.dump_stats(path)
+
+
+class ProfileSpoolTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.spool = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_prune_skips_files_removed_meanwhile(self):
+        for name in ('a.prof', 'b.prof', 'c.prof'):
+            write_profile(os.path.join(self.spool, name))
+        # A file that disappears between listing and stat, as when another worker prunes it.
+        os.symlink(os.path.join(self.spool, 'gone.prof'), os.path.join(self.spool, 'vanished.prof'))
+        prune_spool(self.spool, max_files=2, max_bytes=10 ** 9)
+        self.assertEqual(len([name for name in os.listdir(self.spool) if name[0] in 'abc']), 2)
+
+    def test_report_skips_an_unreadable_first_file(self):
+        with open(os.path.join(self.spool, '1-broken.prof'), 'wb') as f:
+            f.write(b'not a profile')
+        write_profile(os.path.join(self.spool, '2-good.prof'))
+        out, err = io.StringIO(), io.StringIO()
+        call_command('v2s_profile_report', dir=self.spool, stdout=out, stderr=err)
+        self.assertIn('1 profiles from', out.getvalue())
+        self.assertIn('Skipping', err.getvalue())
+
+    def test_report_without_readable_profiles(self):
+        with open(os.path.join(self.spool, 'broken.prof'), 'wb') as f:
+            f.write(b'not a profile')
+        with self.assertRaises(CommandError):
+            call_command('v2s_profile_report', dir=self.spool, stdout=io.StringIO(), stderr=io.StringIO())
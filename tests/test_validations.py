@@ -0,0 +1,154 @@
+import threading
+import unittest
+
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from v2s_common_utils.validations import (
+    DigitsOnlyValidator,
+    EmptyValidator,
+    MinMaxLengthValidator,
+    ModelAttributeExistsValidator,
+    ModelAttributeNotExistsValidator,
+    RegexValidator,
+    StatelessValidator,
+    ValidationPlan,
+    ValidatorBase,
+    ValidatorHelper,
+    run_validator,
+)
+
+
+class AddErrorValidator(StatelessValidator):
+    """Reports through add_error() and returns None, as ValidatorBase code does."""
+
+    def validate(self, value):
+        if not value:
+            self.add_error(self.error_code, self.error_message)
+
+
+class LegacyCodeValidator(ValidatorBase):
+    """A ValidatorBase subclass, as existing custom validators are written."""
+
+    def validate(self, value):
+        if value and not str(value).isupper():
+            self.add_error('E010', 'Code must be upper case.')
+
+
+def build_validators():
+    # A fresh list per run, as the legacy ValidatorBase instances accumulate errors.
+    return [
+        ModelAttributeExistsValidator('name', Group, 'name', 'E003', 'Group already exists.'),
+        EmptyValidator('name', error_code='E001', error_message='Name is required.'),
+        MinMaxLengthValidator('name', min_length=3, max_length=5, error_code='E002', error_message='Length.'),
+        DigitsOnlyValidator('phone', error_code='E006', error_message='Digits only.'),
+        MinMaxLengthValidator('phone', min_length=10, max_length=10, error_code='E007', error_message='Ten digits.'),
+        LegacyCodeValidator('code'),
+    ]
+
+
+def as_sorted(errors_list):
+    return sorted((error['error_code'], error['error_message']) for error in errors_list)
+
+
+class ValidationPlanOutputTest(unittest.TestCase):
+    """A compiled plan returns what the validate_and_collect_errors loop returns."""
+
+    PAYLOADS = [
+        {'name': 'admins', 'phone': '98765', 'code': 'abc'},
+        {'name': '', 'phone': 'abc', 'code': 'ABC'},
+        {'name': 'ops', 'phone': '9876543210', 'code': 'OPS'},
+        {'name': 'admin', 'phone': '', 'code': ''},
+    ]
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', verbosity=0)
+        Group.objects.get_or_create(name='admins')
+        Group.objects.get_or_create(name='admin')
+
+    def test_errors_match_the_legacy_path(self):
+        for data in self.PAYLOADS:
+            with self.subTest(data=data):
+                legacy = ValidatorHelper.convert_errors_set_to_list(
+                    ValidatorHelper.validate_and_collect_errors(data, build_validators()))
+                plan = ValidatorHelper.compile(build_validators())
+                self.assertEqual(as_sorted(plan.errors(data)), as_sorted(legacy))
+
+    def test_fail_fast_stops_each_field_at_its_first_failure(self):
+        plan = ValidatorHelper.compile(build_validators())
+        data = {'name': 'admins', 'phone': 'abc', 'code': 'abc'}
+        # Pure checks run before the database validator, in their listed order.
+        self.assertEqual(as_sorted(plan.errors(data, fail_fast=True)),
+                         [('E002', 'Length.'), ('E006', 'Digits only.'), ('E010', 'Code must be upper case.')])
+        self.assertEqual(as_sorted(plan.errors(data)), [
+            ('E002', 'Length.'), ('E003', 'Group already exists.'), ('E006', 'Digits only.'),
+            ('E007', 'Ten digits.'), ('E010', 'Code must be upper case.'),
+        ])
+
+    def test_fail_fast_skips_database_checks_of_failed_fields(self):
+        plan = ValidatorHelper.compile([
+            ModelAttributeExistsValidator('name', Group, 'name', 'E003', 'Group already exists.'),
+            EmptyValidator('name', error_code='E001', error_message='Name is required.'),
+        ])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(plan.errors({'name': ''}, fail_fast=True),
+                             [{'error_code': 'E001', 'error_message': 'Name is required.'}])
+        self.assertEqual(len(queries), 0)
+
+
+class ErrorsAttributeCompatibilityTest(unittest.TestCase):
+    """Built-in validators still expose .errors after validate(), as ValidatorBase did."""
+
+    @classmethod
+    def setUpClass(cls):
+        call_command('migrate', verbosity=0)
+        Group.objects.get_or_create(name='admins')
+
+    def test_errors_after_validate(self):
+        validator = EmptyValidator('name', error_code='E001', error_message='Name is required.')
+        validator.validate('')
+        self.assertEqual(validator.errors, [{'error_code': 'E001', 'error_message': 'Name is required.'}])
+
+    def test_no_errors_for_a_valid_value(self):
+        validator = MinMaxLengthValidator('name', min_length=2, max_length=5, error_code='E002', error_message='Length.')
+        validator.validate('abc')
+        self.assertEqual(validator.errors, [])
+
+    def test_errors_before_validate(self):
+        self.assertEqual(RegexValidator('email', validation_method='validate_email').errors, [])
+
+    def test_database_validators(self):
+        exists = ModelAttributeExistsValidator('name', Group, 'name', 'E003', 'Group already exists.')
+        not_exists = ModelAttributeNotExistsValidator('name', Group, 'name', 'E004', 'No such group.')
+        exists.validate('admins')
+        not_exists.validate('editors')
+        self.assertEqual(exists.errors, [{'error_code': 'E003', 'error_message': 'Group already exists.'}])
+        self.assertEqual(not_exists.errors, [{'error_code': 'E004', 'error_message': 'No such group.'}])
+
+    def test_errors_are_kept_per_thread(self):
+        validator = EmptyValidator('name', error_code='E001', error_message='Name is required.')
+        validator.validate('')
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append((validator.validate('x'), validator.errors)))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [([], [])])
+        self.assertEqual(len(validator.errors), 1)
+
+    def test_return_value_matches_plan(self):
+        validator = EmptyValidator('name', error_code='E001', error_message='Name is required.')
+        plan = ValidationPlan([validator])
+        self.assertEqual(plan.run({'name': ''}), {('E001', 'Name is required.')})
+        self.assertEqual(validator.validate(''), validator.errors)
+
+    def test_add_error_without_return_value(self):
+        validator = AddErrorValidator('name', error_code='E005', error_message='Name is required.')
+        expected = [{'error_code': 'E005', 'error_message': 'Name is required.'}]
+        self.assertEqual(validator.validate(''), expected)
+        self.assertEqual(validator.errors, expected)
+        self.assertEqual(run_validator(validator, ''), expected)
+        self.assertEqual(run_validator(validator, 'x'), [])
+        self.assertEqual(validator.errors, [])
@@ -0,0 +1,28 @@
+import unittest
+from unittest import mock
+
+from django.apps import apps
+from django.conf import settings
+from django.test import override_settings
+
+from v2s_common_utils import warmup
+
+
+class StartupWarmupTest(unittest.TestCase):
+    """The warm-up is opt-in: without V2S_WARMUP, ready() does no work."""
+
+    def ready_runs(self):
+        # _skipped_command is patched so the result does not depend on how the tests are run.
+        with mock.patch.object(warmup, '_skipped_command', return_value=False), \
+                mock.patch.object(warmup.WARMUP, 'run', return_value=[]) as run:
+            apps.get_app_config('v2s_common_utils').ready()
+        return run.called
+
+    def test_ready_does_nothing_without_configuration(self):
+        with override_settings():
+            del settings.V2S_WARMUP
+            self.assertFalse(self.ready_runs())
+
+    def test_ready_runs_when_enabled(self):
+        with override_settings(V2S_WARMUP={'ENABLED': True}):
+            self.assertTrue(self.ready_runs())
@@ -0,0 +1,20 @@
+# Submodules are imported on first attribute access, so `import v2s_common_utils` stays
+# cheap and `v2s_common_utils.message` does not load Django REST framework or drf-yasg.
+_SUBMODULES = frozenset({
+    'base_service', 'coercion', 'concurrency', 'constants', 'custom_validations',
+    'decorators', 'errors', 'exceptions', 'identifiers', 'logger', 'lookup_cache',
+    'message', 'metrics', 'pagination', 'patterns', 'profiling', 'schema_cache',
+    'swagger', 'timing', 'utils', 'validation_schema', 'validations', 'warmup',
+})
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        from importlib import import_module
+
+        return import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
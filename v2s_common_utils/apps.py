@@ -0,0 +1,44 @@
+from django.apps import AppConfig
+
+
+class V2SCommonUtilsConfig(AppConfig):
+    """
+    App config that can warm the package's caches when Django starts.
+
+    When V2S_WARMUP['ENABLED'] is set, ready() runs the warm-up registry in
+    v2s_common_utils.warmup: the validator patterns, the error catalog, the OpenAPI schema
+    and any registered callables are built before the first request instead of during
+    it. Each step's duration is logged, and startup waits at most V2S_WARMUP['TIMEOUT']
+    seconds. The warm-up is off by default, so Celery workers, scripts and management
+    commands start without it; enable it only in the settings of the web processes.
+
+    Register your own steps from your app's ready(), and list 'v2s_common_utils' after
+    your apps in INSTALLED_APPS so they are registered when the warm-up runs. Steps named
+    in V2S_WARMUP['CALLABLES'] are found by dotted path and do not depend on the order.
+    With gunicorn --preload the warm-up runs once in the master and the workers inherit
+    the built caches.
+
+    Example:
+        INSTALLED_APPS = [..., 'users', 'v2s_common_utils']
+
+        V2S_WARMUP = {
+            'ENABLED': True,
+            'TIMEOUT': 10,
+            'CALLABLES': ['users.warmup.load_country_ids'],
+        }
+
+        # users/apps.py
+        def ready(self):
+            from v2s_common_utils.warmup import register_warmup
+            from users.schemas import VALIDATION_SCHEMAS
+
+            register_warmup('validation_schemas', VALIDATION_SCHEMAS.load)
+    """
+
+    name = 'v2s_common_utils'
+    verbose_name = 'V2S common utils'
+
+    def ready(self):
+        from v2s_common_utils.warmup import run_startup_warmup
+
+        run_startup_warmup()
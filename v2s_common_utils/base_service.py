@@ -3,6 +3,16 @@ from django.db.models import Model
 
 from rest_framework.serializers import ValidationError
 
+from v2s_common_utils.metrics import SERVICE_DURATION
+from v2s_common_utils.timing import timed
+
+
+def _instrumented(operation):
+    """Times a service operation in the request timings and the service duration histogram."""
+    def decorator(func):
+        return SERVICE_DURATION.time(operation=operation)(timed(f'service.{operation}')(func))
+    return decorator
+
 
 class BaseService:
     # @staticmethod
@@ -35,6 +45,7 @@ class BaseService:
     #     return BaseService.get_object(model, **kwargs)
 
     @staticmethod
+    @_instrumented('get_object')
     def get_object(model, **kwargs):
         """
         Get an object from the database based on the provided model and filter criteria.
@@ -52,6 +63,7 @@ class BaseService:
             return None
 
     @staticmethod
+    @_instrumented('get_object_by_id')
     def get_object_by_id(model, pk=None, is_deleted=False, **kwargs):
         """
         Get an object by its primary key with an optional filter for 'is_deleted'.
@@ -73,6 +85,7 @@ class BaseService:
         return BaseService.get_object(model, **kwargs)
 
     @staticmethod
+    @_instrumented('get_all')
     def get_all(model: Model, ordering=None, **kwargs):
         """
         Get all objects of a given model from the database.
@@ -95,6 +108,7 @@ class BaseService:
         return queryset
 
     @staticmethod
+    @_instrumented('list_all')
     def list_all(model_class, serializer_class, ordering=None, **kwargs):
         """
         List all objects of a given model from the database, serialized as JSON.
@@ -112,9 +126,11 @@ class BaseService:
         queryset = BaseService.get_all(
             model_class, ordering=ordering, **kwargs)
         serializer = serializer_class(queryset, many=True)
-        return serializer.data
+        with timed('serializer'):
+            return serializer.data
 
     @staticmethod
+    @_instrumented('create')
     def create(serializer_class, model_class, data):
         """
         Create a new object of a given model in the database, using data provided in JSON format.
@@ -130,11 +146,13 @@ class BaseService:
         serializer = serializer_class(data=data)
         if serializer.is_valid():
             serializer.save()
-            return serializer.data
+            with timed('serializer'):
+                return serializer.data
         else:
             raise ValidationError(serializer.errors)
 
     @staticmethod
+    @_instrumented('list_details')
     def list_details(object, serializer_class, **kwargs):
         """
         Serialize a single object of a given model to JSON.
@@ -148,9 +166,11 @@ class BaseService:
             A dictionary representing the object in serialized JSON format.
         """
         serializer = serializer_class(object)
-        return serializer.data
+        with timed('serializer'):
+            return serializer.data
 
     @staticmethod
+    @_instrumented('update')
     def update(object, serializer_class, data, partial=False):
         """
         Helper method for updating an existing database object with new data.
@@ -169,11 +189,13 @@ class BaseService:
         serializer = serializer_class(object, data=data, partial=partial)
         if serializer.is_valid():
             serializer.save()
-            return serializer.data
+            with timed('serializer'):
+                return serializer.data
         else:
             raise ValidationError(serializer.errors)
 
     @staticmethod
+    @_instrumented('delete')
     def delete(object):
         """
         Helper method for soft-deleting a database object.
@@ -189,6 +211,7 @@ class BaseService:
         return True
 
     @staticmethod
+    @_instrumented('deactivate_object')
     def deactivate_object(obj):
         """
         Deactivates a database object by setting its 'is_active' attribute to False.
@@ -204,6 +227,7 @@ class BaseService:
         return True
 
     @staticmethod
+    @_instrumented('delete_permanently')
     def delete_permanently(object):
         """
         Helper method for soft-deleting a database object.
@@ -218,6 +242,7 @@ class BaseService:
         return True
 
     @staticmethod
+    @_instrumented('validate_data')
     def validate_data(serializer_class, data, partial=False):
         """
         Validate the provided data using the specified serializer class.
@@ -242,6 +267,7 @@ class BaseService:
 class AbstractBaseService:
 
     @staticmethod
+    @_instrumented('create')
     def create(serializer_class, model_class, data):
         """
         Create a new object of a given model in the database, using data provided in JSON format.
@@ -262,6 +288,7 @@ class AbstractBaseService:
             raise ValidationError(serializer.errors)
 
     @staticmethod
+    @_instrumented('update')
     def update(object, serializer_class, data, partial=False):
         """
         Helper method for updating an existing database object with new data.
@@ -280,11 +307,13 @@ class AbstractBaseService:
         serializer = serializer_class(object, data=data, partial=partial)
         if serializer.is_valid():
             serializer.save()
-            return serializer.data
+            with timed('serializer'):
+                return serializer.data
         else:
             raise ValidationError(serializer.errors)
 
     @staticmethod
+    @_instrumented('delete')
     def delete(object):
         """
         Helper method for soft-deleting a database object.
@@ -0,0 +1,216 @@
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from uuid import UUID
+
+
+TRUE_STRINGS = frozenset({'true', 't', 'yes', 'y', 'on', '1'})
+FALSE_STRINGS = frozenset({'false', 'f', 'no', 'n', 'off', '0', ''})
+
+
+def to_int(value):
+    """Converts a value to int. Floats with a fractional part are rejected instead of truncated."""
+    if type(value) is int:
+        return value
+    if isinstance(value, float):
+        if not value.is_integer():
+            raise ValueError(f"{value!r} is not a whole number.")
+    return int(value)
+
+
+def to_float(value):
+    """Converts a value to float."""
+    if type(value) is float:
+        return value
+    return float(value)
+
+
+def to_decimal(value):
+    """Converts a value to Decimal. Floats go through str() so 0.1 stays Decimal('0.1')."""
+    if type(value) is Decimal:
+        return value
+    if isinstance(value, float):
+        value = str(value)
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValueError(f"{value!r} is not a valid decimal.")
+
+
+def to_bool(value):
+    """Converts a value to bool, accepting the usual true/false strings and 0/1."""
+    if type(value) is bool:
+        return value
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in TRUE_STRINGS:
+            return True
+        if lowered in FALSE_STRINGS:
+            return False
+    elif value in (0, 1):
+        return bool(value)
+    raise ValueError(f"{value!r} is not a valid boolean.")
+
+
+def to_uuid(value):
+    """Converts a value to UUID."""
+    if type(value) is UUID:
+        return value
+    return UUID(str(value))
+
+
+def datetime_converter(fmt=None):
+    """
+    Builds a datetime converter.
+
+    Args:
+        fmt (str, optional): A strptime format. If None, ISO 8601 strings are accepted.
+
+    Returns:
+        function: A converter that passes datetime objects through and parses strings.
+    """
+    def to_datetime(value):
+        if isinstance(value, datetime):
+            return value
+        if fmt is None:
+            return datetime.fromisoformat(value)
+        return datetime.strptime(value, fmt)
+    return to_datetime
+
+
+to_datetime = datetime_converter()
+
+
+CONVERTERS = {
+    int: to_int,
+    float: to_float,
+    Decimal: to_decimal,
+    bool: to_bool,
+    datetime: to_datetime,
+    UUID: to_uuid,
+    'int': to_int,
+    'float': to_float,
+    'decimal': to_decimal,
+    'bool': to_bool,
+    'datetime': to_datetime,
+    'uuid': to_uuid,
+}
+
+
+def get_converter(spec):
+    """
+    Resolves a converter spec to a callable.
+
+    Args:
+        spec: A type or name registered in CONVERTERS, or any callable taking one value.
+
+    Returns:
+        function: The converter.
+
+    Raises:
+        ValueError: If the spec is neither registered nor callable.
+    """
+    try:
+        return CONVERTERS[spec]
+    except (KeyError, TypeError):
+        pass
+    if callable(spec):
+        return spec
+    raise ValueError(f"Unknown converter: {spec!r}")
+
+
+class CoercionSchema:
+    """
+    Compiled mapping of field names to converters for coercing many records at once.
+
+    Converters are resolved once when the schema is built. Fields missing from a record
+    are skipped, and None values are left untouched unless skip_none is False. A value
+    that fails to convert is left as it was and reported, and the rest of the batch is
+    still coerced.
+
+    Args:
+        fields (dict): A mapping of field name to converter spec (see get_converter).
+        skip_none (bool, optional): If True, None values are not converted. Default is True.
+
+    Methods:
+        coerce_record(record): Coerces one dict in place and returns its errors.
+        coerce_records(records): Coerces a list of dicts in place.
+        coerce_columns(columns): Coerces a dict of field name to list of values in place.
+
+    Example:
+        ORDER_SCHEMA = CoercionSchema({'quantity': int, 'price': Decimal, 'is_paid': bool})
+        records, errors = ORDER_SCHEMA.coerce_records(rows)
+        # errors == {3: {'price': "'abc' is not a valid decimal."}}
+    """
+
+    def __init__(self, fields, skip_none=True):
+        self.fields = tuple((name, get_converter(spec)) for name, spec in fields.items())
+        self.skip_none = skip_none
+
+    def coerce_record(self, record):
+        """
+        Coerces the fields of one record in place.
+
+        Args:
+            record (dict): The record to coerce.
+
+        Returns:
+            dict: A mapping of field name to error message. Empty if every field converted.
+        """
+        errors = {}
+        skip_none = self.skip_none
+        for name, converter in self.fields:
+            if name not in record:
+                continue
+            value = record[name]
+            if value is None and skip_none:
+                continue
+            try:
+                record[name] = converter(value)
+            except (TypeError, ValueError, ArithmeticError) as e:
+                errors[name] = str(e)
+        return errors
+
+    def coerce_records(self, records):
+        """
+        Coerces a list of records in place.
+
+        Args:
+            records (list): A list of dicts.
+
+        Returns:
+            tuple: The records and a dict mapping row index to that row's field errors.
+                Rows without errors are omitted.
+        """
+        errors = {}
+        coerce_record = self.coerce_record
+        for index, record in enumerate(records):
+            row_errors = coerce_record(record)
+            if row_errors:
+                errors[index] = row_errors
+        return records, errors
+
+    def coerce_columns(self, columns):
+        """
+        Coerces a column-oriented batch in place.
+
+        Args:
+            columns (dict): A mapping of field name to a list of values, one per row.
+
+        Returns:
+            tuple: The columns and a dict mapping row index to that row's field errors.
+                Rows without errors are omitted.
+        """
+        errors = {}
+        skip_none = self.skip_none
+        for name, converter in self.fields:
+            column = columns.get(name)
+            if column is None:
+                continue
+            for index, value in enumerate(column):
+                if value is None and skip_none:
+                    continue
+                try:
+                    column[index] = converter(value)
+                except (TypeError, ValueError, ArithmeticError) as e:
+                    errors.setdefault(index, {})[name] = str(e)
+        return columns, errors
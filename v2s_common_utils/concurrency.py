@@ -0,0 +1,284 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+
+class OverloadError(Exception):
+    """
+    Raised when work is rejected because a bounded pool or limiter is saturated.
+
+    Args:
+        message (str): Description of why the work was rejected.
+        reason (str): 'queue_full' or 'queue_timeout'.
+    """
+
+    def __init__(self, message, reason):
+        self.reason = reason
+        super().__init__(message)
+
+
+class BoundedExecutor:
+    """
+    Thread pool with a bounded queue and a queue timeout, for CPU-heavy calls.
+
+    At most max_workers calls run at once and at most max_queue wait for a worker.
+    A call is rejected with OverloadError straight away when the queue is full, or
+    when it has waited longer than queue_timeout seconds without starting. Under a
+    burst, callers get a quick, clean error instead of piling up behind each other.
+
+    Threads are enough for password hashing: hashlib's PBKDF2 and most other hashers
+    release the GIL while they run.
+
+    Args:
+        max_workers (int, optional): The number of calls that may run at once. Default is 2.
+        max_queue (int, optional): The number of calls that may wait for a worker. Default is 16.
+        queue_timeout (float, optional): Seconds a call may wait before it is rejected. Default is 2.0.
+        name (str, optional): Prefix for the worker thread names.
+
+    Methods:
+        call(fn, *args, **kwargs): Runs fn on the pool, waits for it and returns its result.
+        stats(): Returns a dict of queue-depth and outcome counters.
+        shutdown(wait=True): Stops the worker threads.
+
+    Example:
+        PASSWORD_POOL = BoundedExecutor(max_workers=4, max_queue=32, queue_timeout=1.5, name='auth')
+        user = PASSWORD_POOL.call(authenticate, username=username, password=password)
+    """
+
+    def __init__(self, max_workers=2, max_queue=16, queue_timeout=2.0, name='v2s-bounded'):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    def _run(self, enqueued_at, fn, args, kwargs):
+        with self._lock:
+            self._queued -= 1
+            if time.monotonic() - enqueued_at > self.queue_timeout:
+                # The caller has already given up on this call.
+                self._timed_out += 1
+                raise OverloadError("Timed out waiting for a worker.", 'queue_timeout')
+            self._running += 1
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+        with self._lock:
+            self._completed += 1
+        return result
+
+    def _release(self, future):
+        self._slots.release()
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Runs fn(*args, **kwargs) on the pool and returns its result.
+
+        Raises:
+            OverloadError: If the queue is full, or the call did not start within queue_timeout.
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise OverloadError("Too many calls waiting for a worker.", 'queue_full')
+        with self._lock:
+            self._queued += 1
+        future = self._executor.submit(self._run, time.monotonic(), fn, args, kwargs)
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self.queue_timeout)
+        except FutureTimeoutError:
+            if future.cancel():
+                with self._lock:
+                    self._queued -= 1
+                    self._timed_out += 1
+                raise OverloadError("Timed out waiting for a worker.", 'queue_timeout')
+            # The call has started, so let it finish.
+            return future.result()
+
+    def stats(self):
+        """
+        Returns a snapshot of the pool's counters.
+
+        Returns:
+            dict: max_workers, max_queue, queued, running, completed, failed, rejected
+                (queue full) and timed_out (queue timeout).
+        """
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'queued': self._queued,
+                'running': self._running,
+                'completed': self._completed,
+                'failed': self._failed,
+                'rejected': self._rejected,
+                'timed_out': self._timed_out,
+            }
+
+    def shutdown(self, wait=True):
+        """Stops the worker threads and cancels calls that have not started."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _set_granted(future):
+    if not future.done():
+        future.set_result(True)
+
+
+class _Waiter:
+    __slots__ = ('granted', 'event', 'loop', 'future')
+
+    def __init__(self, loop=None, future=None):
+        self.granted = False
+        self.event = threading.Event() if future is None else None
+        self.loop = loop
+        self.future = future
+
+    def grant(self):
+        """Hands a slot to this waiter. Returns False if its event loop is gone."""
+        if self.future is not None:
+            try:
+                self.loop.call_soon_threadsafe(_set_granted, self.future)
+            except RuntimeError:
+                return False
+        else:
+            self.event.set()
+        self.granted = True
+        return True
+
+
+class ConcurrencyLimiter:
+    """
+    Caps the number of concurrent executions, with a bounded FIFO wait queue.
+
+    Sync and async callers share one limit and one queue. A released slot is handed
+    straight to the oldest waiter, so waiters are served in arrival order. The limiter
+    does not bind to an event loop, so it can be created at import time and used from
+    threads and from any loop.
+
+    Args:
+        max_in_flight (int): The number of executions allowed at once.
+        max_wait (float, optional): Seconds a caller may wait for a slot. Default is 1.0.
+        max_queue (int, optional): The number of callers that may wait. None means no limit.
+
+    Methods:
+        acquire(timeout=None): Waits for a slot. Returns False if none was free in time.
+        acquire_async(timeout=None): Async variant of acquire().
+        release(): Frees a slot.
+        stats(): Returns in-flight, waiting, admitted and rejected counters.
+
+    Example:
+        REPORT_LIMITER = ConcurrencyLimiter(max_in_flight=4, max_wait=2.0)
+        if not REPORT_LIMITER.acquire():
+            raise OverloadError("Report generation is saturated.", 'queue_timeout')
+        try:
+            build_report()
+        finally:
+            REPORT_LIMITER.release()
+    """
+
+    def __init__(self, max_in_flight, max_wait=1.0, max_queue=None):
+        self.max_in_flight = max_in_flight
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._waiters = deque()
+        self._in_flight = 0
+        self._admitted = 0
+        self._rejected = 0
+
+    def _try_enter(self, waiter_factory):
+        """Takes a free slot or queues a waiter. Returns (admitted, waiter). Caller holds the lock."""
+        if self._in_flight < self.max_in_flight and not self._waiters:
+            self._in_flight += 1
+            self._admitted += 1
+            return True, None
+        if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            self._rejected += 1
+            return False, None
+        waiter = waiter_factory()
+        self._waiters.append(waiter)
+        return False, waiter
+
+    def _give_up(self, waiter):
+        """Removes a waiter that stopped waiting. Returns True if it was granted a slot meanwhile."""
+        with self._lock:
+            if waiter.granted:
+                self._admitted += 1
+                return True
+            self._waiters.remove(waiter)
+            self._rejected += 1
+            return False
+
+    def acquire(self, timeout=None):
+        """
+        Waits for a slot.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to max_wait.
+
+        Returns:
+            bool: True if a slot was acquired, False if the caller was shed.
+        """
+        with self._lock:
+            admitted, waiter = self._try_enter(_Waiter)
+        if waiter is None:
+            return admitted
+        waiter.event.wait(self.max_wait if timeout is None else timeout)
+        return self._give_up(waiter)
+
+    async def acquire_async(self, timeout=None):
+        """Async variant of acquire(). The event loop is not blocked while waiting."""
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            admitted, waiter = self._try_enter(lambda: _Waiter(loop, loop.create_future()))
+        if waiter is None:
+            return admitted
+        try:
+            await asyncio.wait({waiter.future}, timeout=self.max_wait if timeout is None else timeout)
+        except asyncio.CancelledError:
+            if self._give_up(waiter):
+                self.release()
+            raise
+        return self._give_up(waiter)
+
+    def release(self):
+        """Frees a slot, handing it to the oldest waiter if there is one."""
+        with self._lock:
+            while self._waiters:
+                if self._waiters.popleft().grant():
+                    return
+            self._in_flight -= 1
+
+    def stats(self):
+        """
+        Returns a snapshot of the limiter's counters.
+
+        Returns:
+            dict: max_in_flight, in_flight, waiting, admitted and rejected.
+        """
+        with self._lock:
+            return {
+                'max_in_flight': self.max_in_flight,
+                'in_flight': self._in_flight,
+                'waiting': len(self._waiters),
+                'admitted': self._admitted,
+                'rejected': self._rejected,
+            }
@@ -3,12 +3,20 @@ from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework import status
 
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Mapping
 from functools import wraps
-from traceback import print_exc
+from traceback import walk_tb
 
 from v2s_common_utils.message import STATUS_MESSAGES
 from v2s_common_utils.utils import generate_response,generate_error_response
 from v2s_common_utils.exceptions import CustomValidationException
+from v2s_common_utils.concurrency import ConcurrencyLimiter, OverloadError
+from v2s_common_utils.metrics import HANDLED_EXCEPTIONS
+from v2s_common_utils.timing import timed
 
 
 # def validate_object_id(pk, id_name):
@@ -17,65 +25,297 @@ from v2s_common_utils.exceptions import CustomValidationException
 #     return None
 
 
+logger = logging.getLogger(__name__)
+
+# Exception type -> handler, as registered, and the per-type resolution cache.
+_exception_handlers = {}
+_resolved_handlers = {}
+
+
+def register_exception_handler(*exception_types):
+    """
+    A decorator that registers a function as the handler for the given exception types.
+
+    handle_exception picks the handler registered for the closest class in the
+    exception's MRO, so a handler for a base class also covers its subclasses unless a
+    subclass has its own handler. Registering a handler replaces any previous handler
+    for the same type.
+
+    Args:
+        *exception_types: The exception classes the handler is responsible for.
+
+    Example:
+        @register_exception_handler(PermissionDenied)
+        def handle_permission_denied(exception):
+            return generate_response(status=status.HTTP_403_FORBIDDEN, message=STATUS_MESSAGES.get(403))
+    """
+    def decorator(handler):
+        for exception_type in exception_types:
+            _exception_handlers[exception_type] = handler
+        _resolved_handlers.clear()
+        return handler
+    return decorator
+
+
+def _resolve_handler(exception_type):
+    """Returns the handler for an exception type, walking its MRO once and caching the result."""
+    try:
+        return _resolved_handlers[exception_type]
+    except KeyError:
+        pass
+    handler = _handle_unknown_exception
+    for klass in exception_type.__mro__:
+        if klass in _exception_handlers:
+            handler = _exception_handlers[klass]
+            break
+    _resolved_handlers[exception_type] = handler
+    return handler
+
+
+@timed('handle_exception')
 def handle_exception(exception):
     """
     A helper function to handle different types of exceptions and return an appropriate response.
 
+    The response is built by the handler registered for the exception's type (see
+    register_exception_handler). Unknown exceptions are reported through
+    unknown_exception_reporter and answered with a 500 response. Every call is counted in
+    the v2s_handled_exceptions_total metric by exception type and status code.
+
     Args:
         exception: An exception object that needs to be handled.
 
     Returns:
         A Response object with an appropriate error message and status code.
     """
-    if isinstance(exception, ValidationError) or isinstance(exception, NotFound):
-        message = exception.detail
-        return generate_response(status=status.HTTP_400_BAD_REQUEST, message=message)
-    if isinstance(exception, CustomValidationException):
-        errors = exception.error_list
-        return generate_error_response(status=status.HTTP_200_OK, errors=errors)
-    elif isinstance(exception, FileNotFoundError) or isinstance(exception, ValueError):
-    # elif isinstance(exception, CustomException) or isinstance(exception, FileNotFoundError) or isinstance(exception, ValueError):
-        message = str(exception)
-        return generate_response(status=status.HTTP_400_BAD_REQUEST, message=message)
-    elif isinstance(exception, CustomException):
-        # Handle CustomException by extracting the error code and message
-        error_response = {
-            "error_code": exception.error_code,
-            "error_message": exception.error_message
-        }
-        return Response(error_response, status=status.HTTP_400_BAD_REQUEST)  # Set appropriate HTTP status code
+    response = _resolve_handler(type(exception))(exception)
+    HANDLED_EXCEPTIONS.inc(exception=type(exception).__name__, status=getattr(response, 'status_code', ''))
+    return response
+
+
+class UnknownExceptionReporter:
+    """
+    Rate-limited, deduplicated logging of unexpected exceptions.
+
+    Exceptions are grouped by a signature made of their type and the file and line of
+    every traceback frame. A signature is logged with its traceback at most once per
+    window, and at most max_per_window tracebacks are logged per window in total, so an
+    error storm (for example a database outage) costs a counter increment per error
+    instead of a synchronous traceback write. The next log line for a signature says
+    how many occurrences were suppressed. Counts per exception type are always kept.
+
+    Args:
+        window (float, optional): Length of the rate-limit window in seconds. Default is 60.
+        max_per_window (int, optional): Tracebacks logged per window across all signatures. Default is 10.
 
+    Methods:
+        report(exception): Counts the exception and logs it if the rate limit allows.
+        counters(): Returns the number of reported exceptions per type name.
+    """
+
+    def __init__(self, window=60.0, max_per_window=10):
+        self.window = window
+        self.max_per_window = max_per_window
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._suppressed = {}
+        self._last_logged = {}
+        self._window_start = 0.0
+        self._logged_in_window = 0
+
+    @staticmethod
+    def signature(exception):
+        """Returns a hashable signature of the exception type and its traceback frames."""
+        frames = tuple((frame.f_code.co_filename, lineno) for frame, lineno in walk_tb(exception.__traceback__))
+        return type(exception), frames
+
+    def report(self, exception):
+        """Counts the exception and logs its traceback if the rate limit allows."""
+        type_name = type(exception).__qualname__
+        signature = self.signature(exception)
+        now = time.monotonic()
+        with self._lock:
+            self._counters[type_name] = self._counters.get(type_name, 0) + 1
+            if now - self._window_start >= self.window:
+                self._window_start = now
+                self._logged_in_window = 0
+            last_logged = self._last_logged.get(signature)
+            if (last_logged is not None and now - last_logged < self.window) or \
+                    self._logged_in_window >= self.max_per_window:
+                self._suppressed[signature] = self._suppressed.get(signature, 0) + 1
+                return
+            self._last_logged[signature] = now
+            self._logged_in_window += 1
+            suppressed = self._suppressed.pop(signature, 0)
+
+        if suppressed:
+            logger.error("Unhandled %s: %s (%d similar errors suppressed)", type_name, exception, suppressed,
+                         exc_info=exception)
+        else:
+            logger.error("Unhandled %s: %s", type_name, exception, exc_info=exception)
+
+    def counters(self):
+        """Returns a copy of the number of reported exceptions per type name."""
+        with self._lock:
+            return dict(self._counters)
+
+
+unknown_exception_reporter = UnknownExceptionReporter()
+
+
+def _handle_unknown_exception(exception):
+    unknown_exception_reporter.report(exception)
+    message = STATUS_MESSAGES.get(500)
+    return generate_response(status=status.HTTP_500_INTERNAL_SERVER_ERROR, message=message)
+
+
+# Request attribute holding the payload for each supported method.
+_REQUIRED_KEYS_SOURCES = {
+    'GET': 'query_params',
+    'POST': 'data',
+    'PUT': 'data',
+    'PATCH': 'data',
+}
+
+
+def _missing_keys_response(request, keys):
+    """Returns a 400 response naming every missing key, or None if all keys are present."""
+    source = _REQUIRED_KEYS_SOURCES.get(request.method)
+    if source is None:
+        return generate_response(status=status.HTTP_400_BAD_REQUEST, message='Invalid request method')
+    data = getattr(request, source)
+    if isinstance(data, Mapping):
+        get = data.get
+        missing = [key for key in keys if get(key) is None]
+    else:
+        # A JSON list or scalar body has none of the keys.
+        missing = list(keys)
+    if not missing:
+        return None
+    if len(missing) == 1:
+        message = f"'{missing[0]}' is required and cannot be None."
     else:
-        print_exc()
-        message = STATUS_MESSAGES.get(500)
-        return generate_response(status=status.HTTP_500_INTERNAL_SERVER_ERROR, message=message)
+        message = f"{', '.join(repr(key) for key in missing)} are required and cannot be None."
+    return generate_response(status=status.HTTP_400_BAD_REQUEST, message=message)
 
 
 def check_required_keys(keys):
     """
     A decorator that checks if the specified keys are present in the request query parameters or request data and not None.
+
+    GET requests are checked against the query parameters, and POST, PUT and PATCH
+    requests against the request data. All missing keys are reported in one
+    response. The key list is fixed when the view is decorated, and async views are
+    checked inline without a sync_to_async hop.
+
+    Args:
+        keys (list): The keys that must be present.
+
+    Example:
+        @check_required_keys(['name', 'email'])
+        def post(self, request):
+            ...
     """
+    keys = tuple(keys)
 
     def decorator(view_func):
-        @ wraps(view_func)
+        if inspect.iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(*args, **kwargs):
+                response = _missing_keys_response(args[1], keys)
+                if response is not None:
+                    return response
+                return await view_func(*args, **kwargs)
+            return async_wrapper
+
+        @wraps(view_func)
         def wrapper(*args, **kwargs):
-            request = args[1]
-            if request.method == 'GET':
-                data = request.query_params
-            elif request.method in ['POST', 'PUT']:
-                data = request.data
-            else:
-                return generate_response(status=status.HTTP_400_BAD_REQUEST, message='Invalid request method')
-
-            for key in keys:
-                if key not in data or data[key] is None:
-                    return generate_response(status=status.HTTP_400_BAD_REQUEST, message=f"'{key}' is required and cannot be None.")
-
+            response = _missing_keys_response(args[1], keys)
+            if response is not None:
+                return response
             return view_func(*args, **kwargs)
         return wrapper
     return decorator
 
 
+def _shed_response():
+    response = generate_response(status=status.HTTP_503_SERVICE_UNAVAILABLE, message=STATUS_MESSAGES.get(503))
+    response['Retry-After'] = '1'
+    return response
+
+
+def limit_concurrency(max_in_flight, max_wait=1.0, max_queue=None, key=None):
+    """
+    A decorator that caps the number of in-flight executions of a view and sheds the excess.
+
+    Requests beyond max_in_flight wait in a FIFO queue for up to max_wait seconds. A
+    request that is still waiting at its deadline, or that finds max_queue requests
+    already waiting, gets a 503 response with a Retry-After header instead of running.
+    Expensive endpoints then degrade alone instead of exhausting the database pool.
+    Async views wait without blocking the event loop.
+
+    Args:
+        max_in_flight (int): The number of executions allowed at once (per key).
+        max_wait (float, optional): Seconds a request may wait for a slot. Default is 1.0.
+        max_queue (int, optional): The number of requests that may wait (per key). None means no limit.
+        key (callable, optional): Called with the request to get a limit key, such as the
+            tenant ID, so each key gets its own limit. Keys should have a small, bounded
+            number of values. Default is one limit for the view.
+
+    The wrapped view gets a stats() function that returns the in-flight, waiting,
+    admitted and rejected counters of each key (None when no key function is used).
+
+    Example:
+        @limit_concurrency(8, max_wait=2.0)
+        def get(self, request):
+            return generate_response(status=status.HTTP_200_OK, message=..., data=BaseService.list_all(...))
+
+        # Later: MyView.get.stats() -> {None: {'in_flight': 8, 'waiting': 3, 'rejected': 41, ...}}
+    """
+    limiters = {}
+    limiters_lock = threading.Lock()
+
+    def get_limiter(request):
+        limit_key = key(request) if key is not None else None
+        limiter = limiters.get(limit_key)
+        if limiter is None:
+            with limiters_lock:
+                limiter = limiters.get(limit_key)
+                if limiter is None:
+                    limiter = limiters[limit_key] = ConcurrencyLimiter(max_in_flight, max_wait, max_queue)
+        return limiter
+
+    def stats():
+        return {limit_key: limiter.stats() for limit_key, limiter in list(limiters.items())}
+
+    def decorator(view_func):
+        if inspect.iscoroutinefunction(view_func):
+            @wraps(view_func)
+            async def async_wrapper(*args, **kwargs):
+                limiter = get_limiter(args[1])
+                if not await limiter.acquire_async():
+                    return _shed_response()
+                try:
+                    return await view_func(*args, **kwargs)
+                finally:
+                    limiter.release()
+            async_wrapper.stats = stats
+            return async_wrapper
+
+        @wraps(view_func)
+        def wrapper(*args, **kwargs):
+            limiter = get_limiter(args[1])
+            if not limiter.acquire():
+                return _shed_response()
+            try:
+                return view_func(*args, **kwargs)
+            finally:
+                limiter.release()
+        wrapper.stats = stats
+        return wrapper
+    return decorator
+
+
 # def validate_ids(ids_dict):
 #     """
 #     A decorator that validates multiple object IDs in the request URL.
@@ -330,4 +570,40 @@ class CustomException(Exception):
     def __init__(self, error_code, error_message):
         self.error_code = error_code
         self.error_message = error_message
-        super().__init__(error_message)
\ No newline at end of file
+        super().__init__(error_message)
+
+
+# Default exception handlers used by handle_exception.
+
+@register_exception_handler(ValidationError, NotFound)
+def _handle_api_error(exception):
+    message = exception.detail
+    return generate_response(status=status.HTTP_400_BAD_REQUEST, message=message)
+
+
+@register_exception_handler(CustomValidationException)
+def _handle_custom_validation_exception(exception):
+    errors = exception.error_list
+    return generate_error_response(status=status.HTTP_200_OK, errors=errors)
+
+
+@register_exception_handler(FileNotFoundError, ValueError)
+def _handle_bad_input(exception):
+    message = str(exception)
+    return generate_response(status=status.HTTP_400_BAD_REQUEST, message=message)
+
+
+@register_exception_handler(OverloadError)
+def _handle_overload(exception):
+    message = STATUS_MESSAGES.get(503)
+    return generate_response(status=status.HTTP_503_SERVICE_UNAVAILABLE, message=message)
+
+
+@register_exception_handler(CustomException)
+def _handle_custom_exception(exception):
+    # Handle CustomException by extracting the error code and message
+    error_response = {
+        "error_code": exception.error_code,
+        "error_message": exception.error_message
+    }
+    return Response(error_response, status=status.HTTP_400_BAD_REQUEST)  # Set appropriate HTTP status code
@@ -1,5 +1,8 @@
 from functools import wraps
 
+from v2s_common_utils.lookup_cache import MISSING, default_lookup_cache
+from v2s_common_utils.utils import lookup_ids_by_attributes
+
 def replace_placeholder_with_id(model, attribute, placeholder_key):
     """
     A decorator to replace a placeholder value in request.data with the corresponding model's ID.
@@ -23,13 +26,94 @@ def replace_placeholder_with_id(model, attribute, placeholder_key):
             if request.data.get(placeholder_key) is not None:
                 # Get the placeholder value from request.data
                 placeholder_value = request.data[placeholder_key]
-                print(placeholder_value)
-                print(attribute)
                 obj = model.objects.filter(**{attribute: placeholder_value}).first()
-                print(obj)
                 if obj:
                     # Replace the placeholder value with the object's ID
                     request.data[placeholder_key] = obj.id
             return view_func(self, request, *args, **kwargs)
         return _wrapped_view
     return decorator
+
+
+def resolve_placeholder_ids(data, mappings, cache=default_lookup_cache):
+    """
+    Replace several placeholder values in a dict with the corresponding model IDs.
+
+    Cached lookups, including values known not to exist, are used first. The remaining
+    values are resolved with one query per model and added to the cache. Values that match no row are left unchanged.
+
+    Args:
+        data (dict): The data to update in place, usually request.data.
+        mappings (list): A list of (model, attribute, placeholder_key) tuples.
+        cache (LookupCache, optional): The cache to use. None disables caching.
+
+    Returns:
+        dict: The updated data.
+    """
+    pending = {}
+    for model, attribute, placeholder_key in mappings:
+        value = data.get(placeholder_key)
+        if value is None:
+            continue
+        try:
+            obj_id = MISSING if cache is None else cache.get(model, attribute, value)
+        except TypeError:
+            # Unhashable values (lists, dicts) can never match a column value.
+            continue
+        if obj_id is None:
+            # Known not to exist.
+            continue
+        if obj_id is MISSING:
+            pending.setdefault(model, {}).setdefault(attribute, {}).setdefault(value, []).append(placeholder_key)
+        else:
+            data[placeholder_key] = obj_id
+
+    for model, keys_by_attribute in pending.items():
+        # Read before the query, so a save that lands during it keeps the result out of the cache.
+        generation = None if cache is None else cache.generation(model)
+        ids = lookup_ids_by_attributes(model, keys_by_attribute)
+        for attribute, ids_by_value in ids.items():
+            if cache is not None:
+                # Misses are cached as None too; creating a matching row invalidates them.
+                cache.set_many(model, attribute, {value: ids_by_value.get(value) for value in keys_by_attribute[attribute]},
+                               generation)
+            for value, obj_id in ids_by_value.items():
+                for placeholder_key in keys_by_attribute[attribute][value]:
+                    data[placeholder_key] = obj_id
+    return data
+
+
+def replace_placeholders_with_id(mappings, cache=default_lookup_cache):
+    """
+    A decorator to replace several placeholder values in request.data with model IDs.
+
+    Unlike stacking replace_placeholder_with_id, all placeholders on the same model are
+    resolved with one query, and lookups are cached until the model is saved or deleted
+    or the cache entry expires. See resolve_placeholder_ids.
+
+    Args:
+        mappings (list): A list of (model, attribute, placeholder_key) tuples.
+        cache (LookupCache, optional): The cache to use. Defaults to a shared cache; None
+            disables caching.
+
+    Returns:
+        function: A decorator function.
+
+    Example:
+        @replace_placeholders_with_id([
+            (Endpoint, 'name', 'endpoint_name'),
+            (Module, 'code', 'module_code'),
+            (Module, 'name', 'parent_module_name'),
+        ])
+        def post(self, request):
+            # Your view logic here
+    """
+    mappings = tuple(mappings)
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def _wrapped_view(self, request, *args, **kwargs):
+            resolve_placeholder_ids(request.data, mappings, cache)
+            return view_func(self, request, *args, **kwargs)
+        return _wrapped_view
+    return decorator
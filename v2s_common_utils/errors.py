@@ -1,26 +1,278 @@
 import configparser
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
 
 def load_error_messages(file_path):
     config = configparser.ConfigParser()
     config.read(file_path)
-    
+
     error_messages = {}
-    
+
     for section in config.sections():
         for key, value in config.items(section):
             error_messages[key.upper()] = value
-    
+
     return error_messages
 
 
 
-# Path to your message.properties file
+# Path to your message.properties file. A relative path is resolved against
+# settings.BASE_DIR when Django is configured, otherwise against the current directory.
+# settings.V2S_ERROR_MESSAGES_FILE overrides it.
 MESSAGE_PROPERTIES_FILE_PATH = 'message.properties'
 
-# Load the error messages
-error_messages = load_error_messages(MESSAGE_PROPERTIES_FILE_PATH)
+UNDEFINED_ERROR = 'Undefined error'
+
+_CACHE_VERSION = 1
+
+# Stands for the default cache directory, which is only looked up when a catalog is created.
+_TEMP_CACHE_DIR = object()
+
+
+def _default_cache_dir():
+    """Returns a per-user directory in the system temp directory, or None where users have no uid."""
+    if not hasattr(os, 'getuid'):
+        return None
+    import tempfile
+    return os.path.join(tempfile.gettempdir(), f'v2s_error_catalog-{os.getuid()}')
+
+
+def _is_private(stat):
+    """True if the file or directory belongs to this user and nobody else can write to it."""
+    if hasattr(os, 'getuid') and stat.st_uid != os.getuid():
+        return False
+    return not stat.st_mode & 0o022
+
+
+class ErrorCatalog:
+    """
+    Lazily loaded, cached and hot-reloadable error messages, in one or more locales.
+
+    The default messages come from file_path. Translations sit next to it as
+    '<name>_<locale>.properties' files, for example message_hi.properties or
+    message_pt_BR.properties. A locale's messages fall back to its language ('pt_BR' to
+    'pt') and then to the default messages, and the fallback is merged once per locale,
+    so a lookup is a single dict access.
+
+    Nothing is read until the first lookup. The parsed catalogs are saved as JSON in
+    cache_dir together with the size and modification time of every file they came from,
+    and later processes load that file instead of parsing the properties files again.
+    The cache directory is created with mode 0700, and a cache file (or directory) owned
+    by another user or writable by others is ignored, so other local users cannot plant
+    messages.
+
+    If check_interval is set, lookups check the files' modification times at most once per
+    interval and reload the catalog when a file changed, was added or was removed. A
+    catalog that fails to load is logged and the previous messages stay in use.
+
+    Args:
+        file_path (str): The path of the default message.properties file.
+        check_interval (float, optional): Seconds between modification checks. None
+            disables hot reload. Default is 2.0.
+        cache_dir (str, optional): Where the parsed catalog is saved. None disables the
+            cache. Default is a per-user v2s_error_catalog-<uid> directory in the system
+            temp directory; on systems without uids the cache is off by default.
+
+    Methods:
+        get(error_code, locale=None): Returns the message for an error code.
+        load(): Reads the catalog now.
+        locales(): Returns the loaded locales.
+
+    Example:
+        ERRORS = ErrorCatalog(os.path.join(BASE_DIR, 'message.properties'))
+        ERRORS.get('E001', locale='hi')
+    """
+
+    def __init__(self, file_path, check_interval=2.0, cache_dir=_TEMP_CACHE_DIR):
+        if cache_dir is _TEMP_CACHE_DIR:
+            cache_dir = _default_cache_dir()
+        self.file_path = os.path.abspath(file_path)
+        self.check_interval = check_interval
+        self.cache_dir = cache_dir
+        self._default = None
+        self._catalogs = {}
+        self._resolved = {}
+        self._signature = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def _source_files(self):
+        """Returns {locale or None: path} for the default file and its translations."""
+        stem, ext = os.path.splitext(self.file_path)
+        files = {None: self.file_path}
+        for path in glob.glob(glob.escape(stem) + '_*' + ext):
+            files[path[len(stem) + 1:-len(ext) or None]] = path
+        return files
+
+    def _signature_of(self, files):
+        signature = {}
+        for path in files.values():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            signature[path] = [stat.st_size, stat.st_mtime_ns]
+        return signature
+
+    def _cache_path(self):
+        digest = hashlib.sha1(self.file_path.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{digest}.json')
+
+    def _read_cache(self, signature):
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._cache_path(), encoding='utf-8') as f:
+                if not (_is_private(os.fstat(f.fileno())) and _is_private(os.stat(self.cache_dir))):
+                    logger.warning("Ignoring error catalog cache %s: it is not private to this user.",
+                                   self._cache_path())
+                    return None
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if cached.get('version') != _CACHE_VERSION or cached.get('signature') != signature:
+            return None
+        return cached['catalogs']
+
+    def _write_cache(self, signature, catalogs):
+        if self.cache_dir is None:
+            return
+        path = self._cache_path()
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+            if not _is_private(os.stat(self.cache_dir)):
+                logger.warning("Not writing the error catalog cache: %s is not private to this user.", self.cache_dir)
+                return
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': _CACHE_VERSION, 'signature': signature, 'catalogs': catalogs}, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not write the error catalog cache %s: %s", path, e)
+
+    def _load(self):
+        files = self._source_files()
+        signature = self._signature_of(files)
+        if self.file_path not in signature:
+            logger.warning("Error message file %s not found; error codes resolve to '%s'.",
+                           self.file_path, UNDEFINED_ERROR)
+        catalogs = self._read_cache(signature)
+        if catalogs is None:
+            catalogs = {locale or '': load_error_messages(path)
+                        for locale, path in files.items() if path in signature}
+            self._write_cache(signature, catalogs)
+        self._default = catalogs.pop('', {})
+        self._catalogs = catalogs
+        self._resolved = {}
+        self._signature = signature
+
+    def load(self):
+        """Reads the catalog now, replacing the loaded messages."""
+        with self._lock:
+            self._load()
+            self._next_check = time.monotonic() + (self.check_interval or 0)
+
+    def _reload_if_changed(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+            signature = self._signature_of(self._source_files())
+            if signature == self._signature:
+                return
+            try:
+                self._load()
+                logger.info("Reloaded error messages from %s", self.file_path)
+            except Exception as e:
+                # Remember the broken version so it is reported once, not on every check.
+                self._signature = signature
+                logger.error("Keeping previous error messages, could not reload %s: %s", self.file_path, e)
+
+    def _messages(self, locale):
+        """Returns the merged messages for a locale, building them on first use."""
+        messages = self._resolved.get(locale)
+        if messages is None:
+            messages = dict(self._default)
+            if locale:
+                language = locale.replace('-', '_').split('_')[0]
+                for candidate in (language, locale.replace('-', '_')):
+                    messages.update(self._catalogs.get(candidate, {}))
+            self._resolved[locale] = messages
+        return messages
+
+    def messages(self, locale=None):
+        """Returns the dict of error code -> message for a locale."""
+        if self._signature is None:
+            self.load()
+        elif self.check_interval is not None:
+            self._reload_if_changed()
+        return self._messages(locale)
+
+    def get(self, error_code, locale=None):
+        """
+        Returns the message for an error code.
+
+        Args:
+            error_code (str): The error code.
+            locale (str, optional): A locale such as 'hi' or 'pt_BR'. None uses the default messages.
+
+        Returns:
+            str: The message, or 'Undefined error' if the code is unknown.
+        """
+        return self.messages(locale).get(error_code, UNDEFINED_ERROR)
+
+    def locales(self):
+        """Returns the locales that have a translation file."""
+        if self._signature is None:
+            self.load()
+        return sorted(self._catalogs)
+
+
+_default_catalog = None
+_default_catalog_lock = threading.Lock()
+
+
+def _default_file_path():
+    try:
+        from django.conf import settings
+        if settings.configured:
+            file_path = getattr(settings, 'V2S_ERROR_MESSAGES_FILE', MESSAGE_PROPERTIES_FILE_PATH)
+            base_dir = getattr(settings, 'BASE_DIR', None)
+            if base_dir is not None and not os.path.isabs(file_path):
+                return os.path.join(base_dir, file_path)
+            return file_path
+    except ImportError:
+        pass
+    return MESSAGE_PROPERTIES_FILE_PATH
+
+
+def get_error_catalog():
+    """Returns the package's default ErrorCatalog, creating it on first use."""
+    global _default_catalog
+    if _default_catalog is None:
+        with _default_catalog_lock:
+            if _default_catalog is None:
+                _default_catalog = ErrorCatalog(_default_file_path())
+    return _default_catalog
+
 
 # Create a function to retrieve error messages by error code
-def get_error_message(error_code):
-    return error_messages.get(error_code, 'Undefined error')
+def get_error_message(error_code, locale=None):
+    return get_error_catalog().get(error_code, locale)
+
 
+def __getattr__(name):
+    # error_messages used to be loaded at import time; it is now read on first access.
+    if name == 'error_messages':
+        return get_error_catalog().messages()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+
+# Bit layout of a UUIDv7 (RFC 9562): 48-bit unix millisecond timestamp,
+# 4-bit version, 12 random bits, 2-bit variant and 62 random bits.
+_RAND_BITS = 74
+_RAND_MASK = (1 << _RAND_BITS) - 1
+_TIMESTAMP_MASK = (1 << 48) - 1
+_VERSION_7 = 0x7
+_VARIANT_RFC4122 = 0x2
+
+
+class TimeOrderedIdGenerator:
+    """
+    Thread-safe generator for time-ordered UUIDv7 identifiers.
+
+    Identifiers generated in the same millisecond are kept strictly increasing by
+    incrementing the random part of the previous identifier. If that part overflows,
+    the timestamp is advanced by one millisecond, so ordering is never broken.
+
+    Attributes:
+        clock (callable): Returns the current unix time in milliseconds.
+
+    Methods:
+        generate(): Returns one new UUID.
+        generate_many(n): Returns a list of n new UUIDs in ascending order.
+
+    Example:
+        generator = TimeOrderedIdGenerator()
+        order_id = generator.generate()
+        batch_ids = generator.generate_many(500)
+    """
+
+    def __init__(self, clock=None):
+        self.clock = clock or (lambda: time.time_ns() // 1_000_000)
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._last_rand = 0
+
+    def _next(self):
+        """Returns the next (timestamp, random) pair. The caller must hold the lock."""
+        now_ms = self.clock() & _TIMESTAMP_MASK
+        if now_ms > self._last_ms:
+            self._last_ms = now_ms
+            # Keep the top random bit clear so a millisecond has room to increment.
+            self._last_rand = int.from_bytes(os.urandom(10), 'big') & (_RAND_MASK >> 1)
+        else:
+            self._last_rand += 1
+            if self._last_rand > _RAND_MASK:
+                self._last_ms += 1
+                self._last_rand = 0
+        return self._last_ms, self._last_rand
+
+    @staticmethod
+    def _build(timestamp_ms, rand):
+        rand_a = rand >> 62
+        rand_b = rand & ((1 << 62) - 1)
+        value = (timestamp_ms << 80) | (_VERSION_7 << 76) | (rand_a << 64) | (_VARIANT_RFC4122 << 62) | rand_b
+        return uuid.UUID(int=value)
+
+    def generate(self):
+        """Returns one new time-ordered UUID."""
+        with self._lock:
+            timestamp_ms, rand = self._next()
+        return self._build(timestamp_ms, rand)
+
+    def generate_many(self, n):
+        """
+        Returns a list of n new time-ordered UUIDs.
+
+        The lock is taken once for the whole batch, so the identifiers are contiguous
+        and sorted, which suits bulk inserts.
+
+        Args:
+            n (int): The number of identifiers to generate.
+
+        Returns:
+            list: A list of uuid.UUID objects in ascending order.
+        """
+        if n <= 0:
+            return []
+        with self._lock:
+            pairs = [self._next() for _ in range(n)]
+        return [self._build(timestamp_ms, rand) for timestamp_ms, rand in pairs]
+
+
+_default_generator = TimeOrderedIdGenerator()
+
+
+def uuid7():
+    """Returns a new time-ordered UUID from the shared generator."""
+    return _default_generator.generate()
+
+
+def generate_many(n):
+    """Returns a list of n new time-ordered UUIDs from the shared generator."""
+    return _default_generator.generate_many(n)
+
+
+def _as_uuid(value):
+    if isinstance(value, uuid.UUID):
+        return value
+    return uuid.UUID(str(value))
+
+
+def extract_timestamp_ms(value):
+    """
+    Returns the unix millisecond timestamp stored in a time-ordered identifier.
+
+    Args:
+        value (uuid.UUID or str): A UUIDv7 object, or its hyphenated or hex string form.
+
+    Returns:
+        int: Milliseconds since the unix epoch.
+
+    Raises:
+        ValueError: If the value is not a version 7 UUID.
+    """
+    value = _as_uuid(value)
+    if value.version != _VERSION_7:
+        raise ValueError(f"{value} is not a time-ordered (version 7) UUID.")
+    return value.int >> 80
+
+
+def extract_datetime(value):
+    """
+    Returns the creation time stored in a time-ordered identifier as an aware UTC datetime.
+
+    Args:
+        value (uuid.UUID or str): A UUIDv7 object, or its hyphenated or hex string form.
+
+    Returns:
+        datetime: The time the identifier was generated, with millisecond precision.
+    """
+    return datetime.fromtimestamp(extract_timestamp_ms(value) / 1000, tz=timezone.utc)
@@ -1,4 +1,24 @@
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+from v2s_common_utils.message import LOGGER_MSG
 
 # def get_logger(name):
 #     """This function creates a logger object with the given name and sets the logging level to INFO.
@@ -21,39 +41,612 @@ import logging
 #     return logger
 
 
-import os
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)s - %(funcName)s() ] - %(message)s'
+
+OVERFLOW_POLICIES = ('drop_newest', 'drop_oldest', 'block')
+
+_exception_formatter = logging.Formatter()
+
+
+class BatchFlushFileHandler(logging.FileHandler):
+    """
+    File handler that writes a batch of records with a single write.
+
+    StreamHandler writes and flushes every record on its own. Behind a LogWriter, records
+    are collected by emit() and written together by flush_batch(), once per batch. The file
+    is opened in append mode, so a batch written by one process is not interleaved with
+    lines from other processes writing the same file.
+    """
+
+    def __init__(self, filename, mode='a', encoding='utf-8', delay=False):
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+        self._pending = []
+        self._pending_size = 0
+
+    def emit(self, record):
+        try:
+            line = self.format(record) + self.terminator
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending.append(line)
+        self._pending_size += len(line)
+
+    def flush(self):
+        pass
+
+    def flush_batch(self):
+        """Writes and flushes the records collected since the last call."""
+        self.acquire()
+        try:
+            if self._pending:
+                if self.stream is None:
+                    self.stream = self._open()
+                self._write_batch(''.join(self._pending), self._pending_size)
+                self._pending.clear()
+                self._pending_size = 0
+            if self.stream is not None:
+                self.stream.flush()
+        finally:
+            self.release()
+
+    def _write_batch(self, data, size):
+        """Writes a batch of size characters to the open stream. Subclasses may wrap the write."""
+        self.stream.write(data)
+
+    def close(self):
+        self.flush_batch()
+        super().close()
+
+
+@contextmanager
+def _interprocess_lock(lock_path):
+    """Holds an exclusive lock on lock_path. Without fcntl (Windows) only threads are excluded."""
+    with open(lock_path, 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class _Compressor:
+    """Background thread that gzips rotated log files and prunes old ones."""
+
+    def __init__(self):
+        self._jobs = queue.Queue()
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, rotated_path, handler):
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                self._thread = threading.Thread(target=self._run, name='v2s-log-compressor', daemon=True)
+                self._thread.start()
+                self._pid = os.getpid()
+        self._jobs.put((rotated_path, handler.baseFilename, handler.backup_count, handler.compress))
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            try:
+                self._process(*job)
+            except Exception as e:
+                sys.stderr.write(f"Could not compress rotated log {job[0]}: {e}\n")
+            finally:
+                self._jobs.task_done()
+
+    @staticmethod
+    def _process(rotated_path, base_path, backup_count, compress):
+        if compress:
+            import gzip
+            import shutil
+
+            gz_path = rotated_path + '.gz'
+            try:
+                with open(rotated_path, 'rb') as src, gzip.open(gz_path + '.tmp', 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+            except FileNotFoundError:
+                # Already pruned because newer files were rotated meanwhile.
+                return
+            os.replace(gz_path + '.tmp', gz_path)
+            os.remove(rotated_path)
+        if backup_count:
+            prune_rotated_logs(base_path, backup_count)
+
+    def wait(self, timeout=5.0):
+        """Waits up to timeout seconds for queued compressions to finish."""
+        deadline = time.monotonic() + timeout
+        while self._jobs.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+
+_compressor = _Compressor()
+
+
+def prune_rotated_logs(base_path, backup_count):
+    """Deletes the oldest rotated files of base_path, keeping backup_count of them."""
+    directory, name = os.path.split(base_path)
+    pattern = re.compile(re.escape(name) + r'\.(\d{8}-\d{6}-\d{6})(?:-(\d+))?(?:\.gz)?')
+    rotated = []
+    for file_name in os.listdir(directory):
+        match = pattern.fullmatch(file_name)
+        if match:
+            rotated.append((match.group(1), int(match.group(2) or 0), file_name))
+    rotated.sort()
+    for _, _, file_name in rotated[:-backup_count]:
+        try:
+            os.remove(os.path.join(directory, file_name))
+        except FileNotFoundError:
+            # Another process pruned it first.
+            pass
+
+
+class RotatingLogHandler(BatchFlushFileHandler):
+    """
+    Batch-writing file handler that rotates by size and/or time.
+
+    The active file is renamed to '<file>.<YYYYmmdd-HHMMSS-microseconds>' when writing the next batch
+    would take it past max_bytes, or when the current rotate_interval period ends. Rotated
+    files are gzipped and pruned to backup_count by a background thread, so neither is done
+    on the thread that writes the log.
+
+    Several processes may share one log file. Rotation is done under an fcntl lock on
+    '<file>.lock'. Each batch is written under the same lock, after checking whether the
+    file the process has open is still the one at the path; if another process rotated
+    it, the file is reopened instead of being rotated again. As the check and the write
+    are not separated, no batch goes to a file that has already been rotated and
+    compressed. Time periods are aligned to the epoch, so all processes
+    agree on when a period ends.
+
+    Args:
+        filename (str): The path of the active log file.
+        max_bytes (int, optional): Rotate when the file would exceed this size. 0 disables
+            size rotation. Default is 0.
+        rotate_interval (int, optional): Rotate every this many seconds (86400 for daily
+            files). None disables time rotation. Default is None.
+        backup_count (int, optional): The number of rotated files to keep. 0 keeps all. Default is 7.
+        compress (bool, optional): Whether to gzip rotated files. Default is True.
+    """
+
+    def __init__(self, filename, max_bytes=0, rotate_interval=None, backup_count=7, compress=True,
+                 encoding='utf-8'):
+        super().__init__(filename, encoding=encoding)
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compress = compress
+        self._next_rollover = self._compute_next_rollover(time.time())
+
+    def _compute_next_rollover(self, now):
+        if not self.rotate_interval:
+            return None
+        return (int(now) // self.rotate_interval + 1) * self.rotate_interval
+
+    def _is_current(self, own_stat):
+        """Returns True if the open stream is still the file at baseFilename."""
+        try:
+            path_stat = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            return False
+        return (path_stat.st_dev, path_stat.st_ino) == (own_stat.st_dev, own_stat.st_ino)
+
+    def _reopen(self):
+        self.stream.close()
+        self.stream = self._open()
+
+    def _write_batch(self, data, size):
+        with _interprocess_lock(self.baseFilename + '.lock'):
+            own_stat = os.fstat(self.stream.fileno())
+            now = time.time()
+            if not self._is_current(own_stat):
+                # Another process rotated the file, so this period's rotation is done.
+                self._reopen()
+                own_stat = os.fstat(self.stream.fileno())
+                self._next_rollover = self._compute_next_rollover(now)
+            due = self._next_rollover is not None and now >= self._next_rollover
+            if self.max_bytes and own_stat.st_size and own_stat.st_size + size > self.max_bytes:
+                due = True
+            if due:
+                self._rollover(now)
+            self.stream.write(data)
+            # Flushed before the lock is released, so a rotation that follows moves the whole batch.
+            self.stream.flush()
+
+    def _rotated_path(self, now):
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now)) + f'-{int(now % 1 * 1e6):06d}'
+        path = f'{self.baseFilename}.{stamp}'
+        suffix = 1
+        while os.path.exists(path) or os.path.exists(path + '.gz'):
+            path = f'{self.baseFilename}.{stamp}-{suffix}'
+            suffix += 1
+        return path
+
+    def _rollover(self, now):
+        """Rotates the open file, which is current. Caller holds the interprocess lock."""
+        self.stream.close()
+        rotated_path = self._rotated_path(now)
+        os.rename(self.baseFilename, rotated_path)
+        _compressor.submit(rotated_path, self)
+        self.stream = self._open()
+        self._next_rollover = self._compute_next_rollover(now)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats each record as a single line of JSON.
+
+    The object holds time, level, logger, message, module, line and func, plus 'event' and
+    'sample_rate' for records logged with log_event() and any extra fields passed to it.
+    An extra field whose name is already taken, such as 'message', is written under
+    'fields' instead. Exceptions are included as 'exc_info', a traceback string. Values
+    that are not JSON types are written with str().
+    """
+
+    def format(self, record):
+        entry = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'line': record.lineno,
+            'func': record.funcName,
+        }
+        event = getattr(record, 'event', None)
+        if event is not None:
+            entry['event'] = event
+            entry['sample_rate'] = getattr(record, 'sample_rate', 1.0)
+            for name, value in (getattr(record, 'fields', None) or {}).items():
+                if name in entry:
+                    entry.setdefault('fields', {})[name] = value
+                else:
+                    entry[name] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc_info'] = record.exc_text
+        if record.stack_info:
+            entry['stack_info'] = record.stack_info
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+    def formatTime(self, record, datefmt=None):
+        return datetime.fromtimestamp(record.created).astimezone().isoformat(timespec='milliseconds')
+
+
+class LoggerMessage:
+    """
+    A LOGGER_MSG template and its arguments, formatted only when the record is written.
+
+    Example:
+        logger.info(LoggerMessage('GET_DETAILS', 'user', user_id))
+    """
+
+    __slots__ = ('key', 'args')
+
+    def __init__(self, key, *args):
+        self.key = key
+        self.args = args
+
+    def __str__(self):
+        return LOGGER_MSG[self.key].format(*self.args)
+
+
+# Fraction of log_event() calls written per LOGGER_MSG key. Keys not listed are always written.
+LOG_SAMPLE_RATES = {}
+
+
+def set_sample_rate(key, rate):
+    """
+    Sets the fraction of log_event() calls written for a LOGGER_MSG key.
+
+    Args:
+        key (str): The LOGGER_MSG key.
+        rate (float): A value between 0.0 (never) and 1.0 (always).
+    """
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"Sample rate for '{key}' must be between 0 and 1, not {rate}.")
+    LOG_SAMPLE_RATES[key] = rate
+
+
+def log_event(logger, key, *args, level=logging.INFO, exc_info=None, **fields):
+    """
+    Logs a LOGGER_MSG message with lazy formatting and per-key sampling.
+
+    Nothing is formatted if the level is disabled or the call is sampled out. The message
+    text is built from the template when the record is written, and with a JsonFormatter
+    the key, the sample rate and the extra fields become separate JSON attributes.
+
+    Args:
+        logger (Logger): The logger to write to.
+        key (str): The LOGGER_MSG key.
+        *args: The values for the template's placeholders.
+        level (int, optional): The logging level. Default is logging.INFO.
+        exc_info (optional): Passed to the logger, as for logger.log().
+        **fields: Extra values to include in the JSON record.
+
+    Returns:
+        bool: True if the record was logged, False if it was disabled or sampled out.
+
+    Example:
+        set_sample_rate('GET_ALL', 0.01)
+        log_event(logger, 'GET_ALL', 'user', page=page_number)
+    """
+    if not logger.isEnabledFor(level):
+        return False
+    rate = LOG_SAMPLE_RATES.get(key, 1.0)
+    if rate < 1.0 and random.random() >= rate:
+        return False
+    logger.log(level, LoggerMessage(key, *args), exc_info=exc_info, stacklevel=2,
+               extra={'event': key, 'sample_rate': rate, 'fields': fields})
+    return True
+
+
+class _BatchingQueueListener(QueueListener):
+    """QueueListener that writes up to batch_size queued records before flushing."""
+
+    def __init__(self, log_queue, handler, batch_size):
+        super().__init__(log_queue, handler, respect_handler_level=True)
+        self.batch_size = batch_size
+        self.written = 0
+
+    def enqueue_sentinel(self):
+        # The queue is bounded, so wait for room instead of failing with queue.Full.
+        self.queue.put(self._sentinel)
+
+    def _flush(self):
+        for handler in self.handlers:
+            flush = getattr(handler, 'flush_batch', handler.flush)
+            flush()
+
+    def _monitor(self):
+        q = self.queue
+        stopping = False
+        while not stopping:
+            batch = [q.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+            for record in batch:
+                if record is self._sentinel:
+                    stopping = True
+                else:
+                    self.handle(record)
+                    self.written += 1
+                q.task_done()
+            self._flush()
+
+
+# Argument types that are immutable and picklable, so they can wait in the queue as they are.
+_PLAIN_TYPES = (str, int, float, bool, bytes, type(None), datetime)
+
+
+def _is_plain(value):
+    """
+    Returns True if value can wait in the queue and be formatted later on the writer thread.
+
+    Plain values, and tuples and LoggerMessages made only of plain values, qualify.
+    Anything else could change, or format differently, before the record is written.
+    """
+    if isinstance(value, _PLAIN_TYPES):
+        return True
+    if isinstance(value, LoggerMessage):
+        return all(map(_is_plain, value.args))
+    if isinstance(value, tuple):
+        return all(map(_is_plain, value))
+    return False
+
+
+class _BoundedQueueHandler(QueueHandler):
+    """QueueHandler that applies the writer's overflow policy when the queue is full."""
+
+    def __init__(self, writer):
+        super().__init__(writer.queue)
+        self.writer = writer
+
+    def prepare(self, record):
+        # Unlike QueueHandler.prepare, the message is not formatted here when msg and args
+        # are plain (see _is_plain): they are queued as they are and the writer thread
+        # formats them, so a LoggerMessage costs nothing on the logging thread. Other
+        # records are formatted now, with their original arguments. The traceback is kept
+        # apart from the message, so the writer's formatter decides how to render it.
+        record = copy.copy(record)
+        args = record.args.values() if isinstance(record.args, dict) else record.args or ()
+        if not (_is_plain(record.msg) and all(map(_is_plain, args))):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        self.writer.enqueue(record)
+
 
-def get_logger(name):
+class LogWriter:
+    """
+    Writes log records to one file from a background thread.
+
+    Loggers put records on a bounded queue and return immediately. A QueueListener thread
+    takes them off in batches, writes them and flushes the file once per batch. When the
+    queue is full, the overflow policy decides what happens:
+
+        'drop_newest': the new record is dropped (the default; logging never blocks).
+        'drop_oldest': the oldest queued record is dropped to make room.
+        'block': the caller waits up to block_timeout seconds, then drops the record.
+
+    Dropped records are counted and reported in stats(). Writers are stopped, and their
+    queues drained, at interpreter exit.
+
+    Args:
+        handler (logging.Handler): The handler that writes the records.
+        queue_size (int, optional): The number of records that may be queued. Default is 10000.
+        overflow (str, optional): One of OVERFLOW_POLICIES. Default is 'drop_newest'.
+        batch_size (int, optional): The number of records written between flushes. Default is 256.
+        block_timeout (float, optional): Seconds to wait under the 'block' policy. Default is 1.0.
+    """
+
+    def __init__(self, handler, queue_size=10000, overflow='drop_newest', batch_size=256, block_timeout=1.0):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, not '{overflow}'.")
+        self.handler = handler
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._start()
+
+    def _start(self):
+        self.queue = queue.Queue(self.queue_size)
+        self.listener = _BatchingQueueListener(self.queue, self.handler, self.batch_size)
+        self.listener.start()
+        self._pid = os.getpid()
+
+    def _count_drop(self):
+        with self._lock:
+            self.dropped += 1
+
+    def enqueue(self, record):
+        """Queues a record, applying the overflow policy if the queue is full."""
+        if self._pid != os.getpid():
+            self._restart_after_fork()
+        try:
+            self.queue.put_nowait(record)
+            return
+        except queue.Full:
+            pass
+        if self.overflow == 'block':
+            try:
+                self.queue.put(record, timeout=self.block_timeout)
+            except queue.Full:
+                self._count_drop()
+        elif self.overflow == 'drop_oldest':
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self._count_drop()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self._count_drop()
+        else:
+            self._count_drop()
+
+    def _restart_after_fork(self):
+        # The listener thread does not survive fork(), so a forked worker starts its own.
+        with self._lock:
+            if self._pid != os.getpid():
+                self._start()
+
+    def stop(self):
+        """Writes every queued record, then stops the background thread."""
+        if self.listener._thread is not None and self._pid == os.getpid():
+            self.listener.stop()
+        self.handler.close()
+
+    def stats(self):
+        """
+        Returns a snapshot of the writer's counters.
+
+        Returns:
+            dict: queued, queue_size, written and dropped.
+        """
+        return {
+            'queued': self.queue.qsize(),
+            'queue_size': self.queue_size,
+            'written': self.listener.written,
+            'dropped': self.dropped,
+        }
+
+
+_writers = {}
+_writers_lock = threading.Lock()
+
+
+def _get_writer(log_file_path, queue_size, overflow, rotation, json_format):
+    log_file_path = os.path.abspath(log_file_path)
+    with _writers_lock:
+        writer = _writers.get(log_file_path)
+        if writer is None:
+            os.makedirs(os.path.dirname(log_file_path), exist_ok=True)
+            if rotation['max_bytes'] or rotation['rotate_interval']:
+                handler = RotatingLogHandler(log_file_path, **rotation)
+            else:
+                handler = BatchFlushFileHandler(log_file_path)
+            handler.setFormatter(JsonFormatter() if json_format else logging.Formatter(LOG_FORMAT))
+            writer = _writers[log_file_path] = LogWriter(handler, queue_size=queue_size, overflow=overflow)
+        return writer
+
+
+def get_logger(name, log_file_path=os.path.join('logs', 'core.log'), level=logging.INFO,
+               queue_size=10000, overflow='drop_newest', max_bytes=0, rotate_interval=None,
+               backup_count=7, compress=True, json_format=False):
     """This function creates a logger object with the given name and sets the logging level to INFO.
-    It also adds a file handler to the logger which will log messages to the 'logs/clm.log' file.
-    The formatter is set to include the time, name, level, filename, line number, function name and message in the log output.
+    Records are written to the 'logs/core.log' file by a background thread, so logging does not
+    wait for the disk. The formatter is set to include the time, name, level, filename, line number,
+    function name and message in the log output.
+
+    The handler is attached once per logger name, so the function can be called per module or per
+    request. All loggers writing to the same file share one file handle and one queue; the queue,
+    rotation and format options are taken from the first call for a file. See LogWriter.
+
+    If max_bytes or rotate_interval is set, the file is rotated, and rotated files are compressed
+    and pruned in the background. See RotatingLogHandler.
 
     Args:
         name (str): Name of the logger.
+        log_file_path (str, optional): The file to write to. Default is 'logs/core.log'.
+        level (int, optional): The logging level. Default is logging.INFO.
+        queue_size (int, optional): The number of records that may wait to be written.
+        overflow (str, optional): What to do when the queue is full: 'drop_newest', 'drop_oldest' or 'block'.
+        max_bytes (int, optional): Rotate the file before it exceeds this size. 0 disables size rotation.
+        rotate_interval (int, optional): Rotate the file every this many seconds. None disables time rotation.
+        backup_count (int, optional): The number of rotated files to keep. Default is 7.
+        compress (bool, optional): Whether to gzip rotated files. Default is True.
+        json_format (bool, optional): Write single-line JSON records (see JsonFormatter) instead
+            of text. Default is False.
+
+    Example:
+        logger = get_logger(__name__, max_bytes=100 * 1024 * 1024, backup_count=10)
 
     Returns:
         Logger: Logger object.
     """
-    # Check if the 'logs' directory exists, create it if not
-    logs_dir = 'logs'
-    if not os.path.exists(logs_dir):
-        os.makedirs(logs_dir)
-
-    # Define the log file path
-    log_file_path = os.path.join(logs_dir, 'core.log')
-
-    # Create the logger
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    
-    # Check if the log file exists, create it if not
-    if not os.path.exists(log_file_path):
-        open(log_file_path, 'w').close()
-
-    file_handler = logging.FileHandler(log_file_path)
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)s - %(funcName)s() ] - %(message)s')
-    file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
-    
+    logger.setLevel(level)
+    rotation = {'max_bytes': max_bytes, 'rotate_interval': rotate_interval,
+                'backup_count': backup_count, 'compress': compress}
+    writer = _get_writer(log_file_path, queue_size, overflow, rotation, json_format)
+    if not any(isinstance(h, _BoundedQueueHandler) and h.writer is writer for h in logger.handlers):
+        logger.addHandler(_BoundedQueueHandler(writer))
     return logger
+
+
+def logging_stats():
+    """Returns the counters of every log writer, keyed by file path."""
+    with _writers_lock:
+        return {path: writer.stats() for path, writer in _writers.items()}
+
+
+def shutdown_logging():
+    """Drains and stops every log writer and waits for pending compressions. Registered to run at interpreter exit."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.stop()
+    _compressor.wait()
+
+
+atexit.register(shutdown_logging)
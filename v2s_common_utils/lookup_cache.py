@@ -0,0 +1,176 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+
+from v2s_common_utils.metrics import CACHE_REQUESTS
+
+MISSING = object()
+
+
+class LookupCache:
+    """
+    Thread-safe LRU cache of attribute value -> ID lookups, with a time-to-live.
+
+    A cached ID of None records that no row has the value. Such misses are kept for
+    negative_ttl seconds only, as a row created by another process sends no signal here
+    and would otherwise stay unresolvable for the full ttl. Entries are grouped by
+    model. The first time a model is cached, the cache connects
+    to its post_save and post_delete signals, and any save or delete of that model
+    drops all of its entries at once: each model carries a generation number that is
+    bumped, and entries from an older generation are treated as misses. The generation
+    is bumped when the signal fires and again when the transaction commits, so rows
+    cached by other requests while the write was uncommitted are dropped too.
+
+    To cache the result of a query, read generation() before running it and pass it to
+    set() or set_many(). If the model changed in between, the result is not stored.
+
+    The cache is per process. Changes that do not send signals, such as
+    QuerySet.update() or writes from another process, are picked up when the entries
+    expire after ttl seconds.
+
+    Args:
+        maxsize (int, optional): The maximum number of entries kept. Default is 4096.
+        ttl (float, optional): Seconds an entry stays valid. Default is 300.0.
+        negative_ttl (float, optional): Seconds a miss (an ID of None) stays valid. 0 does
+            not cache misses. Default is 5.0.
+        name (str, optional): The cache label in the v2s_cache_requests_total metric. Default is 'lookup'.
+
+    Methods:
+        get(model, attribute, value): Returns the cached ID or MISSING.
+        generation(model): Returns the model's generation, to pass to set() or set_many().
+        set(model, attribute, value, obj_id, generation): Stores one lookup.
+        set_many(model, attribute, ids_by_value, generation): Stores several lookups.
+        invalidate_model(model): Drops every entry for a model.
+        clear(): Drops every entry.
+        stats(): Returns hit, miss and eviction counters.
+
+    Example:
+        ENDPOINT_IDS = LookupCache(maxsize=1024, ttl=60)
+        endpoint_id = ENDPOINT_IDS.get(Endpoint, 'name', name)
+        if endpoint_id is MISSING:
+            generation = ENDPOINT_IDS.generation(Endpoint)
+            endpoint_id = Endpoint.objects.filter(name=name).values_list('pk', flat=True).first()
+            if endpoint_id is not None:
+                ENDPOINT_IDS.set(Endpoint, 'name', name, endpoint_id, generation)
+    """
+
+    def __init__(self, maxsize=4096, ttl=300.0, name='lookup', negative_ttl=5.0):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _watch(self, model):
+        """Connects the invalidation signals for a model. Caller holds the lock."""
+        if model in self._generations:
+            return
+        self._generations[model] = 0
+        uid = f'v2s-lookup-cache-{id(self)}-{model._meta.label}'
+        post_save.connect(self._on_change, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(self._on_change, sender=model, weak=False, dispatch_uid=uid)
+
+    def _on_change(self, sender, using=None, **kwargs):
+        self.invalidate_model(sender)
+        # post_save fires before the transaction commits. Until then other requests
+        # still read the old rows and may cache them, so drop the entries again at commit.
+        transaction.on_commit(lambda: self.invalidate_model(sender), using=using)
+
+    def generation(self, model):
+        """Returns the model's current generation. Read it before querying the values to cache."""
+        with self._lock:
+            self._watch(model)
+            return self._generations[model]
+
+    def get(self, model, attribute, value):
+        """Returns the cached ID (or None) for a value, or MISSING if it is not cached or stale."""
+        key = (model, attribute, value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                obj_id, generation, expires_at = entry
+                if generation == self._generations.get(model) and expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    CACHE_REQUESTS.inc(cache=self.name, result='hit')
+                    return obj_id
+                del self._entries[key]
+            self._misses += 1
+        CACHE_REQUESTS.inc(cache=self.name, result='miss')
+        return MISSING
+
+    def set(self, model, attribute, value, obj_id, generation=None):
+        """Stores the ID for a value. See set_many()."""
+        self.set_many(model, attribute, {value: obj_id}, generation)
+
+    def set_many(self, model, attribute, ids_by_value, generation=None):
+        """
+        Stores the IDs of several values of one attribute. Values with an ID of None
+        expire after negative_ttl seconds, or are not stored if it is 0.
+
+        Args:
+            generation (int, optional): The generation() read before the IDs were queried.
+                If the model has changed since, nothing is stored. None stores the IDs
+                under the current generation.
+        """
+        now = time.monotonic()
+        expires_at = now + self.ttl
+        miss_expires_at = now + self.negative_ttl
+        with self._lock:
+            self._watch(model)
+            if generation is None:
+                generation = self._generations[model]
+            elif generation != self._generations[model]:
+                return
+            for value, obj_id in ids_by_value.items():
+                key = (model, attribute, value)
+                if obj_id is None:
+                    if self.negative_ttl <= 0:
+                        self._entries.pop(key, None)
+                        continue
+                    self._entries[key] = (None, generation, miss_expires_at)
+                else:
+                    self._entries[key] = (obj_id, generation, expires_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate_model(self, model):
+        """Drops every entry for a model. Stale entries are removed lazily as they are read or evicted."""
+        with self._lock:
+            if model in self._generations:
+                self._generations[model] += 1
+
+    def clear(self):
+        """Drops every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Returns a snapshot of the cache's counters.
+
+        Returns:
+            dict: size, maxsize, hits, misses and evictions.
+        """
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+            }
+
+
+# Shared by the placeholder decorators unless they are given their own cache.
+default_lookup_cache = LookupCache()
@@ -0,0 +1,47 @@
+import glob
+import io
+import os
+import pstats
+
+from django.core.management.base import BaseCommand, CommandError
+
+from v2s_common_utils.profiling import get_profiling_settings
+
+
+class Command(BaseCommand):
+    help = "Aggregates the profiles in the profiling spool into a top-functions report."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dir', help="The spool directory. Defaults to V2S_PROFILING['SPOOL_DIR'].")
+        parser.add_argument('--match', default='', help="Only include profiles whose file name contains this text.")
+        parser.add_argument('--sort', default='cumulative', help="pstats sort key, such as cumulative, tottime or ncalls.")
+        parser.add_argument('--limit', type=int, default=30, help="The number of functions to show.")
+
+    def handle(self, *args, **options):
+        spool_dir = options['dir'] or get_profiling_settings()['SPOOL_DIR']
+        files = sorted(f for f in glob.glob(os.path.join(spool_dir, '*.prof'))
+                       if options['match'] in os.path.basename(f))
+        if not files:
+            raise CommandError(f"No profiles found in {spool_dir}.")
+
+        report = io.StringIO()
+        stats = None
+        loaded = 0
+        for file_path in files:
+            try:
+                if stats is None:
+                    stats = pstats.Stats(file_path, stream=report)
+                else:
+                    stats.add(file_path)
+            except (OSError, EOFError, TypeError, ValueError) as e:
+                self.stderr.write(f"Skipping {file_path}: {e}")
+                continue
+            loaded += 1
+        if stats is None:
+            raise CommandError(f"No readable profiles found in {spool_dir}.")
+        try:
+            stats.strip_dirs().sort_stats(options['sort']).print_stats(options['limit'])
+        except KeyError:
+            raise CommandError(f"Unknown sort key '{options['sort']}'.")
+        self.stdout.write(f"{loaded} profiles from {spool_dir}")
+        self.stdout.write(report.getvalue())
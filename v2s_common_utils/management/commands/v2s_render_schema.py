@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from v2s_common_utils.schema_cache import CODECS
+
+
+class Command(BaseCommand):
+    help = "Renders the OpenAPI schema of swagger.schema_cache to V2S_SCHEMA_CACHE_DIR."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--urlconf', action='append', dest='urlconfs',
+                            help="A URLconf module to render. Repeat for several API versions. Defaults to ROOT_URLCONF.")
+        parser.add_argument('--format', action='append', dest='formats', choices=sorted(CODECS),
+                            help="A format to render. Defaults to all formats.")
+
+    def handle(self, *args, **options):
+        from v2s_common_utils.swagger import schema_cache
+
+        formats = tuple(options['formats'] or CODECS)
+        for urlconf in options['urlconfs'] or [None]:
+            try:
+                paths = schema_cache.render_to_disk(urlconf, formats)
+            except ValueError as e:
+                raise CommandError(str(e))
+            for path in paths:
+                self.stdout.write(f"Wrote {path}")
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from v2s_common_utils.warmup import WARMUP, get_warmup_settings, run_warmup
+
+
+class Command(BaseCommand):
+    help = "Runs the startup warm-up steps and prints how long each one took."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--step', action='append', dest='steps', choices=WARMUP.names(),
+                            help="A registered step to run. Repeat for several. Defaults to V2S_WARMUP['STEPS'].")
+        parser.add_argument('--timeout', type=float,
+                            help="Seconds after which no step is started. Defaults to V2S_WARMUP['TIMEOUT'].")
+
+    def handle(self, *args, **options):
+        config = {**get_warmup_settings(), 'BACKGROUND': False}
+        if options['steps']:
+            config['STEPS'] = options['steps']
+        if options['timeout'] is not None:
+            config['TIMEOUT'] = options['timeout']
+        results = run_warmup(config)
+        if results is None:
+            self.stderr.write(f"Warm-up did not finish within {config['TIMEOUT']} s.")
+            return
+        for result in results:
+            line = f"{result.name:<30} {result.status:<8} {result.duration_ms:10.1f} ms"
+            if result.error is not None:
+                line += f"  {result.error}"
+            self.stdout.write(line)
+        self.stdout.write(f"{'total':<30} {'':<8} {sum(r.duration_ms for r in results):10.1f} ms")
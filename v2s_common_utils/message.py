@@ -35,6 +35,7 @@ STATUS_MESSAGES = {
     403: "You are not allowed to perform this action.",
     404: "{} Not found with id {}",
     500: "Internal Server Error",
+    503: "Service is busy. Please try again shortly.",
 }
 
 
@@ -54,4 +55,7 @@ LOGGER_MSG = {
     'DELETE_FAILED': 'Unable to delete {}.',
     "DATA": "{} data retrieved successfully.",
     "DATA_NOT_FOUND": "No {} data found.",
+    "REQUEST_TIMING": "{} {} completed in {} ms.",
+    "WARMUP_STEP": "Warm-up step {} {} in {} ms.",
+    "WARMUP_DONE": "Warm-up finished in {} ms: {}.",
 }
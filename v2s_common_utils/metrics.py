@@ -0,0 +1,462 @@
+import atexit
+import bisect
+import glob
+import json
+import os
+import tempfile
+import threading
+import time
+from functools import wraps
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+GAUGE_MODES = ('sum', 'max', 'min', 'livesum')
+
+
+class _Metric:
+    type_name = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}.")
+
+    def clear(self):
+        """Drops every recorded value."""
+        with self._lock:
+            self._values.clear()
+
+    def snapshot(self):
+        """Returns the metric's description and values as a JSON-serializable dict."""
+        with self._lock:
+            samples = [[list(key), self._copy(value)] for key, value in self._values.items()]
+        return {'type': self.type_name, 'help': self.documentation, 'labelnames': list(self.labelnames),
+                'samples': samples}
+
+    @staticmethod
+    def _copy(value):
+        return value
+
+
+class Counter(_Metric):
+    """
+    A value that only goes up, such as a number of requests.
+
+    Example:
+        REQUESTS = REGISTRY.counter('myapp_requests_total', 'Requests handled.', ['view'])
+        REQUESTS.inc(view='user_list')
+    """
+
+    type_name = 'counter'
+
+    def inc(self, amount=1, **labels):
+        """Adds amount to the counter for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """
+    A value that can go up and down, such as a queue depth.
+
+    Args:
+        multiprocess_mode (str, optional): How values from several processes are combined:
+            'sum', 'max', 'min', or 'livesum' (sum over processes that are still running).
+            Default is 'livesum'.
+    """
+
+    type_name = 'gauge'
+
+    def __init__(self, name, documentation, labelnames=(), multiprocess_mode='livesum'):
+        if multiprocess_mode not in GAUGE_MODES:
+            raise ValueError(f"multiprocess_mode must be one of {GAUGE_MODES}.")
+        super().__init__(name, documentation, labelnames)
+        self.multiprocess_mode = multiprocess_mode
+
+    def set(self, value, **labels):
+        """Sets the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount=1, **labels):
+        """Adds amount to the gauge for the given labels."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        """Subtracts amount from the gauge for the given labels."""
+        self.inc(-amount, **labels)
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        snapshot['multiprocess_mode'] = self.multiprocess_mode
+        return snapshot
+
+
+class _Timer:
+    """Observes elapsed seconds into a histogram, as a context manager or a decorator."""
+
+    __slots__ = ('histogram', 'labels', '_started')
+
+    def __init__(self, histogram, labels):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self._started, **self.labels)
+        return False
+
+    def __call__(self, func):
+        histogram, labels = self.histogram, self.labels
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started, **labels)
+        return wrapper
+
+
+class Histogram(_Metric):
+    """
+    Counts observations, such as latencies, in fixed buckets.
+
+    Args:
+        buckets (tuple, optional): Upper bounds of the buckets, in increasing order. +Inf
+            is added automatically. Default is DEFAULT_BUCKETS (seconds).
+
+    Example:
+        LATENCY = REGISTRY.histogram('myapp_report_seconds', 'Report build time.', ['report'])
+
+        with LATENCY.time(report='daily'):
+            build_daily_report()
+    """
+
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(float(b) for b in buckets)
+
+    def observe(self, value, **labels):
+        """Records one observation for the given labels."""
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def time(self, **labels):
+        """Returns a context manager and decorator that observes elapsed seconds."""
+        return _Timer(self, labels)
+
+    @staticmethod
+    def _copy(value):
+        return [list(value[0]), value[1], value[2]]
+
+    def snapshot(self):
+        snapshot = super().snapshot()
+        snapshot['buckets'] = list(self.buckets)
+        return snapshot
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(labelnames, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+def render_prometheus(snapshots):
+    """
+    Renders metric snapshots in the Prometheus text exposition format (version 0.0.4).
+
+    Args:
+        snapshots (dict): Metric name -> snapshot, as returned by MetricsRegistry.collect().
+
+    Returns:
+        str: The exposition text.
+    """
+    lines = []
+    for name, metric in sorted(snapshots.items()):
+        labelnames = metric['labelnames']
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for labels, value in sorted(metric['samples']):
+            if metric['type'] != 'histogram':
+                lines.append(f'{name}{_format_labels(labelnames, labels)} {_format_value(value)}')
+                continue
+            bucket_counts, total, count = value
+            cumulative = 0
+            for bound, bucket_count in zip(metric['buckets'] + [float('inf')], bucket_counts):
+                cumulative += bucket_count
+                le = _format_value(bound)
+                lines.append(f'{name}_bucket{_format_labels(labelnames, labels, [("le", le)])} {cumulative}')
+            lines.append(f'{name}_sum{_format_labels(labelnames, labels)} {_format_value(total)}')
+            lines.append(f'{name}_count{_format_labels(labelnames, labels)} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+def _process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def merge_snapshots(snapshots_by_pid):
+    """
+    Combines the snapshots of several processes.
+
+    Counters and histograms are summed. Gauges are combined by their multiprocess_mode.
+
+    Args:
+        snapshots_by_pid (dict): Process ID -> {metric name -> snapshot}.
+
+    Returns:
+        dict: Metric name -> combined snapshot.
+    """
+    merged = {}
+    for pid, snapshots in snapshots_by_pid.items():
+        for name, metric in snapshots.items():
+            target = merged.get(name)
+            if target is None:
+                target = merged[name] = {**metric, 'samples': {}}
+            mode = metric.get('multiprocess_mode')
+            if mode == 'livesum' and not _process_alive(pid):
+                continue
+            samples = target['samples']
+            for labels, value in metric['samples']:
+                key = tuple(labels)
+                current = samples.get(key)
+                if current is None:
+                    samples[key] = value
+                elif metric['type'] == 'histogram':
+                    samples[key] = [[a + b for a, b in zip(current[0], value[0])],
+                                    current[1] + value[1], current[2] + value[2]]
+                elif mode == 'max':
+                    samples[key] = max(current, value)
+                elif mode == 'min':
+                    samples[key] = min(current, value)
+                else:
+                    samples[key] = current + value
+    for metric in merged.values():
+        metric['samples'] = [[list(key), value] for key, value in metric['samples'].items()]
+    return merged
+
+
+class MetricsRegistry:
+    """
+    Thread-safe, in-process registry of counters, gauges and histograms.
+
+    Metrics are created with counter(), gauge() and histogram(); asking again for an
+    existing name returns the same metric. render() returns every metric in Prometheus
+    text format, see metrics_view.
+
+    With several worker processes, call enable_multiprocess() with a directory shared by
+    the workers (or set the V2S_METRICS_DIR environment variable before import). Each
+    process then writes a snapshot of its metrics to '<directory>/metrics-<pid>.json'
+    every flush_interval seconds and at exit, and render() combines all the snapshots in
+    the directory. Empty the directory when the application is deployed, as counters of
+    stopped processes are kept.
+
+    Methods:
+        counter(name, documentation, labelnames): Returns a Counter.
+        gauge(name, documentation, labelnames, multiprocess_mode): Returns a Gauge.
+        histogram(name, documentation, labelnames, buckets): Returns a Histogram.
+        collect(): Returns this process's metric snapshots.
+        render(): Returns the Prometheus text for this process or all processes.
+        enable_multiprocess(directory, flush_interval): Shares metrics through a directory.
+    """
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.directory = None
+        self.flush_interval = None
+        self._flusher = None
+        self._flusher_pid = None
+        self._stop = threading.Event()
+
+    def _register(self, metric_class, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = metric_class(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, metric_class) or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a different {metric.type_name}.")
+            return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter, name, documentation, labelnames)
+
+    def gauge(self, name, documentation, labelnames=(), multiprocess_mode='livesum'):
+        return self._register(Gauge, name, documentation, labelnames, multiprocess_mode=multiprocess_mode)
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def collect(self):
+        """Returns {metric name: snapshot} for this process."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {metric.name: metric.snapshot() for metric in metrics}
+
+    def clear(self):
+        """Drops every recorded value, keeping the metric definitions."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def enable_multiprocess(self, directory, flush_interval=5.0):
+        """Starts writing this process's snapshot to directory every flush_interval seconds."""
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self._start_flusher()
+
+    def _start_flusher(self):
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name='v2s-metrics-flusher', daemon=True)
+        self._flusher_pid = os.getpid()
+        self._flusher.start()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+    def flush(self):
+        """Writes this process's snapshot to the shared directory, if one is configured."""
+        if self.directory is None:
+            return
+        path = os.path.join(self.directory, f'metrics-{os.getpid()}.json')
+        # Scrapes and the flusher thread may flush at the same time. The lock orders them,
+        # and the unique temporary file keeps a writer from replacing another one's file.
+        with self._flush_lock:
+            fd, tmp_path = tempfile.mkstemp(prefix=f'.metrics-{os.getpid()}-', suffix='.tmp', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(self.collect(), f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+
+    def _after_fork_in_child(self):
+        # A forked worker starts with empty values, so the parent's counts are not reported twice.
+        # Locks are replaced rather than acquired, as another parent thread may have held them.
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        for metric in self._metrics.values():
+            metric._lock = threading.Lock()
+            metric._values = {}
+        if self.directory is not None:
+            self._start_flusher()
+
+    def render(self):
+        """Returns the Prometheus text for this process, or for every process sharing the directory."""
+        if self.directory is None:
+            return render_prometheus(self.collect())
+        self.flush()
+        snapshots_by_pid = {}
+        for path in glob.glob(os.path.join(self.directory, 'metrics-*.json')):
+            try:
+                pid = int(os.path.basename(path)[len('metrics-'):-len('.json')])
+                with open(path, encoding='utf-8') as f:
+                    snapshots_by_pid[pid] = json.load(f)
+            except (OSError, ValueError):
+                # A file being replaced or a stray name; it is picked up on the next scrape.
+                continue
+        return render_prometheus(merge_snapshots(snapshots_by_pid))
+
+    def shutdown(self):
+        """Stops the flusher and writes a last snapshot."""
+        self._stop.set()
+        if self._flusher_pid == os.getpid():
+            try:
+                self.flush()
+            except OSError:
+                pass
+
+
+REGISTRY = MetricsRegistry()
+
+if os.environ.get('V2S_METRICS_DIR'):
+    REGISTRY.enable_multiprocess(os.environ['V2S_METRICS_DIR'])
+
+atexit.register(REGISTRY.shutdown)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=REGISTRY._after_fork_in_child)
+
+
+def metrics_view(request):
+    """
+    A Django view that returns REGISTRY in Prometheus text format.
+
+    Example:
+        urlpatterns = [
+            path('metrics', metrics_view),
+        ]
+    """
+    from django.http import HttpResponse
+
+    return HttpResponse(REGISTRY.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+# Metrics recorded by the package itself.
+SERVICE_DURATION = REGISTRY.histogram(
+    'v2s_service_duration_seconds', 'Time spent in BaseService operations.', ['operation'])
+PAGINATION_COUNT_DURATION = REGISTRY.histogram(
+    'v2s_pagination_count_duration_seconds', 'Time spent in pagination count queries.')
+VALIDATION_RUNS = REGISTRY.counter(
+    'v2s_validation_runs_total', 'Validation runs, by result.', ['result'])
+VALIDATION_DURATION = REGISTRY.histogram(
+    'v2s_validation_duration_seconds', 'Time spent running validators.')
+CACHE_REQUESTS = REGISTRY.counter(
+    'v2s_cache_requests_total', 'Cache lookups, by cache and result.', ['cache', 'result'])
+HANDLED_EXCEPTIONS = REGISTRY.counter(
+    'v2s_handled_exceptions_total', 'Exceptions turned into responses by handle_exception.',
+    ['exception', 'status'])
@@ -2,6 +2,19 @@ from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
 from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from v2s_common_utils.metrics import PAGINATION_COUNT_DURATION
+from v2s_common_utils.timing import timed
+
+
+class InstrumentedPaginator(Paginator):
+    """Paginator that records the time of its count query in the package metrics."""
+
+    @cached_property
+    def count(self):
+        with PAGINATION_COUNT_DURATION.time(), timed('pagination.count'):
+            return super().count
 
 
 
@@ -11,9 +24,10 @@ class GenericPaginator:
 
     @staticmethod
     def paginate(queryset, serializer_class, page_number, page_size):
-        paginator = Paginator(queryset, page_size)
-        serialized_data = serializer_class(
-            paginator.page(page_number), many=True).data
+        paginator = InstrumentedPaginator(queryset, page_size)
+        with timed('serializer'):
+            serialized_data = serializer_class(
+                paginator.page(page_number), many=True).data
         return {"data": serialized_data, "count": paginator.count}
 
 
@@ -28,6 +42,7 @@ class CustomFilterPagination(PageNumberPagination):
     """
 
     page_size = 1
+    django_paginator_class = InstrumentedPaginator
 
     def get_paginated_response(self, data):
         """
@@ -0,0 +1,71 @@
+import re
+from functools import lru_cache
+
+
+class PatternRegistry:
+    """
+    Registry of compiled regular expressions.
+
+    Named patterns are compiled once when they are registered and kept for the life of
+    the process, so they are never evicted however many other patterns are in use.
+    Ad-hoc pattern strings are compiled on first use and kept in a bounded LRU cache of
+    adhoc_maxsize entries, so callers that build patterns dynamically do not grow memory
+    without limit.
+
+    Args:
+        adhoc_maxsize (int, optional): The number of ad-hoc patterns kept. Default is 1024.
+
+    Methods:
+        register(name, pattern, flags): Compiles and stores a named pattern.
+        get(name): Returns a named compiled pattern.
+        compile(pattern, flags): Returns a compiled pattern for a string, LRU-cached by (pattern, flags).
+
+    Example:
+        PATTERNS.register('pan_number', r'[A-Z]{5}[0-9]{4}[A-Z]')
+        if PATTERNS.get('pan_number').fullmatch(value):
+            ...
+    """
+
+    def __init__(self, adhoc_maxsize=1024):
+        self._named = {}
+        self._compile_adhoc = lru_cache(maxsize=adhoc_maxsize)(re.compile)
+
+    def register(self, name, pattern, flags=0):
+        """Compiles a pattern, stores it under the given name and returns it."""
+        compiled = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+        self._named[name] = compiled
+        return compiled
+
+    def get(self, name):
+        """
+        Returns a named compiled pattern.
+
+        Raises:
+            KeyError: If no pattern is registered under the name.
+        """
+        try:
+            return self._named[name]
+        except KeyError:
+            raise KeyError(f"No regex pattern registered under '{name}'.")
+
+    def names(self):
+        """Returns the names of all registered patterns."""
+        return list(self._named)
+
+    def compile(self, pattern, flags=0):
+        """Returns the compiled form of a pattern string. Compiled patterns are returned as is."""
+        if isinstance(pattern, re.Pattern):
+            return pattern
+        return self._compile_adhoc(pattern, flags)
+
+
+PATTERNS = PatternRegistry()
+
+# Named patterns used by the validators. They are matched with fullmatch(), so they
+# carry no ^/$ anchors.
+ALPHANUMERIC = PATTERNS.register('alphanumeric', r'[A-Za-z0-9]+')
+ALPHANUMERIC_WITH_WHITESPACE = PATTERNS.register('alphanumeric_with_whitespace', r'[\w\s]+')
+DIGITS_ONLY = PATTERNS.register('digits_only', r'\d+')
+MOBILE_NUMBER = PATTERNS.register('mobile_number', r'\+\d{1,3}\s?\(\d{1,4}\)\s?\d{6,}')
+EMAIL = PATTERNS.register('email', r'[\w.%+-]+@[\w.-]+\.[a-zA-Z]{2,4}')
+SPECIFIC_SPECIAL_CHARACTERS = PATTERNS.register('specific_special_characters', r'[\w\s.,]+')
@@ -0,0 +1,219 @@
+import cProfile
+import itertools
+import logging
+import os
+import re
+import threading
+import time
+from functools import wraps
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROFILING_SETTINGS = {
+    # Profile one request in SAMPLE_EVERY. 0 profiles only requests with a valid header.
+    'SAMPLE_EVERY': 0,
+    # Request header that asks for a profile. Its value must come from make_profile_token().
+    'HEADER': 'X-V2S-Profile',
+    # Seconds a profile token stays valid.
+    'TOKEN_MAX_AGE': 3600,
+    # Directory the .prof files are written to.
+    'SPOOL_DIR': 'profiles',
+    # The oldest files are deleted once the spool holds more than MAX_FILES or MAX_BYTES.
+    'MAX_FILES': 200,
+    'MAX_BYTES': 50 * 1024 * 1024,
+}
+
+_TOKEN_SALT = 'v2s_common_utils.profiling'
+_spool_lock = threading.Lock()
+_spool_sequence = itertools.count()
+
+
+def get_profiling_settings():
+    """Returns DEFAULT_PROFILING_SETTINGS updated with settings.V2S_PROFILING."""
+    from django.conf import settings
+
+    return {**DEFAULT_PROFILING_SETTINGS, **getattr(settings, 'V2S_PROFILING', {})}
+
+
+def make_profile_token(label='manual'):
+    """
+    Returns a value for the profiling header, signed with SECRET_KEY.
+
+    Args:
+        label (str, optional): A note stored in the token, such as who asked for the profile.
+
+    Example:
+        curl -H "X-V2S-Profile: $(python manage.py shell -c 'from v2s_common_utils.profiling import make_profile_token; print(make_profile_token())')" ...
+    """
+    from django.core import signing
+
+    return signing.dumps(label, salt=_TOKEN_SALT)
+
+
+def _valid_token(token, max_age):
+    from django.core import signing
+
+    try:
+        signing.loads(token, salt=_TOKEN_SALT, max_age=max_age)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+def prune_spool(spool_dir, max_files, max_bytes):
+    """Deletes the oldest .prof files until the spool is within max_files and max_bytes."""
+    entries = []
+    for entry in os.scandir(spool_dir):
+        if entry.name.endswith('.prof'):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                # Another worker pruned it first.
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    while entries and (len(entries) > max_files or total > max_bytes):
+        _, size, path = entries.pop(0)
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def _spool_path(spool_dir, label, elapsed_ms):
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', label).strip('_')[:80] or 'root'
+    stamp = time.strftime('%Y%m%d-%H%M%S')
+    return os.path.join(spool_dir, f'{stamp}-{os.getpid()}-{next(_spool_sequence)}-{elapsed_ms:.0f}ms-{slug}.prof')
+
+
+def profile_call(label, func, *args, **kwargs):
+    """
+    Runs func under cProfile and writes the stats to the spool.
+
+    Only one profiler can run in a process at a time on recent Python versions, so if
+    another profile is in progress func just runs unprofiled.
+
+    Args:
+        label (str): Describes the call, for example 'GET /api/users'. Used in the file name.
+        func (callable): The function to run.
+
+    Returns:
+        tuple: func's result and the path of the written file, or None if it was not profiled.
+    """
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        return func(*args, **kwargs), None
+    started = time.perf_counter()
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        profiler.disable()
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    config = get_profiling_settings()
+    spool_dir = config['SPOOL_DIR']
+    try:
+        os.makedirs(spool_dir, exist_ok=True)
+        path = _spool_path(spool_dir, label, elapsed_ms)
+        profiler.dump_stats(path)
+        with _spool_lock:
+            prune_spool(spool_dir, config['MAX_FILES'], config['MAX_BYTES'])
+    except OSError as e:
+        logger.error("Could not write profile for %s: %s", label, e)
+        return result, None
+    return result, path
+
+
+class _Sampler:
+    """Decides which calls are profiled: one in every N, or any with a valid header token."""
+
+    def __init__(self, every, header, token_max_age):
+        self.every = every
+        self.meta_key = 'HTTP_' + header.upper().replace('-', '_')
+        self.token_max_age = token_max_age
+        self._counter = itertools.count(1)
+
+    def wanted(self, request):
+        token = request.META.get(self.meta_key)
+        if token is not None and _valid_token(token, self.token_max_age):
+            return True
+        return bool(self.every) and next(self._counter) % self.every == 0
+
+
+def _sampler_from_settings(every=None):
+    config = get_profiling_settings()
+    return _Sampler(config['SAMPLE_EVERY'] if every is None else every, config['HEADER'], config['TOKEN_MAX_AGE'])
+
+
+class ProfilingMiddleware:
+    """
+    Middleware that profiles sampled requests with cProfile.
+
+    One request in SAMPLE_EVERY is profiled, plus any request whose profiling header holds
+    a token from make_profile_token(). Profiles are written as pstats files to SPOOL_DIR,
+    which is kept within MAX_FILES and MAX_BYTES, and the file name is returned in an
+    X-V2S-Profile-File response header. Run `python manage.py v2s_profile_report` to see
+    the top functions across the spool; the command needs 'v2s_common_utils' in
+    INSTALLED_APPS.
+
+    Configured with settings.V2S_PROFILING (see DEFAULT_PROFILING_SETTINGS). Requests that
+    are not sampled cost a counter increment and a header lookup.
+
+    Example:
+        MIDDLEWARE = [
+            ...
+            'v2s_common_utils.profiling.ProfilingMiddleware',
+        ]
+        V2S_PROFILING = {'SAMPLE_EVERY': 1000, 'SPOOL_DIR': '/var/tmp/profiles'}
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sampler = _sampler_from_settings()
+
+    def __call__(self, request):
+        if not self.sampler.wanted(request):
+            return self.get_response(request)
+        response, path = profile_call(f'{request.method} {request.path}', self.get_response, request)
+        if path is not None:
+            response['X-V2S-Profile-File'] = os.path.basename(path)
+        return response
+
+
+def profile_view(every=None):
+    """
+    A decorator that profiles sampled calls of one view, like ProfilingMiddleware.
+
+    Args:
+        every (int, optional): Profile one call in every. Defaults to the SAMPLE_EVERY setting.
+
+    Returns:
+        function: A decorator function.
+
+    Example:
+        class ReportView(APIView):
+            @profile_view(every=50)
+            def get(self, request):
+                ...
+    """
+    def decorator(view_func):
+        sampler = None
+
+        @wraps(view_func)
+        def _wrapped_view(self, request, *args, **kwargs):
+            nonlocal sampler
+            if sampler is None:
+                sampler = _sampler_from_settings(every)
+            if not sampler.wanted(request):
+                return view_func(self, request, *args, **kwargs)
+            label = f'{request.method} {view_func.__qualname__}'
+            response, path = profile_call(label, view_func, self, request, *args, **kwargs)
+            if path is not None:
+                response['X-V2S-Profile-File'] = os.path.basename(path)
+            return response
+        return _wrapped_view
+    return decorator
@@ -0,0 +1,286 @@
+import hashlib
+import logging
+import os
+import threading
+import time
+import weakref
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from drf_yasg.codecs import OpenAPICodecJson, OpenAPICodecYaml
+from drf_yasg.generators import OpenAPISchemaGenerator
+
+logger = logging.getLogger(__name__)
+
+CODECS = {
+    'json': (OpenAPICodecJson, 'application/json'),
+    'yaml': (OpenAPICodecYaml, 'application/yaml'),
+}
+
+_urlconf_hashes = {}
+_schema_caches = weakref.WeakSet()
+
+
+def _walk_patterns(patterns, prefix, out):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            _walk_patterns(pattern.url_patterns, prefix + str(pattern.pattern), out)
+        elif isinstance(pattern, URLPattern):
+            callback = pattern.callback
+            view = getattr(callback, 'cls', None) or getattr(callback, 'view_class', None) or callback
+            out.append(f'{prefix}{pattern.pattern} {view.__module__}.{view.__qualname__}')
+
+
+def urlconf_hash(urlconf=None):
+    """
+    Returns a short hash of a URLconf's routes and the views they point to.
+
+    The hash changes when a route is added, removed or re-pointed, so it separates the
+    schemas of different API versions and invalidates schema files written for an older
+    URLconf. It is computed once per URLconf per process.
+    """
+    urlconf = urlconf or settings.ROOT_URLCONF
+    digest = _urlconf_hashes.get(urlconf)
+    if digest is None:
+        routes = []
+        _walk_patterns(get_resolver(urlconf).url_patterns, '', routes)
+        digest = _urlconf_hashes[urlconf] = hashlib.sha1('\n'.join(routes).encode('utf-8')).hexdigest()[:12]
+    return digest
+
+
+class CachedSchemaGenerator(OpenAPISchemaGenerator):
+    """
+    Schema generator that builds each public schema once per process.
+
+    Public schemas do not depend on the user, so the generated Swagger object is kept per
+    URLconf, version and configured API URL, and later requests skip the introspection of
+    every view. The schema is built without the request, so the Host header cannot add
+    cache entries: the host and scheme come from the url given to get_schema_view (or
+    SWAGGER_SETTINGS['DEFAULT_API_URL']), and without one they are left out and Swagger
+    UI uses the host the page was loaded from. Non-public schemas, and generators given
+    explicit patterns, are built as usual.
+
+    Example:
+        schema_view = get_schema_view(info, public=True, generator_class=CachedSchemaGenerator)
+    """
+
+    _schemas = {}
+    _lock = threading.Lock()
+
+    def get_schema(self, request=None, public=False):
+        if not public or self._gen.patterns is not None:
+            return super().get_schema(request, public)
+        key = (type(self), self._gen.urlconf or settings.ROOT_URLCONF, self.version, self._gen.url)
+        schema = self._schemas.get(key)
+        if schema is None:
+            with self._lock:
+                schema = self._schemas.get(key)
+                if schema is None:
+                    schema = self._schemas[key] = super().get_schema(None, public)
+        return schema
+
+
+class RenderedSchema:
+    """An encoded schema document with its validators for conditional requests."""
+
+    __slots__ = ('content', 'content_type', 'etag', 'last_modified')
+
+    def __init__(self, content, content_type, last_modified):
+        self.content = content
+        self.content_type = content_type
+        self.etag = quote_etag(hashlib.sha1(content).hexdigest()[:20])
+        self.last_modified = int(last_modified)
+
+
+class SchemaCache:
+    """
+    Renders the public OpenAPI schema once and serves it from memory.
+
+    get() returns the encoded schema for a URLconf and format. It is looked up in memory,
+    then in cache_dir, and only rendered (by introspecting every view) when neither has
+    it. Rendered schemas are written to cache_dir, so the other workers of a deploy, and
+    restarts, read the file instead of rendering again. Files are named by the URLconf
+    hash and the release, so routes from another version are never served.
+
+    The file name cannot see changes to serializers, so set release to something that
+    changes with every deploy (a version or commit id), or run
+    `python manage.py v2s_render_schema` as part of the deploy to overwrite the files.
+
+    Args:
+        info (openapi.Info): The API information, as for get_schema_view.
+        version (str, optional): The API version passed to the generator.
+        url (str, optional): The API base URL. None leaves the host out of the schema, so
+            Swagger UI uses the host the page was loaded from.
+        cache_dir (str, optional): Where rendered schemas are written. None keeps them in
+            memory only. Defaults to settings.V2S_SCHEMA_CACHE_DIR.
+        release (str, optional): Part of the file names. Defaults to settings.V2S_RELEASE.
+
+    Methods:
+        get(fmt, urlconf): Returns a RenderedSchema.
+        render_to_disk(urlconf, formats): Renders and writes schemas, replacing existing files.
+        warm(urlconfs, background): Loads or renders schemas ahead of the first request.
+        view: A Django view serving the schema with ETag and Last-Modified.
+
+    Example:
+        urlpatterns = [
+            re_path(r'^swagger\\.(?P<fmt>json|yaml)$', schema_cache.view),
+            path('swagger/', schema_view.with_ui('swagger', cache_timeout=0)),
+        ]
+    """
+
+    def __init__(self, info, version='', url=None, cache_dir=None, release=None):
+        self.info = info
+        self.version = version
+        self.url = url
+        self._cache_dir = cache_dir
+        self._release = release
+        self._schemas = {}
+        self._lock = threading.Lock()
+        _schema_caches.add(self)
+
+    @property
+    def cache_dir(self):
+        return self._cache_dir or getattr(settings, 'V2S_SCHEMA_CACHE_DIR', None)
+
+    @property
+    def release(self):
+        return self._release or getattr(settings, 'V2S_RELEASE', '') or ''
+
+    def _file_path(self, urlconf, fmt):
+        release = f'-{self.release}' if self.release else ''
+        name = f'openapi-{urlconf.replace(".", "_")}-{urlconf_hash(urlconf)}{release}.{fmt}'
+        return os.path.join(self.cache_dir, name)
+
+    def _render(self, urlconf, fmt):
+        codec_class, content_type = CODECS[fmt]
+        started = time.perf_counter()
+        generator = OpenAPISchemaGenerator(self.info, self.version, self.url, urlconf=urlconf)
+        schema = generator.get_schema(request=None, public=True)
+        content = codec_class(validators=[]).encode(schema)
+        logger.info("Rendered the %s OpenAPI schema for %s in %.0f ms", fmt, urlconf,
+                    (time.perf_counter() - started) * 1000)
+        return RenderedSchema(content, content_type, time.time())
+
+    def _read(self, urlconf, fmt):
+        if not self.cache_dir:
+            return None
+        path = self._file_path(urlconf, fmt)
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+            last_modified = os.stat(path).st_mtime
+        except OSError:
+            return None
+        return RenderedSchema(content, CODECS[fmt][1], last_modified)
+
+    def _write(self, urlconf, fmt, rendered):
+        path = self._file_path(urlconf, fmt)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(rendered.content)
+        os.replace(tmp_path, path)
+        return path
+
+    def get(self, fmt='json', urlconf=None):
+        """
+        Returns the encoded schema, rendering it only if it is not cached.
+
+        Args:
+            fmt (str, optional): 'json' or 'yaml'. Default is 'json'.
+            urlconf (str, optional): The URLconf module. Defaults to settings.ROOT_URLCONF.
+
+        Returns:
+            RenderedSchema: The schema.
+        """
+        urlconf = urlconf or settings.ROOT_URLCONF
+        key = (urlconf, fmt)
+        rendered = self._schemas.get(key)
+        if rendered is not None:
+            return rendered
+        with self._lock:
+            rendered = self._schemas.get(key)
+            if rendered is None:
+                rendered = self._read(urlconf, fmt)
+                if rendered is None:
+                    rendered = self._render(urlconf, fmt)
+                    if self.cache_dir:
+                        try:
+                            self._write(urlconf, fmt, rendered)
+                        except OSError as e:
+                            logger.warning("Could not write the OpenAPI schema cache: %s", e)
+                self._schemas[key] = rendered
+        return rendered
+
+    def render_to_disk(self, urlconf=None, formats=tuple(CODECS)):
+        """
+        Renders the schema in each format, writes it to cache_dir and keeps it in memory.
+
+        Returns:
+            list: The paths written.
+        """
+        if not self.cache_dir:
+            raise ValueError("Set V2S_SCHEMA_CACHE_DIR or pass cache_dir to write schemas to disk.")
+        urlconf = urlconf or settings.ROOT_URLCONF
+        paths = []
+        for fmt in formats:
+            rendered = self._render(urlconf, fmt)
+            paths.append(self._write(urlconf, fmt, rendered))
+            with self._lock:
+                self._schemas[(urlconf, fmt)] = rendered
+        return paths
+
+    def warm(self, urlconfs=None, formats=('json',), background=False):
+        """
+        Loads or renders schemas ahead of the first request.
+
+        Args:
+            urlconfs (list, optional): The URLconf modules. Defaults to [settings.ROOT_URLCONF].
+            formats (tuple, optional): The formats to prepare. Default is ('json',).
+            background (bool, optional): Render in a daemon thread instead of blocking. Default is False.
+        """
+        def run():
+            for urlconf in urlconfs or [settings.ROOT_URLCONF]:
+                for fmt in formats:
+                    try:
+                        self.get(fmt, urlconf)
+                    except Exception:
+                        logger.exception("Could not warm the %s OpenAPI schema for %s", fmt, urlconf)
+
+        if background:
+            threading.Thread(target=run, name='v2s-schema-warmup', daemon=True).start()
+        else:
+            run()
+
+    def view(self, request, fmt='json', urlconf=None):
+        """
+        A Django view returning the cached schema.
+
+        Responds 304 Not Modified when the request's If-None-Match or If-Modified-Since
+        matches. Browsers are told to revalidate on every use, which costs a 304.
+        """
+        if fmt not in CODECS:
+            return HttpResponse(status=404)
+        rendered = self.get(fmt, urlconf or getattr(request, 'urlconf', None))
+        response = get_conditional_response(request, etag=rendered.etag, last_modified=rendered.last_modified)
+        if response is None:
+            response = HttpResponse(rendered.content, content_type=rendered.content_type)
+        response['ETag'] = rendered.etag
+        response['Last-Modified'] = http_date(rendered.last_modified)
+        response['Cache-Control'] = 'no-cache'
+        return response
+
+
+def _after_fork_in_child():
+    # A worker forked while a schema was being rendered (gunicorn --preload with a
+    # background warm-up) would otherwise inherit locks that are never released.
+    CachedSchemaGenerator._lock = threading.Lock()
+    for schema_cache in list(_schema_caches):
+        schema_cache._lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
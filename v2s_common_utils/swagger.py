@@ -1,66 +1,145 @@
-from drf_yasg import openapi
+import os
+import threading
 
+# Nothing in this module is built at import time. The drf-yasg objects below are created
+# on first access through the module __getattr__, so importing the module (for example
+# from a management command that never serves the schema) does not load drf-yasg.
+# `from v2s_common_utils.swagger import schema_view` works as before.
 
-from rest_framework.permissions import AllowAny
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
+_lazy_lock = threading.RLock()
 
 
+def _api_info():
+    from drf_yasg import openapi
 
-schema_view = get_schema_view(
-    openapi.Info(
+    return openapi.Info(
         title="Your API Title",
         default_version='v1',
         description="Your API Description",
         terms_of_service="https://yourapi.com/terms/",
         contact=openapi.Contact(email="contact@yourapi.com"),
         license=openapi.License(name="Your License"),
-    ),
-    public=True,
-    permission_classes=(AllowAny,),
-)
+    )
 
 
+def _schema_view():
+    from drf_yasg.views import get_schema_view
+    from rest_framework.permissions import AllowAny
 
-# Define common responses
-common_responses = {
-    '401': openapi.Response('Authentication credentials were not provided.'),
-    '403': openapi.Response('Permission denied.'),
-    '500': openapi.Response('Internal Server Error', response_body=None),
-}
+    from v2s_common_utils.schema_cache import CachedSchemaGenerator
 
-# Define responses for create view
-create_responses = {
-    '400': openapi.Response('Validation error'),
-    **common_responses,
-}
+    # The public schema is generated once per process and URLconf instead of on every request.
+    return get_schema_view(
+        _lazy('API_INFO'),
+        public=True,
+        permission_classes=(AllowAny,),
+        generator_class=CachedSchemaGenerator,
+    )
 
-# Define responses for list view
-list_responses = {
-    '200': openapi.Response('Resources retrieved Successfully.'),
-    '204': openapi.Response('No Content'),
-    **common_responses,
-}
 
-# Define responses for retrieve view
-retrieve_responses = {
-    '400': openapi.Response('Validation error'),
-    '200': openapi.Response('Resource retrieved Successfully.'),
-    '404': openapi.Response('Resource not found.'),
-    **common_responses,
-}
+def _schema_cache():
+    from v2s_common_utils.schema_cache import SchemaCache
 
-# Define responses for update view
-update_responses = {
-    '200': openapi.Response('Resource updated Successfully.'),
-    '400': openapi.Response('Validation error'),
-    '404': openapi.Response('Resource not found.'),
-    **common_responses,
-}
+    # Pre-rendered schema documents with ETag/Last-Modified, see SchemaCache.
+    return SchemaCache(_lazy('API_INFO'))
+
+
+def _responses():
+    from drf_yasg import openapi
+
+    # Define common responses
+    common_responses = {
+        '401': openapi.Response('Authentication credentials were not provided.'),
+        '403': openapi.Response('Permission denied.'),
+        '500': openapi.Response('Internal Server Error', response_body=None),
+    }
+
+    # Define responses for create view
+    create_responses = {
+        '400': openapi.Response('Validation error'),
+        **common_responses,
+    }
+
+    # Define responses for list view
+    list_responses = {
+        '200': openapi.Response('Resources retrieved Successfully.'),
+        '204': openapi.Response('No Content'),
+        **common_responses,
+    }
+
+    # Define responses for retrieve view
+    retrieve_responses = {
+        '400': openapi.Response('Validation error'),
+        '200': openapi.Response('Resource retrieved Successfully.'),
+        '404': openapi.Response('Resource not found.'),
+        **common_responses,
+    }
+
+    # Define responses for update view
+    update_responses = {
+        '200': openapi.Response('Resource updated Successfully.'),
+        '400': openapi.Response('Validation error'),
+        '404': openapi.Response('Resource not found.'),
+        **common_responses,
+    }
+
+    # Define responses for delete view
+    delete_responses = {
+        '200': openapi.Response('Resource deleted Successfully.'),
+        '404': openapi.Response('Resource not found.'),
+        **common_responses,
+    }
 
-# Define responses for delete view
-delete_responses = {
-    '200': openapi.Response('Resource deleted Successfully.'),
-    '404': openapi.Response('Resource not found.'),
-    **common_responses,
+    return {
+        'common_responses': common_responses,
+        'create_responses': create_responses,
+        'list_responses': list_responses,
+        'retrieve_responses': retrieve_responses,
+        'update_responses': update_responses,
+        'delete_responses': delete_responses,
+    }
+
+
+_RESPONSE_NAMES = ('common_responses', 'create_responses', 'list_responses',
+                   'retrieve_responses', 'update_responses', 'delete_responses')
+
+_BUILDERS = {
+    'API_INFO': _api_info,
+    'schema_view': _schema_view,
+    'schema_cache': _schema_cache,
+    **{name: _responses for name in _RESPONSE_NAMES},
 }
+
+
+def _lazy(name):
+    """Returns a lazy attribute, building it once and storing it as a module global."""
+    namespace = globals()
+    if name in namespace:
+        return namespace[name]
+    with _lazy_lock:
+        if name not in namespace:
+            built = _BUILDERS[name]()
+            if name in _RESPONSE_NAMES:
+                namespace.update(built)
+            else:
+                namespace[name] = built
+        return namespace[name]
+
+
+def __getattr__(name):
+    if name in _BUILDERS:
+        return _lazy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _after_fork_in_child():
+    global _lazy_lock
+    _lazy_lock = threading.RLock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_BUILDERS))
@@ -0,0 +1,230 @@
+import logging
+import random
+import threading
+import time
+from contextlib import ExitStack
+from contextvars import ContextVar
+from functools import wraps
+
+from v2s_common_utils.logger import log_event
+
+logger = logging.getLogger(__name__)
+
+_current_timings = ContextVar('v2s_request_timings', default=None)
+
+DEFAULT_TIMING_SETTINGS = {
+    # Fraction of requests that are timed. 0 turns timing off, 1 times every request.
+    'SAMPLE_RATE': 0.01,
+    # Whether to add a Server-Timing header to timed responses.
+    'SERVER_TIMING_HEADER': True,
+    # Whether to log a REQUEST_TIMING record for every timed request.
+    'LOG': True,
+    # Requests faster than this many milliseconds are not logged.
+    'LOG_THRESHOLD_MS': 0,
+}
+
+
+def get_timing_settings():
+    """Returns DEFAULT_TIMING_SETTINGS updated with settings.V2S_TIMING."""
+    from django.conf import settings
+
+    return {**DEFAULT_TIMING_SETTINGS, **getattr(settings, 'V2S_TIMING', {})}
+
+
+class RequestTimings:
+    """
+    Timings collected for one request.
+
+    Sections report exclusive time: time spent in a nested section, or in database
+    queries run inside a section, is counted once, against the nested section or 'db',
+    and not again against the enclosing one.
+
+    Attributes:
+        sections (dict): Section name -> [exclusive milliseconds, number of calls].
+        db_ms (float): Milliseconds spent executing database queries.
+        queries (int): The number of database queries.
+    """
+
+    __slots__ = ('started', 'sections', 'db_ms', 'queries', '_open')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.sections = {}
+        self.db_ms = 0.0
+        self.queries = 0
+        # Thread id -> stack of open sections, each [started, milliseconds to exclude].
+        self._open = {}
+
+    def enter(self):
+        """Opens a section on the calling thread and returns it, to be passed to exit()."""
+        frame = [time.perf_counter(), 0.0]
+        self._open.setdefault(threading.get_ident(), []).append(frame)
+        return frame
+
+    def exit(self, name, frame):
+        """Closes a section opened by enter() and adds its exclusive time to name."""
+        elapsed_ms = (time.perf_counter() - frame[0]) * 1000
+        stack = self._open.get(threading.get_ident())
+        if stack and stack[-1] is frame:
+            stack.pop()
+            if stack:
+                stack[-1][1] += elapsed_ms
+        self.add(name, max(elapsed_ms - frame[1], 0.0))
+
+    def add(self, name, elapsed_ms):
+        """Adds elapsed_ms to a named section."""
+        section = self.sections.get(name)
+        if section is None:
+            self.sections[name] = [elapsed_ms, 1]
+        else:
+            section[0] += elapsed_ms
+            section[1] += 1
+
+    def total_ms(self):
+        """Returns the milliseconds elapsed since the request started."""
+        return (time.perf_counter() - self.started) * 1000
+
+    def __call__(self, execute, sql, params, many, context):
+        # Database execute wrapper, see connection.execute_wrapper().
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.db_ms += elapsed_ms
+            self.queries += 1
+            stack = self._open.get(threading.get_ident())
+            if stack:
+                stack[-1][1] += elapsed_ms
+
+    def server_timing(self, total_ms):
+        """Returns the value of a Server-Timing header for these timings."""
+        metrics = [f'total;dur={total_ms:.1f}', f'db;dur={self.db_ms:.1f};desc="{self.queries} queries"']
+        metrics.extend(f'{name};dur={elapsed:.1f}' for name, (elapsed, _) in self.sections.items())
+        return ', '.join(metrics)
+
+
+def current_timings():
+    """Returns the RequestTimings of the request being timed, or None."""
+    return _current_timings.get()
+
+
+class timed:
+    """
+    Records the time spent in a named section of the current request.
+
+    Sections may nest. Each one reports only its own time, see RequestTimings.
+
+    Usable as a context manager or as a decorator. When the current request is not being
+    timed (sampling is off, or the code runs outside TimingMiddleware) it costs a single
+    context variable lookup.
+
+    Args:
+        name (str): The section name. Repeated sections are summed.
+
+    Example:
+        with timed('validation'):
+            errors_list = plan.errors(request.data)
+
+        @timed('report.build')
+        def build_report(rows):
+            ...
+    """
+
+    __slots__ = ('name', '_timings', '_frame')
+
+    def __init__(self, name):
+        self.name = name
+        self._timings = None
+
+    def __enter__(self):
+        self._timings = _current_timings.get()
+        if self._timings is not None:
+            self._frame = self._timings.enter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._timings is not None:
+            self._timings.exit(self.name, self._frame)
+            self._timings = None
+        return False
+
+    def __call__(self, func):
+        name = self.name
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            timings = _current_timings.get()
+            if timings is None:
+                return func(*args, **kwargs)
+            frame = timings.enter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timings.exit(name, frame)
+        return wrapper
+
+
+class TimingMiddleware:
+    """
+    Middleware that times sampled requests.
+
+    For every sampled request it records the total time, the database time and query
+    count, and the sections recorded with timed(). The package times BaseService calls
+    ('service.<method>'), serializer output ('serializer'), validation plans ('validation')
+    and handle_exception ('handle_exception'). Results are sent in a Server-Timing header
+    and logged as a structured REQUEST_TIMING record (see log_event). Section times are
+    exclusive, so nested service calls and queries run while serializing are not counted
+    twice, and 'total' is roughly 'db' plus the sections plus untimed code.
+
+    Configured with settings.V2S_TIMING (see DEFAULT_TIMING_SETTINGS). By default one
+    request in a hundred is timed. Settings are read once, when the middleware is created.
+
+    Database timing uses connection.execute_wrapper(), which applies to queries run on the
+    request's thread, so queries that an async view runs through sync_to_async are not
+    counted.
+
+    Example:
+        MIDDLEWARE = [
+            'v2s_common_utils.timing.TimingMiddleware',
+            ...
+        ]
+        V2S_TIMING = {'SAMPLE_RATE': 0.05, 'LOG_THRESHOLD_MS': 200}
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        config = get_timing_settings()
+        self.sample_rate = config['SAMPLE_RATE']
+        self.header = config['SERVER_TIMING_HEADER']
+        self.log = config['LOG']
+        self.log_threshold_ms = config['LOG_THRESHOLD_MS']
+
+    def __call__(self, request):
+        if self.sample_rate <= 0 or (self.sample_rate < 1 and random.random() >= self.sample_rate):
+            return self.get_response(request)
+
+        from django.db import connections
+
+        timings = RequestTimings()
+        token = _current_timings.set(timings)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(timings))
+                response = self.get_response(request)
+        finally:
+            _current_timings.reset(token)
+
+        total_ms = timings.total_ms()
+        if self.header:
+            response['Server-Timing'] = timings.server_timing(total_ms)
+        if self.log and total_ms >= self.log_threshold_ms:
+            log_event(
+                logger, 'REQUEST_TIMING', request.method, request.path, round(total_ms, 1),
+                status=response.status_code, total_ms=round(total_ms, 1), db_ms=round(timings.db_ms, 1),
+                queries=timings.queries,
+                sections={name: round(elapsed, 1) for name, (elapsed, _) in timings.sections.items()},
+                request_sample_rate=self.sample_rate,
+            )
+        return response
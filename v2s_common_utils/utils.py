@@ -1,18 +1,26 @@
 import base64
 import json
+import operator
 import random
 import string
 import uuid
-import re
 from datetime import datetime
+from functools import reduce
 from uuid import UUID
 
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.core.files import File
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
 from django.db.models.fields.files import FieldFile
 
 from rest_framework.response import Response
 from rest_framework import serializers
 
+from v2s_common_utils.identifiers import uuid7
+from v2s_common_utils.patterns import PATTERNS
+
 
 
 
@@ -56,9 +64,20 @@ def generate_random_password(length=12):
 
 
 
-def genrate_unique_number():
+def genrate_unique_number(time_ordered=False):
+    """
+    Generate a unique 32 character hex string.
+
+    Args:
+        time_ordered (bool, optional): If True, use a time-ordered UUIDv7 instead of a
+            random UUIDv4, so values sort by creation time and index-friendly inserts
+            land at the end of a B-tree index. Default is False.
+
+    Returns:
+        str: The UUID as a hex string without hyphens.
+    """
     # Generate a unique UUID (Universally Unique Identifier)
-    unique_id = uuid.uuid4()
+    unique_id = uuid7() if time_ordered else uuid.uuid4()
 
     # Convert the UUID to a string and remove hyphens to create a unique number
     unique_number = str(unique_id).replace('-', '')
@@ -197,8 +216,14 @@ class ListQuerySerializer(serializers.Serializer):
 
 
 def validate_regex(value, pattern):
-    """Validate if a value matches a regex pattern."""
-    return bool(re.match(pattern, value))
+    """
+    Validate if a value matches a regex pattern.
+
+    The pattern is matched from the start of the value, like re.match. Pattern strings
+    are compiled once through the shared pattern registry, and compiled patterns
+    (for example patterns.EMAIL) are used as is.
+    """
+    return bool(PATTERNS.compile(pattern).match(value))
 
 
 
@@ -223,7 +248,150 @@ def replace_placeholder_with_id_function(model, attribute, placeholder_key, data
         if obj:
             # Replace the placeholder value with the object's ID
             data[id_key] = obj.id
-        return data
+    return data
 # Usage example in a view function:
 # Call the function to replace the placeholder in your view function
 # replace_placeholder_with_id_function(Endpoint, 'name', 'endpoint_name', request)
+
+
+def _attribute_normalizer(model, attribute):
+    """Returns the to_python of a plain concrete field, or None for lookups and relations."""
+    if LOOKUP_SEP in attribute:
+        return None
+    try:
+        field = model._meta.get_field(attribute)
+    except FieldDoesNotExist:
+        return None
+    return field.to_python if field.concrete else None
+
+
+def lookup_ids_by_attributes(model, values_by_attribute):
+    """
+    Map values of several attributes of one model to IDs with a single query.
+
+    Values are converted with the model field's to_python() before matching, so '5'
+    finds the row whose integer attribute is 5. When several rows share a value, the
+    one with the lowest primary key wins, which matches what filter().first() returns
+    for unordered models. Attributes that use a lookup (for example 'name__iexact')
+    cannot be matched back from the fetched rows and are resolved one value at a time.
+
+    Args:
+        model (class): The Django model class to query.
+        values_by_attribute (dict): A mapping of attribute name to the distinct values to resolve.
+
+    Returns:
+        dict: A mapping of attribute name to a dict of value -> ID for every value that was found.
+    """
+    results = {attribute: {} for attribute in values_by_attribute}
+    originals = {}
+    conditions = []
+    for attribute, values in values_by_attribute.items():
+        normalize = _attribute_normalizer(model, attribute)
+        if normalize is None:
+            for value in values:
+                obj_id = model.objects.filter(**{attribute: value}).order_by('pk').values_list('pk', flat=True).first()
+                if obj_id is not None:
+                    results[attribute][value] = obj_id
+            continue
+        by_normalized = {}
+        for value in values:
+            try:
+                by_normalized.setdefault(normalize(value), []).append(value)
+            except (DjangoValidationError, TypeError, ValueError):
+                # Values that do not fit the field can never match a row.
+                continue
+        if by_normalized:
+            originals[attribute] = by_normalized
+            conditions.append(Q(**{f"{attribute}__in": list(by_normalized)}))
+
+    if conditions:
+        attributes = list(originals)
+        rows = model.objects.filter(reduce(operator.or_, conditions)).order_by('pk').values_list('pk', *attributes)
+        for row in rows:
+            obj_id = row[0]
+            for attribute, stored in zip(attributes, row[1:]):
+                for value in originals[attribute].get(stored, ()):
+                    results[attribute].setdefault(value, obj_id)
+    return results
+
+
+def lookup_ids_by_attribute(model, attribute, values):
+    """
+    Map attribute values to model IDs with a single IN query.
+
+    See lookup_ids_by_attributes for how values are matched.
+
+    Args:
+        model (class): The Django model class to query.
+        attribute (str): The attribute name in the model to match.
+        values (iterable): The distinct attribute values to resolve.
+
+    Returns:
+        dict: A mapping of attribute value to ID for every value that was found.
+    """
+    return lookup_ids_by_attributes(model, {attribute: values})[attribute]
+
+
+def replace_placeholders_with_ids(records, mappings):
+    """
+    Replace placeholder values in a list of records with the corresponding model IDs.
+
+    The distinct placeholder values of all mappings on the same model are resolved
+    with one query, so the number of queries depends on the number of models, not the
+    number of records.
+
+    Args:
+        records (list): A list of dicts, updated in place.
+        mappings (list): A list of (model, attribute, placeholder_key, id_key) tuples.
+
+    Returns:
+        tuple: The updated records and a dict mapping each placeholder_key to the list
+            of values that could not be resolved. Keys with no unresolved values are omitted.
+
+    Example:
+        records, unresolved = replace_placeholders_with_ids(
+            request.data,
+            [(Endpoint, 'name', 'endpoint_name', 'endpoint_id'),
+             (Module, 'code', 'module_code', 'module_id')],
+        )
+    """
+    values_by_model = {}
+    unhashable = {}
+    for model, attribute, placeholder_key, id_key in mappings:
+        values = values_by_model.setdefault(model, {}).setdefault(attribute, set())
+        for record in records:
+            value = record.get(placeholder_key)
+            if value is None:
+                continue
+            try:
+                values.add(value)
+            except TypeError:
+                # Unhashable values (lists, dicts) can never match a column value.
+                unhashable.setdefault(placeholder_key, []).append(value)
+
+    ids_by_model = {
+        model: lookup_ids_by_attributes(model, values_by_attribute)
+        for model, values_by_attribute in values_by_model.items()
+    }
+
+    unresolved = {}
+    for model, attribute, placeholder_key, id_key in mappings:
+        ids_by_value = ids_by_model[model][attribute]
+        missing = list(unhashable.get(placeholder_key, ()))
+        seen = set()
+        for record in records:
+            value = record.get(placeholder_key)
+            if value is None:
+                continue
+            try:
+                obj_id = ids_by_value.get(value)
+            except TypeError:
+                continue
+            if obj_id is not None:
+                record[id_key] = obj_id
+            elif value not in seen:
+                seen.add(value)
+                missing.append(value)
+        if missing:
+            unresolved[placeholder_key] = missing
+    return records, unresolved
@@ -0,0 +1,251 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+from django.apps import apps
+
+from v2s_common_utils.errors import get_error_message
+from v2s_common_utils.validations import (
+    AlphanumericValidator,
+    AlphanumericWithWhitespaceValidator,
+    DigitsOnlyValidator,
+    EmptyValidator,
+    FieldRelatedValidator,
+    MinMaxLengthValidator,
+    ModelAttributeExistsValidator,
+    ModelAttributeNotExistsValidator,
+    RegexValidator,
+    ValidationPlan,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaError(Exception):
+    """Raised when a declarative validation schema is invalid."""
+
+
+VALIDATOR_TYPES = {
+    'empty': EmptyValidator,
+    'min_max_length': MinMaxLengthValidator,
+    'alphanumeric': AlphanumericValidator,
+    'alphanumeric_with_whitespace': AlphanumericWithWhitespaceValidator,
+    'digits_only': DigitsOnlyValidator,
+    'regex': RegexValidator,
+    'model_attribute_exists': ModelAttributeExistsValidator,
+    'model_attribute_not_exists': ModelAttributeNotExistsValidator,
+    'field_related': FieldRelatedValidator,
+}
+
+
+def register_validator_type(name, validator_class):
+    """
+    Makes a validator class available to schemas under the given type name.
+
+    The class is built as validator_class(field_name=..., **params), so its constructor
+    must accept field_name as a keyword argument.
+    """
+    VALIDATOR_TYPES[name] = validator_class
+
+
+def build_validator(field_name, spec):
+    """
+    Builds one validator from a spec.
+
+    Args:
+        field_name (str): The name of the field being validated.
+        spec (dict): The validator spec. 'type' selects the class from VALIDATOR_TYPES and
+            the other keys are passed to its constructor. 'model' is an "app_label.ModelName"
+            string resolved to model_class. If 'error_message' is missing, it is looked up
+            from the error catalog by 'error_code'.
+
+    Returns:
+        StatelessValidator: The validator.
+
+    Raises:
+        SchemaError: If the type is unknown or the spec does not fit the validator.
+    """
+    params = dict(spec)
+    type_name = params.pop('type', None)
+    try:
+        validator_class = VALIDATOR_TYPES[type_name]
+    except KeyError:
+        raise SchemaError(f"Unknown validator type '{type_name}' for field '{field_name}'.")
+
+    if 'model' in params:
+        try:
+            params['model_class'] = apps.get_model(params.pop('model'))
+        except (LookupError, ValueError) as e:
+            raise SchemaError(f"Invalid model for field '{field_name}': {e}")
+    if params.get('error_code') is not None and 'error_message' not in params:
+        params['error_message'] = get_error_message(params['error_code'])
+
+    if issubclass(validator_class, RegexValidator):
+        _check_regex_spec(field_name, params)
+
+    try:
+        return validator_class(field_name=field_name, **params)
+    except (TypeError, re.error) as e:
+        raise SchemaError(f"Invalid '{type_name}' validator spec for field '{field_name}': {e}")
+
+
+def _check_regex_spec(field_name, params):
+    """Rejects regex specs that would fail, or check nothing, on every request."""
+    method = params.get('validation_method')
+    if method is not None and not RegexValidator.has_validation_method(method):
+        raise SchemaError(f"Unknown regex validation_method '{method}' for field '{field_name}'.")
+    if method is None and not params.get('regex_pattern'):
+        raise SchemaError(f"Regex validator for field '{field_name}' needs a validation_method or a regex_pattern.")
+
+
+def compile_schema(schema):
+    """
+    Compiles a declarative schema into a ValidationPlan.
+
+    Args:
+        schema (dict): A mapping of field name to a list of validator specs.
+
+    Returns:
+        ValidationPlan: The compiled plan.
+
+    Example:
+        USER_PLAN = compile_schema({
+            'username': [
+                {'type': 'empty', 'error_code': 'E001'},
+                {'type': 'min_max_length', 'min_length': 3, 'max_length': 30, 'error_code': 'E002'},
+                {'type': 'model_attribute_exists', 'model': 'auth.User', 'attribute_name': 'username',
+                 'error_code': 'E003', 'error_message': 'Username already exists.'},
+            ],
+            'email': [
+                {'type': 'regex', 'validation_method': 'validate_email', 'error_code': 'E004'},
+            ],
+        })
+    """
+    validators = []
+    for field_name, specs in schema.items():
+        if isinstance(specs, dict):
+            specs = [specs]
+        for spec in specs:
+            validators.append(build_validator(field_name, spec))
+    return ValidationPlan(validators)
+
+
+def load_schema_file(file_path):
+    """
+    Reads a file of named schemas.
+
+    The file holds a mapping of schema name to schema (see compile_schema). Files ending
+    in .yaml or .yml are read with PyYAML, which must be installed; anything else is
+    read as JSON.
+
+    Returns:
+        dict: The parsed schemas.
+    """
+    with open(file_path, encoding='utf-8') as f:
+        if file_path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise SchemaError("PyYAML is required to load YAML validation schemas.")
+            schemas = yaml.safe_load(f)
+        else:
+            schemas = json.load(f)
+    if not isinstance(schemas, dict):
+        raise SchemaError(f"{file_path} must contain a mapping of schema name to schema.")
+    return schemas
+
+
+class SchemaRegistry:
+    """
+    Compiled, cached validation plans loaded from a schema file.
+
+    All schemas are compiled once by load(), typically from AppConfig.ready(), so a
+    request only looks up and runs a plan. If check_interval is set, plan() checks the
+    file's modification time at most once per interval and recompiles every schema when
+    it changed. A file that fails to load or compile is logged and the previous plans
+    stay in use.
+
+    Args:
+        file_path (str): The path of the JSON or YAML schema file.
+        check_interval (float, optional): Seconds between modification checks. None
+            disables hot reload. Default is 2.0.
+
+    Methods:
+        load(): Reads and compiles the file.
+        plan(name): Returns the compiled plan for a schema name.
+        names(): Returns the loaded schema names.
+
+    Example:
+        VALIDATION_SCHEMAS = SchemaRegistry(os.path.join(BASE_DIR, 'validation_schemas.json'))
+
+        # in AppConfig.ready()
+        VALIDATION_SCHEMAS.load()
+
+        # in a view
+        errors_list = VALIDATION_SCHEMAS.plan('create_user').errors(request.data)
+    """
+
+    def __init__(self, file_path, check_interval=2.0):
+        self.file_path = file_path
+        self.check_interval = check_interval
+        self._plans = {}
+        self._mtime = None
+        self._next_check = 0.0
+        self._lock = threading.Lock()
+
+    def load(self):
+        """Reads and compiles every schema in the file, replacing the current plans."""
+        with self._lock:
+            self._load()
+
+    def _load(self):
+        mtime = os.stat(self.file_path).st_mtime_ns
+        schemas = load_schema_file(self.file_path)
+        self._plans = {name: compile_schema(schema) for name, schema in schemas.items()}
+        self._mtime = mtime
+
+    def _reload_if_changed(self):
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        with self._lock:
+            if now < self._next_check:
+                return
+            self._next_check = now + self.check_interval
+            try:
+                mtime = os.stat(self.file_path).st_mtime_ns
+            except OSError as e:
+                logger.error("Keeping previous validation schemas, could not stat %s: %s", self.file_path, e)
+                return
+            if mtime == self._mtime:
+                return
+            try:
+                self._load()
+                logger.info("Reloaded validation schemas from %s", self.file_path)
+            except Exception as e:
+                # Remember the broken version so it is reported once, not on every check.
+                self._mtime = mtime
+                logger.error("Keeping previous validation schemas, could not reload %s: %s", self.file_path, e)
+
+    def plan(self, name):
+        """
+        Returns the compiled plan for a schema name, loading the file on first use.
+
+        Raises:
+            KeyError: If the file has no schema with that name.
+        """
+        if self._mtime is None:
+            self.load()
+        elif self.check_interval is not None:
+            self._reload_if_changed()
+        try:
+            return self._plans[name]
+        except KeyError:
+            raise KeyError(f"No validation schema named '{name}' in {self.file_path}.")
+
+    def names(self):
+        """Returns the loaded schema names."""
+        return list(self._plans)
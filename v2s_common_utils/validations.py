@@ -1,17 +1,140 @@
 #Python Imports
-import re
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
 
 #Django Imports
-from django.contrib.auth import authenticate
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import close_old_connections, connections
+from django.db.models import Exists
+from django.db.models.constants import LOOKUP_SEP
 
 #Third-Party Imports
 
 #Project-Specific Imports
+from v2s_common_utils.patterns import (
+    ALPHANUMERIC,
+    ALPHANUMERIC_WITH_WHITESPACE,
+    DIGITS_ONLY,
+    EMAIL,
+    MOBILE_NUMBER,
+    PATTERNS,
+    SPECIFIC_SPECIAL_CHARACTERS,
+)
+from v2s_common_utils.metrics import VALIDATION_DURATION, VALIDATION_RUNS
+from v2s_common_utils.timing import timed
 
 #Relative Import
 
 
 
+_lookup_memo = ContextVar('v2s_lookup_memo', default=None)
+
+
+@contextmanager
+def lookup_memo():
+    """
+    Share existence lookups between validators for the duration of a request.
+
+    Inside the block, record_exists() and probe_exists() remember every
+    (model, attribute, value) result, so the same value checked by several validators
+    or plans costs one query. Results are not invalidated by writes made inside the
+    block, so open it around validation, not around code that validates, saves and
+    validates again. Can also be used as a decorator.
+
+    Example:
+        with lookup_memo():
+            errors_list = USER_PLAN.errors(request.data)
+            errors_list += PROFILE_PLAN.errors(request.data)
+    """
+    token = _lookup_memo.set({})
+    try:
+        yield
+    finally:
+        _lookup_memo.reset(token)
+
+
+def probe_exists(model_class, probes):
+    """
+    Check whether rows exist for several (attribute, value) pairs of one model in one query.
+
+    A single probe uses exists(). Several probes are merged into one SELECT with an
+    EXISTS subquery per probe, so each probe still stops at its first match and can use
+    the index of its own column. Results already in the active lookup_memo() are not
+    queried again.
+
+    Args:
+        model_class (class): The Django model class to query.
+        probes (list): A list of (attribute, value) pairs. Attributes may use lookups such as 'name__iexact'.
+
+    Returns:
+        list: One bool per probe, in order.
+    """
+    memo = _lookup_memo.get()
+    results = [None] * len(probes)
+    pending = {}
+    unhashable = []
+    for index, (attribute, value) in enumerate(probes):
+        try:
+            if memo is not None and (model_class, attribute, value) in memo:
+                results[index] = memo[(model_class, attribute, value)]
+                continue
+            pending.setdefault((attribute, value), []).append(index)
+        except TypeError:
+            unhashable.append(index)
+
+    queries = list(pending) + [probes[index] for index in unhashable]
+    if not queries:
+        return results
+    if len(queries) == 1:
+        attribute, value = queries[0]
+        flags = [model_class.objects.filter(**{attribute: value}).exists()]
+    else:
+        probes_by_name = {
+            f'probe_{index}': Exists(model_class.objects.filter(**{attribute: value}))
+            for index, (attribute, value) in enumerate(queries)
+        }
+        # The outer query reads at most one row; it only carries the EXISTS columns. An
+        # empty table returns no row, and then nothing can match.
+        rows = model_class.objects.order_by().annotate(**probes_by_name).values(*probes_by_name)[:1]
+        row = next(iter(rows), None)
+        flags = [bool(row and row[name]) for name in probes_by_name]
+
+    for (key, indexes), flag in zip(pending.items(), flags):
+        for index in indexes:
+            results[index] = flag
+        if memo is not None:
+            memo[(model_class,) + key] = flag
+    for index, flag in zip(unhashable, flags[len(pending):]):
+        results[index] = flag
+    return results
+
+
+def record_exists(model_class, attribute, value):
+    """Returns True if a row with the attribute value exists, using exists() and the active lookup_memo()."""
+    return probe_exists(model_class, [(attribute, value)])[0]
+
+
+def _observe_validation(many):
+    """Records the duration and the valid/invalid outcome of a validation call in the package metrics."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            VALIDATION_DURATION.observe(time.perf_counter() - started)
+            for errors in (result if many else (result,)):
+                VALIDATION_RUNS.inc(result='invalid' if errors else 'valid')
+            return result
+        return wrapper
+    return decorator
+
+
 class FieldValidationException(Exception):
     """
     Custom exception for field validation errors.
@@ -43,9 +166,139 @@ class FieldValidationException(Exception):
         }
         
 
+def _recording_errors(validate):
+    """
+    Wraps a StatelessValidator.validate so its result is also kept as the thread's .errors.
+
+    The thread's .errors are reset when the outermost validate() call starts. A validate()
+    that returns None, having reported through add_error(), returns those errors instead.
+    """
+    @wraps(validate)
+    def wrapper(self, *args, **kwargs):
+        state = self._compat_state()
+        depth = getattr(state, 'depth', 0)
+        if not depth:
+            state.errors = []
+        state.depth = depth + 1
+        try:
+            errors = validate(self, *args, **kwargs)
+        finally:
+            state.depth = depth
+        if errors is None:
+            return self.errors
+        state.errors = errors
+        return errors
+    return wrapper
+
+
+class StatelessValidator:
+    """
+    Base class for stateless field validation.
+
+    validate(value) returns the validation errors instead of storing them on the
+    instance, so a validator can be built once (for example at module import) and
+    shared between requests and threads.
+
+    Args:
+        field_name (str): The name of the field being validated.
+        error_code (str, optional): The error code for validation failures.
+        error_message (str, optional): The error message for validation failures.
+
+    For code written against ValidatorBase, the errors of the latest validate() call
+    are also available as .errors. They are kept per thread, so a shared instance does
+    not leak them between threads, and they are replaced, not accumulated, by the next
+    call in the same thread. A subclass may also report errors with add_error() and
+    return None, as a ValidatorBase would; validate() then returns those errors.
+
+    Attributes:
+        field_name (str): The name of the field being validated.
+        errors (list): The errors of the latest validate() call in this thread.
+
+    Methods:
+        error(): Returns a list holding this validator's error.
+        validate(value): Validates the field's value and returns a list of errors
+            (must be implemented by subclasses).
+        add_error(error_code, error_message): Adds an error to .errors, as in ValidatorBase.
+
+    Example:
+        class MyValidator(StatelessValidator):
+            def validate(self, value):
+                if not value:
+                    return self.error()
+                return []
+
+        NAME_VALIDATORS = [MyValidator('name', error_code="E001", error_message="Field cannot be empty.")]
+    """
+
+    # Validators that query the database set this to True so compiled plans run them last.
+    uses_db = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        validate = cls.__dict__.get('validate')
+        if validate is not None:
+            cls.validate = _recording_errors(validate)
+
+    def __init__(self, field_name, error_code=None, error_message=None):
+        self.field_name = field_name
+        self.error_code = error_code
+        self.error_message = error_message
+
+    def _compat_state(self):
+        # setdefault is atomic, so threads racing on first use share one local.
+        return self.__dict__.setdefault('_compat', threading.local())
+
+    @property
+    def errors(self):
+        """The errors of the latest validate() call in this thread, as ValidatorBase.errors."""
+        state = self._compat_state()
+        errors = getattr(state, 'errors', None)
+        if errors is None:
+            errors = state.errors = []
+        return errors
+
+    @errors.setter
+    def errors(self, errors):
+        self._compat_state().errors = errors
+
+    def add_error(self, error_code, error_message):
+        """Adds a validation error to .errors, as ValidatorBase.add_error does."""
+        self.errors.append(FieldValidationException(error_code, error_message).to_dict())
+
+    def error(self):
+        """Returns a list holding this validator's error."""
+        return [FieldValidationException(self.error_code, self.error_message).to_dict()]
+
+    def validate(self, value):
+        """Validates the field's value and returns a list of errors (must be implemented by subclasses)."""
+        raise NotImplementedError("Subclasses must implement this method")
+
+    def lookup(self):
+        """
+        Returns the (model_class, attribute) pair whose existing values decide this
+        validator's result, or None if the validator cannot be batched.
+        """
+        return None
+
+    def needs_lookup(self, value):
+        """Returns False if the value can be validated without consulting lookup()."""
+        return True
+
+    def validate_found(self, value, found):
+        """
+        Validates the value against a precomputed set of values that exist in the
+        database for lookup(). Only called when lookup() is not None.
+        """
+        raise NotImplementedError("Batchable validators must implement this method")
+
+
 class ValidatorBase:
     """
-    Base class for field validation.
+    Base class for field validation that stores errors on the instance.
+
+    Kept for compatibility with existing custom validators. Instances accumulate errors
+    across calls, so they must not be shared between requests or threads. New
+    validators should extend StatelessValidator instead.
 
     Args:
         field_name (str): The name of the field being validated.
@@ -65,6 +318,9 @@ class ValidatorBase:
                     self.add_error("E001", "Field cannot be empty.")
     """
 
+    # Custom validators may query the database, so compiled plans run them after the pure checks.
+    uses_db = True
+
     def __init__(self, field_name):
         self.field_name = field_name
         self.errors = []
@@ -78,22 +334,41 @@ class ValidatorBase:
         raise NotImplementedError("Subclasses must implement this method")
 
 
+def run_validator(validator, value):
+    """
+    Runs a validator and returns its errors.
+
+    Supports both StatelessValidator subclasses, which return their errors, and legacy
+    ValidatorBase subclasses, whose accumulated errors list is returned.
+
+    Args:
+        validator: A StatelessValidator or ValidatorBase instance.
+        value: The value to validate.
+
+    Returns:
+        list: A list of error dictionaries with 'error_code' and 'error_message' keys.
+    """
+    if isinstance(validator, ValidatorBase):
+        validator.validate(value)
+        return validator.errors
+    return validator.validate(value)
+
+
 
-class MinMaxLengthValidator(ValidatorBase):
+class MinMaxLengthValidator(StatelessValidator):
     def __init__(self, field_name, min_length=None, max_length=None, error_code=None, error_message=None):
-        super().__init__(field_name)
+        super().__init__(field_name, error_code, error_message)
         self.min_length = min_length
         self.max_length = max_length
-        self.error_code = error_code
-        self.error_message = error_message
 
     def validate(self, value):
         if self.min_length is not None and len(value) < self.min_length:
-            self.add_error(self.error_code, self.error_message)
+            return self.error()
         if self.max_length is not None and len(value) > self.max_length:
-            self.add_error(self.error_code, self.error_message)
+            return self.error()
+        return []
 
-class EmptyValidator(ValidatorBase):
+class EmptyValidator(StatelessValidator):
     """
     Validator for checking if a field is empty or not based on 'allow_blank' parameter.
 
@@ -109,18 +384,17 @@ class EmptyValidator(ValidatorBase):
     """
 
     def __init__(self, field_name, allow_blank=False, error_code=None, error_message=None):
-        super().__init__(field_name)
+        super().__init__(field_name, error_code, error_message)
         self.allow_blank = allow_blank
-        self.error_code = error_code
-        self.error_message = error_message
 
     def validate(self, value):
         """Validates if the field is empty or not."""
         if not self.allow_blank and not value:
-            self.add_error(self.error_code, self.error_message)
+            return self.error()
+        return []
 
 
-class AlphanumericValidator(ValidatorBase):
+class AlphanumericValidator(StatelessValidator):
     """
     Validator for checking if a field contains only alphanumeric characters.
 
@@ -135,17 +409,17 @@ class AlphanumericValidator(ValidatorBase):
     """
 
     def __init__(self, field_name, error_code=None, error_message=None):
-        super().__init__(field_name)
-        self.error_code = error_code
-        self.error_message = error_message
+        super().__init__(field_name, error_code, error_message)
 
     def validate(self, value):
         """Validates if the field contains only alphanumeric characters."""
         # Check if the value matches the regex pattern for alphanumeric characters only
-        regex_pattern = r'^[A-Za-z0-9]+$'
-        if not re.match(regex_pattern, value):
-            self.add_error(self.error_code, self.error_message)
-class AlphanumericWithWhitespaceValidator(ValidatorBase):
+        if not ALPHANUMERIC.fullmatch(value):
+            return self.error()
+        return []
+
+
+class AlphanumericWithWhitespaceValidator(StatelessValidator):
     """
     Validator for checking if a field contains only alphanumeric characters and whitespace.
 
@@ -160,18 +434,16 @@ class AlphanumericWithWhitespaceValidator(ValidatorBase):
     """
 
     def __init__(self, field_name, error_code=None, error_message=None):
-        super().__init__(field_name)
-        self.error_code = error_code
-        self.error_message = error_message
+        super().__init__(field_name, error_code, error_message)
 
     def validate(self, value):
         """Validates if the field contains only word characters and whitespace characters."""
-        regex_pattern = r'^[\w\s]+$'
-        if not re.match(regex_pattern, value):
-            self.add_error(self.error_code, self.error_message)
+        if not ALPHANUMERIC_WITH_WHITESPACE.fullmatch(value):
+            return self.error()
+        return []
 
 
-class DigitsOnlyValidator(ValidatorBase):
+class DigitsOnlyValidator(StatelessValidator):
     """
     Validator for checking if a field contains only digits.
 
@@ -186,71 +458,82 @@ class DigitsOnlyValidator(ValidatorBase):
     """
 
     def __init__(self, field_name, error_code=None, error_message=None):
-        super().__init__(field_name)
-        self.error_code = error_code
-        self.error_message = error_message
+        super().__init__(field_name, error_code, error_message)
 
     def validate(self, value):
         """Validates if the field contains digits only."""
-        regex_pattern = r'^\d+$'
-        if not re.match(regex_pattern, value):
-            self.add_error(self.error_code, self.error_message)
+        if not DIGITS_ONLY.fullmatch(value):
+            return self.error()
+        return []
 
-class RegexValidator(ValidatorBase):
+class RegexValidator(StatelessValidator):
     """
     Validator for applying custom regular expression-based validation methods to a field.
 
+    With validation_method the named method (one of the validate_* methods) checks the
+    value. Otherwise the value must fully match regex_pattern.
+
     Args:
         field_name (str): The name of the field being validated.
-        regex_pattern (str, optional): The regular expression pattern for validation.
+        regex_pattern (str, optional): The regular expression the value must fully match
+            when no validation_method is given.
         error_code (str, optional): The error code for validation failures.
         error_message (str, optional): The error message for validation failures.
         validation_method (str, optional): The name of the custom validation method to apply.
 
     Example:
         # Validate 'phone_number' field using a custom validation method 'validate_mobile_number'
-        RegexValidator('phone_number', regex_pattern=r'^\+\d{1,3}\s?\(\d{1,4}\)\s?\d{6,}$',
-                       error_code="E001", error_message="Invalid phone number format",
+        RegexValidator('phone_number', error_code="E001", error_message="Invalid phone number format",
                        validation_method="validate_mobile_number")
+
+        # Validate 'pan' field against a pattern
+        RegexValidator('pan', regex_pattern=r'[A-Z]{5}[0-9]{4}[A-Z]', error_code="E002")
     """
 
     def __init__(self, field_name, regex_pattern=None, error_code=None, error_message=None, validation_method=None):
-        super().__init__(field_name)
+        super().__init__(field_name, error_code, error_message)
         self.regex_pattern = regex_pattern
-        self.error_code = error_code
-        self.error_message = error_message
         self.validation_method = validation_method
+        self._pattern = PATTERNS.compile(regex_pattern) if regex_pattern and not validation_method else None
+
+    @classmethod
+    def has_validation_method(cls, name):
+        """Returns True if name is one of the validate_* methods."""
+        return isinstance(name, str) and name.startswith('validate_') and callable(getattr(cls, name, None))
 
     def validate(self, value):
-        """Validates the field using the specified custom validation method."""
+        """Validates the field using the specified custom validation method, or regex_pattern."""
         if self.validation_method:
-            getattr(self, self.validation_method)(value)
+            return getattr(self, self.validation_method)(value)
+        if self._pattern is not None and not self._pattern.fullmatch(value):
+            return self.error()
+        return []
 
     def validate_mobile_number(self, value):
         """Validates a mobile number using a standard regex pattern."""
-        regex_pattern = r'^\+\d{1,3}\s?\(\d{1,4}\)\s?\d{6,}$'
-        if not re.match(regex_pattern, value):
-            self.add_error(self.error_code, self.error_message)
+        if not MOBILE_NUMBER.fullmatch(value):
+            return self.error()
+        return []
 
     def validate_email(self, value):
         """Validates an email address using a standard regex pattern."""
-        regex_pattern = r'^[\w.%+-]+@[\w.-]+\.[a-zA-Z]{2,4}$'
-        if not re.match(regex_pattern, value):
-            self.add_error(self.error_code, self.error_message)
+        if not EMAIL.fullmatch(value):
+            return self.error()
+        return []
 
     def validate_allow_specific_special_characters(self, value):
         """Validates if the value contains only word characters, '.', ',', and whitespace."""
-        regex_pattern = r'^[\w\s.,]+$'
-        if not re.match(regex_pattern, value):
-            self.add_error(self.error_code, self.error_message)
+        if not SPECIFIC_SPECIAL_CHARACTERS.fullmatch(value):
+            return self.error()
+        return []
 
     def validate_digits_only(self, value):
         """Validates if the value contains digits only."""
-        regex_pattern = r'^\d+$'
-        if not re.match(regex_pattern, value):
-            self.add_error(self.error_code, self.error_message)
+        if not DIGITS_ONLY.fullmatch(value):
+            return self.error()
+        return []
 
-class ModelAttributeExistsValidator(ValidatorBase):
+class ModelAttributeExistsValidator(StatelessValidator):
     """
     Validator for checking if a record with the same attribute value exists in the database.
 
@@ -266,54 +549,103 @@ class ModelAttributeExistsValidator(ValidatorBase):
         ModelAttributeExistsValidator('email', User, 'email', error_code="E001", error_message="Email already exists")
     """
 
+    uses_db = True
+
     def __init__(self, field_name, model_class, attribute_name, error_code=None, error_message=None):
-        super().__init__(attribute_name)
+        super().__init__(attribute_name, error_code, error_message)
         self.field_name = field_name
         self.model_class = model_class
         self.attribute_name = attribute_name
-        self.error_code = error_code
-        self.error_message = error_message
 
     def validate(self, value):
         """Validates if a record with the same attribute value already exists in the database."""
-        filter_kwargs = {self.attribute_name: value}
-        existing_record = self.model_class.objects.filter(**filter_kwargs).first()
-        if existing_record:
-            self.add_error(self.error_code, self.error_message)        
-            
-class AuthPassValidator(ValidatorBase):
+        if record_exists(self.model_class, self.attribute_name, value):
+            return self.error()
+        return []
+
+    def lookup(self):
+        return self.model_class, self.attribute_name
+
+    def validate_found(self, value, found):
+        if value in found:
+            return self.error()
+        return []
+
+
+def _in_atomic_block():
+    """
+    Returns True if the calling thread has an open transaction on any database.
+
+    Pool threads use their own connections and cannot see rows the transaction has not
+    committed, so work that reads the database must then run on the calling thread.
+    """
+    return any(connection.in_atomic_block for connection in connections.all())
+
+
+def _authenticate(credentials):
+    """Runs authenticate() on a pool thread and releases the thread's database connection state afterwards."""
+    from django.contrib.auth import authenticate
+
+    try:
+        return authenticate(**credentials)
+    finally:
+        close_old_connections()
+
+
+class AuthPassValidator(StatelessValidator):
     """
     Validator for checking if a record with the same attribute value exists in the database.
 
+    Password hashing is deliberately slow. To keep a burst of logins from blocking the
+    worker, pass a BoundedExecutor (or set AuthPassValidator.executor once at startup)
+    and the check runs on that pool instead. When the pool is saturated, validate()
+    raises OverloadError, which handle_exception turns into a 503 response. Inside
+    transaction.atomic() (or ATOMIC_REQUESTS) the check runs inline, because the pool
+    thread could not see users the transaction has not committed.
+
     Args:
         model_class (class): The model class in which to check for the existing attribute value.
         attribute_name (str): The name of the attribute to check for duplicates.
         error_code (str, optional): The error code for validation failures.
         error_message (str, optional): The error message for validation failures.
+        executor (BoundedExecutor, optional): The pool to run authenticate() on. Defaults
+            to the class-level executor, which is None (run inline).
         **kwargs: Additional keyword arguments for record validation.
 
     Example:
         # Validate 'email' field to ensure it exists in the 'User' model
         AuthPassValidator(User, 'email', error_code="E001", error_message="Email already exists", username="user123")
+
+        # Run every AuthPassValidator on a bounded pool
+        AuthPassValidator.executor = BoundedExecutor(max_workers=4, max_queue=32, queue_timeout=1.5, name='auth')
     """
 
-    def __init__(self, model_class, attribute_name, error_code=None, error_message=None, **kwargs):
-        super().__init__(attribute_name)
+    uses_db = True
+    executor = None
+
+    def __init__(self, model_class, attribute_name, error_code=None, error_message=None, executor=None, **kwargs):
+        super().__init__(attribute_name, error_code, error_message)
         self.model_class = model_class
         self.attribute_name = attribute_name
-        self.error_code = error_code
-        self.error_message = error_message
+        if executor is not None:
+            self.executor = executor
         self.kwargs = kwargs
 
-    def validate(self):
-        """Validates if a record with the same attribute value already exists in the database."""
-        existing_record = authenticate(**self.kwargs)
+    def validate(self, value=None):
+        """Validates the credentials passed as keyword arguments. The field value is not used."""
+        if self.executor is None or _in_atomic_block():
+            from django.contrib.auth import authenticate
+
+            existing_record = authenticate(**self.kwargs)
+        else:
+            existing_record = self.executor.call(_authenticate, self.kwargs)
         if not existing_record:
-            self.add_error(self.error_code, self.error_message)
+            return self.error()
+        return []
 
 
 
-class ModelAttributeNotExistsValidator(ValidatorBase):
+class ModelAttributeNotExistsValidator(StatelessValidator):
     """
     Validator for checking if a record with the same attribute value does not exist in the database.
 
@@ -329,23 +661,30 @@ class ModelAttributeNotExistsValidator(ValidatorBase):
         ModelAttributeNotExistsValidator('username', User, 'username', error_code="E002", error_message="Username already exists")
     """
 
+    uses_db = True
+
     def __init__(self, field_name, model_class, attribute_name, error_code=None, error_message=None):
-        super().__init__(attribute_name)
+        super().__init__(attribute_name, error_code, error_message)
         self.field_name = field_name
         self.model_class = model_class
         self.attribute_name = attribute_name
-        self.error_code = error_code
-        self.error_message = error_message
 
     def validate(self, value):
         """Validates if a record with the same attribute value does not exist in the database."""
-        filter_kwargs = {self.attribute_name: value}
-        existing_record = self.model_class.objects.filter(**filter_kwargs).first()
-        if not existing_record:
-            self.add_error(self.error_code, self.error_message)
+        if not record_exists(self.model_class, self.attribute_name, value):
+            return self.error()
+        return []
+
+    def lookup(self):
+        return self.model_class, self.attribute_name
 
+    def validate_found(self, value, found):
+        if value not in found:
+            return self.error()
+        return []
 
-class FieldRelatedValidator(ValidatorBase):
+
+class FieldRelatedValidator(StatelessValidator):
     """
     Validator for checking if a related field value exists in the database.
 
@@ -361,22 +700,461 @@ class FieldRelatedValidator(ValidatorBase):
         FieldRelatedValidator('user_id', User, 'id', error_code="E003", error_message="User does not exist")
     """
 
+    uses_db = True
+
     def __init__(self, field_name, model_class, lookup_field_alias, error_code=None, error_message=None):
-        super().__init__(field_name)
+        super().__init__(field_name, error_code, error_message)
         self.model_class = model_class
         self.lookup_field_alias = lookup_field_alias
-        self.error_code = error_code
-        self.error_message = error_message
 
     def validate(self, value):
         """Validates if the related field value exists in the database."""
-        if value:
-            filter_kwargs = {self.lookup_field_alias: value}
-            existing_object = self.model_class.objects.filter(**filter_kwargs).first()
-            if existing_object:
-                self.add_error(self.error_code, self.error_message)
+        if value and record_exists(self.model_class, self.lookup_field_alias, value):
+            return self.error()
+        return []
+
+    def lookup(self):
+        return self.model_class, self.lookup_field_alias
+
+    def needs_lookup(self, value):
+        return bool(value)
+
+    def validate_found(self, value, found):
+        if value and value in found:
+            return self.error()
+        return []
+
 
 
+_UNBATCHABLE = object()
+
+
+def _normalize_lookup_value(normalize, value):
+    """Converts a value to the field's Python type, or returns _UNBATCHABLE if it cannot be matched from a set."""
+    try:
+        value = normalize(value)
+        hash(value)
+    except (DjangoValidationError, TypeError, ValueError):
+        return _UNBATCHABLE
+    return value
+
+
+def fetch_existing_values(model_class, attribute, values):
+    """
+    Return the subset of values that exist for an attribute, using one IN query.
+
+    Args:
+        model_class (class): The Django model class to query.
+        attribute (str): The name of the attribute to check.
+        values (iterable): The values to look up.
+
+    Returns:
+        set: The values found in the database. None is included if a row with a NULL
+            attribute exists and None was among the values.
+    """
+    values = set(values)
+    found = set()
+    if None in values:
+        values.discard(None)
+        if model_class.objects.filter(**{f"{attribute}__isnull": True}).exists():
+            found.add(None)
+    if values:
+        queryset = model_class.objects.filter(**{f"{attribute}__in": values}).order_by()
+        found.update(queryset.values_list(attribute, flat=True).distinct())
+    return found
+
+
+class ValidationPlan:
+    """
+    Immutable, precompiled form of a validator list.
+
+    Validators are grouped by field, and within each field pure checks run before
+    database-backed ones (see uses_db). Each field's value is read from the data once.
+    The pure checks of every field run first; the existence probes of the database
+    validators still needed are then merged into one query per model (see probe_exists).
+    A plan holds no per-run state, so it can be built once at import time and shared
+    across requests and threads as long as its validators are stateless.
+
+    Args:
+        validators (list): A list of validator objects.
+
+    Attributes:
+        fields (tuple): (field_name, validators) pairs in first-seen field order.
+
+    Methods:
+        run(data, fail_fast=False): Returns a set of (error code, error message) tuples.
+        errors(data, fail_fast=False): Returns the errors as a list of dictionaries.
+        run_many(records, fail_fast=False): Validates many records with one query per
+            database lookup and returns one error set per record.
+
+    Example:
+        USER_PLAN = ValidatorHelper.compile([
+            EmptyValidator('username', error_code="E001", error_message="Username is required."),
+            ModelAttributeExistsValidator('username', User, 'username', error_code="E002", error_message="Username already exists"),
+        ])
+        errors_list = USER_PLAN.errors(request.data, fail_fast=True)
+    """
+
+    __slots__ = ('fields', '_steps', '_batch_steps')
+
+    def __init__(self, validators):
+        grouped = {}
+        for validator in validators:
+            grouped.setdefault(validator.field_name, []).append(validator)
+
+        fields = []
+        steps = []
+        batch_steps = []
+        for field_name, field_validators in grouped.items():
+            # sorted() is stable, so validators keep their relative order within each kind.
+            ordered = tuple(sorted(field_validators, key=lambda validator: getattr(validator, 'uses_db', True)))
+            fields.append((field_name, ordered))
+            pure_runners = tuple(self._runner(validator) for validator in ordered if not getattr(validator, 'uses_db', True))
+            db_entries = tuple(
+                (self._runner(validator), validator, self._merge_lookup(validator))
+                for validator in ordered if getattr(validator, 'uses_db', True)
+            )
+            steps.append((field_name, pure_runners, db_entries))
+            batch_steps.append((field_name, tuple(
+                (self._runner(validator), validator, self._batch_lookup(validator)) for validator in ordered
+            )))
+        object.__setattr__(self, 'fields', tuple(fields))
+        object.__setattr__(self, '_steps', tuple(steps))
+        object.__setattr__(self, '_batch_steps', tuple(batch_steps))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ValidationPlan is immutable.")
+
+    @staticmethod
+    def _runner(validator):
+        """Returns a callable taking the field value and returning the validator's errors."""
+        if isinstance(validator, ValidatorBase):
+            return lambda value: run_validator(validator, value)
+        return validator.validate
+
+    @staticmethod
+    def _merge_lookup(validator):
+        """Returns the (model_class, attribute) pair of a validator whose probe can be merged, or None."""
+        lookup = getattr(validator, 'lookup', None)
+        return lookup() if lookup is not None else None
+
+    @staticmethod
+    def _batch_lookup(validator):
+        """
+        Returns (lookup key, value normalizer) for a batchable validator, or None.
+
+        Only plain concrete fields are batched. Lookups with a '__' suffix or through
+        relations keep their per-value query, because their matching rules cannot be
+        reproduced with a set of fetched values.
+        """
+        lookup = getattr(validator, 'lookup', None)
+        lookup = lookup() if lookup is not None else None
+        if lookup is None:
+            return None
+        model_class, attribute = lookup
+        if LOOKUP_SEP in attribute:
+            return None
+        try:
+            field = model_class._meta.get_field(attribute)
+        except FieldDoesNotExist:
+            return None
+        if not field.concrete:
+            return None
+        return lookup, field.to_python
+
+    @timed('validation')
+    @_observe_validation(many=False)
+    def run(self, data, fail_fast=False):
+        """
+        Validate data and collect unique errors.
+
+        Args:
+            data (dict): The data to be validated.
+            fail_fast (bool, optional): If True, stop validating a field after its first
+                failing validator. Other fields are still validated. Default is False.
+
+        Returns:
+            set: A set containing unique errors as (error code, error message) tuples.
+        """
+        errors_set, pending = self._run_pure_checks(data, fail_fast)
+        if pending:
+            self._run_db_checks(pending, errors_set, fail_fast)
+        return errors_set
+
+    def _run_pure_checks(self, data, fail_fast):
+        """
+        Runs the pure checks of every field.
+
+        Returns:
+            tuple: The error set so far and a list of (value, db_entries) pairs for the
+                fields whose database validators still have to run.
+        """
+        errors_set = set()
+        pending = []
+        get = data.get
+        for field_name, pure_runners, db_entries in self._steps:
+            value = get(field_name)
+            failed = False
+            for runner in pure_runners:
+                errors = runner(value)
+                if errors:
+                    errors_set.update((error['error_code'], error['error_message']) for error in errors)
+                    if fail_fast:
+                        failed = True
+                        break
+            if db_entries and not failed:
+                pending.append((value, db_entries))
+        return errors_set, pending
+
+    @staticmethod
+    def _run_db_checks(pending, errors_set, fail_fast):
+        """Runs the database validators of each pending field, merging their probes into one query per model."""
+        probes_by_model = {}
+        slots = []
+        for value, db_entries in pending:
+            field_slots = []
+            for runner, validator, lookup in db_entries:
+                slot = None
+                if lookup is not None and validator.needs_lookup(value):
+                    probes = probes_by_model.setdefault(lookup[0], [])
+                    slot = (lookup[0], len(probes))
+                    probes.append((lookup[1], value))
+                field_slots.append(slot)
+            slots.append(field_slots)
+
+        results = {model_class: probe_exists(model_class, probes) for model_class, probes in probes_by_model.items()}
+
+        for (value, db_entries), field_slots in zip(pending, slots):
+            for (runner, validator, lookup), slot in zip(db_entries, field_slots):
+                if slot is not None:
+                    errors = validator.validate_found(value, (value,) if results[slot[0]][slot[1]] else ())
+                elif lookup is not None:
+                    errors = validator.validate_found(value, ())
+                else:
+                    errors = runner(value)
+                if errors:
+                    errors_set.update((error['error_code'], error['error_message']) for error in errors)
+                    if fail_fast:
+                        break
+
+    def errors(self, data, fail_fast=False):
+        """
+        Validate data and return the errors in the format of ValidatorHelper.convert_errors_set_to_list.
+
+        Args:
+            data (dict): The data to be validated.
+            fail_fast (bool, optional): See run(). Default is False.
+
+        Returns:
+            list: A list of dictionaries with 'error_code' and 'error_message' keys.
+        """
+        return ValidatorHelper.convert_errors_set_to_list(self.run(data, fail_fast))
+
+    @timed('validation')
+    @_observe_validation(many=True)
+    def run_many(self, records, fail_fast=False):
+        """
+        Validate many records, resolving database-backed validators in bulk.
+
+        Values of every batchable validator are collected across all records and
+        resolved with one query per (model, attribute), instead of one query per value.
+        Values that cannot be normalized to the field's type fall back to the
+        validator's own per-value query.
+
+        Args:
+            records (list): A list of dicts to be validated.
+            fail_fast (bool, optional): See run(). Default is False.
+
+        Returns:
+            list: One set of (error code, error message) tuples per record, in order.
+        """
+        values_by_lookup = {}
+        for field_name, entries in self._batch_steps:
+            for _, validator, batch in entries:
+                if batch is None:
+                    continue
+                lookup, normalize = batch
+                values = values_by_lookup.setdefault(lookup, set())
+                for record in records:
+                    value = record.get(field_name)
+                    if not validator.needs_lookup(value):
+                        continue
+                    value = _normalize_lookup_value(normalize, value)
+                    if value is not _UNBATCHABLE:
+                        values.add(value)
+
+        found_by_lookup = {
+            lookup: fetch_existing_values(lookup[0], lookup[1], values)
+            for lookup, values in values_by_lookup.items()
+        }
+
+        results = []
+        for record in records:
+            errors_set = set()
+            get = record.get
+            for field_name, entries in self._batch_steps:
+                value = get(field_name)
+                for runner, validator, batch in entries:
+                    errors = None
+                    if batch is not None:
+                        lookup, normalize = batch
+                        normalized = _normalize_lookup_value(normalize, value)
+                        if normalized is not _UNBATCHABLE:
+                            errors = validator.validate_found(normalized, found_by_lookup[lookup])
+                    if errors is None:
+                        errors = runner(value)
+                    if errors:
+                        errors_set.update((error['error_code'], error['error_message']) for error in errors)
+                        if fail_fast:
+                            break
+            results.append(errors_set)
+        return results
+
+
+def _run_field_db_checks(value, db_entries, fail_fast):
+    """Runs the database validators of one field in order and returns their errors."""
+    errors_list = []
+    for runner, _, _ in db_entries:
+        errors = runner(value)
+        if errors:
+            errors_list.extend(errors)
+            if fail_fast:
+                break
+    return errors_list
+
+
+def _run_field_db_checks_in_worker(value, db_entries, fail_fast):
+    """Runs _run_field_db_checks() on a worker thread and releases the thread's database connection state afterwards."""
+    try:
+        return _run_field_db_checks(value, db_entries, fail_fast)
+    finally:
+        # Worker threads are not covered by Django's request_finished cleanup.
+        close_old_connections()
+
+
+class ConcurrentValidationRunner:
+    """
+    Runs the database-backed validators of independent fields concurrently.
+
+    Pure checks run inline. The database validators of each field run as one task on
+    a bounded thread pool, so request latency is close to the slowest field's round
+    trips instead of their sum. Validators of the same field still run in order.
+    Results are merged in field order, so the output does not depend on which task
+    finishes first. The active lookup_memo() is shared with the worker threads.
+
+    Worker threads use their own database connections, so they cannot see rows written
+    by an open transaction of the calling thread. Inside transaction.atomic(),
+    ATOMIC_REQUESTS or a TestCase the checks therefore run inline on the calling
+    thread, one field after another, exactly as ValidationPlan.run() would.
+
+    With fail_fast=True a field stops after its first failing validator, as in
+    ValidationPlan.run(). In addition, results are read in field order, and the first
+    field with database errors cancels every task that has not started yet. Only the
+    errors of fields up to and including that field are reported.
+
+    Args:
+        max_workers (int, optional): The maximum number of concurrent database checks. Default is 4.
+
+    Methods:
+        run(data, validators, fail_fast=False): Returns a set of (error code, error message) tuples.
+        arun(data, validators, fail_fast=False): Async variant of run() for async views.
+        errors(data, validators, fail_fast=False): Returns the errors as a list of dictionaries.
+        shutdown(wait=True): Stops the worker threads.
+
+    Example:
+        VALIDATION_RUNNER = ConcurrentValidationRunner(max_workers=4)
+
+        errors_list = VALIDATION_RUNNER.errors(request.data, USER_PLAN, fail_fast=True)
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='v2s-validation')
+
+    def _submit(self, value, db_entries, fail_fast):
+        context = contextvars.copy_context()
+        return self._executor.submit(context.run, _run_field_db_checks_in_worker, value, db_entries, fail_fast)
+
+    @staticmethod
+    def _run_inline(errors_set, pending, fail_fast):
+        for value, db_entries in pending:
+            errors = _run_field_db_checks(value, db_entries, fail_fast)
+            if errors:
+                errors_set.update((error['error_code'], error['error_message']) for error in errors)
+                if fail_fast:
+                    break
+        return errors_set
+
+    @staticmethod
+    def _plan(validators):
+        return validators if isinstance(validators, ValidationPlan) else ValidationPlan(validators)
+
+    def run(self, data, validators, fail_fast=False):
+        """
+        Validate data, running the database checks of different fields concurrently.
+
+        Args:
+            data (dict): The data to be validated.
+            validators (list or ValidationPlan): A list of validator objects or a compiled plan.
+            fail_fast (bool, optional): See the class docstring. Default is False.
+
+        Returns:
+            set: A set containing unique errors as (error code, error message) tuples.
+        """
+        errors_set, pending = self._plan(validators)._run_pure_checks(data, fail_fast)
+        if len(pending) <= 1 or _in_atomic_block():
+            return self._run_inline(errors_set, pending, fail_fast)
+
+        futures = [self._submit(value, db_entries, fail_fast) for value, db_entries in pending]
+        try:
+            for future in futures:
+                errors = future.result()
+                if errors:
+                    errors_set.update((error['error_code'], error['error_message']) for error in errors)
+                    if fail_fast:
+                        break
+        finally:
+            for future in futures:
+                future.cancel()
+        return errors_set
+
+    async def arun(self, data, validators, fail_fast=False):
+        """
+        Async variant of run(). The event loop is not blocked while the checks run.
+
+        Cancelling the calling task cancels the checks that have not started yet. If the
+        calling thread is inside a transaction the checks run inline, as in run().
+        """
+        errors_set, pending = self._plan(validators)._run_pure_checks(data, fail_fast)
+        if not pending or _in_atomic_block():
+            return self._run_inline(errors_set, pending, fail_fast)
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        futures = [asyncio.wrap_future(self._submit(value, db_entries, fail_fast), loop=loop)
+                   for value, db_entries in pending]
+        try:
+            for future in futures:
+                errors = await future
+                if errors:
+                    errors_set.update((error['error_code'], error['error_message']) for error in errors)
+                    if fail_fast:
+                        break
+        finally:
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        return errors_set
+
+    def errors(self, data, validators, fail_fast=False):
+        """Validate data and return the errors in the format of ValidatorHelper.convert_errors_set_to_list."""
+        return ValidatorHelper.convert_errors_set_to_list(self.run(data, validators, fail_fast))
+
+    def shutdown(self, wait=True):
+        """Stops the worker threads. Checks already submitted finish first if wait is True."""
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
 
 class ValidatorHelper:
     """
@@ -392,6 +1170,12 @@ class ValidatorHelper:
         convert_errors_set_to_list(errors_set):
             Convert a set of errors (error code, error message) to a list of dictionaries.
 
+        compile(validators):
+            Compile a list of validators into a reusable ValidationPlan.
+
+        validate_many(records, validators, fail_fast=False):
+            Validate many records with one query per database lookup and return per-record error lists.
+
     Example:
         # Create a list of validators and validate data
         validators = [MinMaxLengthValidator('field1', min_length=1, max_length=100, error_code="E001", error_message="Field1 error")]
@@ -403,6 +1187,8 @@ class ValidatorHelper:
     """
 
     @staticmethod
+    @timed('validation')
+    @_observe_validation(many=False)
     def validate_and_collect_errors(data, validators):
         """
         Validate data using a list of validators and collect unique errors.
@@ -424,8 +1210,8 @@ class ValidatorHelper:
 
         for validator in validators:
             value = data.get(validator.field_name)
-            validator.validate(value)
-            errors_set.update((error['error_code'], error['error_message']) for error in validator.errors)
+            errors = run_validator(validator, value)
+            errors_set.update((error['error_code'], error['error_message']) for error in errors)
 
         return errors_set
 
@@ -445,3 +1231,47 @@ class ValidatorHelper:
             errors_list = ValidatorHelper.convert_errors_set_to_list(errors_set)
         """
         return list(map(lambda x: {'error_code': x[0], 'error_message': x[1]}, errors_set))
+
+    @staticmethod
+    def compile(validators):
+        """
+        Compile a list of validators into a reusable ValidationPlan.
+
+        Args:
+            validators (list): A list of validator objects.
+
+        Returns:
+            ValidationPlan: An immutable plan that can be built once and run per request.
+
+        Example:
+            USER_PLAN = ValidatorHelper.compile(user_validators)
+            errors_list = USER_PLAN.errors(request.data, fail_fast=True)
+        """
+        return ValidationPlan(validators)
+
+    @staticmethod
+    def validate_many(records, validators, fail_fast=False):
+        """
+        Validate many records with coalesced database checks.
+
+        ModelAttributeExistsValidator, ModelAttributeNotExistsValidator and
+        FieldRelatedValidator values are resolved with one query per (model, attribute)
+        across all records, so a 10k-row import costs a handful of queries instead of
+        tens of thousands. Set membership is used to match the fetched values, so
+        database collations that compare case-insensitively are not reproduced.
+
+        Args:
+            records (list): A list of dicts to be validated.
+            validators (list or ValidationPlan): A list of validator objects or a compiled plan.
+            fail_fast (bool, optional): If True, stop validating a field of a record after
+                its first failing validator. Default is False.
+
+        Returns:
+            list: One list of error dictionaries per record, in the format of convert_errors_set_to_list.
+
+        Example:
+            errors_per_row = ValidatorHelper.validate_many(rows, validators)
+            invalid_rows = {index: errors for index, errors in enumerate(errors_per_row) if errors}
+        """
+        plan = validators if isinstance(validators, ValidationPlan) else ValidationPlan(validators)
+        return [ValidatorHelper.convert_errors_set_to_list(errors_set) for errors_set in plan.run_many(records, fail_fast)]
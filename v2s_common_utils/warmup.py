@@ -0,0 +1,243 @@
+import logging
+import os
+import sys
+import threading
+import time
+
+from v2s_common_utils.logger import log_event
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_SETTINGS = {
+    # Run the warm-up from AppConfig.ready(). Off by default: enable it in the settings of
+    # processes that serve requests, not in workers, scripts or management commands.
+    'ENABLED': False,
+    # Names of the registered steps to run. None runs all of them.
+    'STEPS': None,
+    # Dotted paths of extra callables, run after the registered steps.
+    'CALLABLES': [],
+    # Seconds ready() waits for the warm-up. Steps not started by then are skipped.
+    'TIMEOUT': 30.0,
+    # Run in a daemon thread and return from ready() at once.
+    'BACKGROUND': False,
+    # Formats prepared by the 'schema' step.
+    'SCHEMA_FORMATS': ('json',),
+    # Management commands that do not serve requests, so skip the warm-up. Test runs
+    # (the 'test' command and pytest) are skipped as well.
+    'SKIP_COMMANDS': ('makemigrations', 'migrate', 'showmigrations', 'sqlmigrate', 'collectstatic',
+                      'check', 'shell', 'dbshell', 'createsuperuser', 'changepassword', 'test',
+                      'v2s_profile_report', 'v2s_render_schema', 'v2s_warmup'),
+}
+
+
+def get_warmup_settings():
+    """Returns DEFAULT_WARMUP_SETTINGS updated with settings.V2S_WARMUP."""
+    from django.conf import settings
+
+    return {**DEFAULT_WARMUP_SETTINGS, **getattr(settings, 'V2S_WARMUP', {})}
+
+
+class WarmupResult:
+    """The outcome of one warm-up step: 'ok', 'failed' or 'skipped', and how long it took."""
+
+    __slots__ = ('name', 'status', 'duration_ms', 'error')
+
+    def __init__(self, name, status, duration_ms=0.0, error=None):
+        self.name = name
+        self.status = status
+        self.duration_ms = duration_ms
+        self.error = error
+
+    def __repr__(self):
+        return f'<WarmupResult {self.name} {self.status} {self.duration_ms:.1f} ms>'
+
+
+class WarmupRegistry:
+    """
+    Ordered registry of callables that pre-build caches before the first request.
+
+    Steps run one after another, in registration order. A step that raises is logged and
+    the next one runs. Once the deadline has passed no further step is started, and the
+    remaining steps are reported as skipped, so a slow step delays startup by at most
+    the timeout. Setting the stop event has the same effect. A step that is already
+    running cannot be interrupted and finishes on its own.
+
+    Methods:
+        register(name, func): Adds a step. Can be used as a decorator.
+        unregister(name): Removes a step.
+        names(): Returns the registered step names, in order.
+        run(names, extra, timeout, stop): Runs the steps and returns their WarmupResults.
+
+    Example:
+        @WARMUP.register('user_serializer')
+        def warm_user_serializer():
+            UserSerializer().fields
+    """
+
+    def __init__(self):
+        self._steps = {}
+        self._lock = threading.Lock()
+        self.last_results = []
+
+    def register(self, name, func=None):
+        """Adds a step under the given name, replacing any step of that name."""
+        if func is None:
+            return lambda f: self.register(name, f)
+        self._steps[name] = func
+        return func
+
+    def unregister(self, name):
+        """Removes a step. Unknown names are ignored."""
+        self._steps.pop(name, None)
+
+    def names(self):
+        """Returns the registered step names, in order."""
+        return list(self._steps)
+
+    def run(self, names=None, extra=(), timeout=None, stop=None):
+        """
+        Runs the registered steps, then the extra ones.
+
+        Args:
+            names (list, optional): The registered steps to run. None runs all of them.
+            extra (list, optional): More (name, callable) pairs to run afterwards.
+            timeout (float, optional): Seconds after which no step is started. None waits
+                for every step.
+            stop (threading.Event, optional): Once set, no further step is started.
+
+        Returns:
+            list: A WarmupResult per step.
+        """
+        selected = self.names() if names is None else [name for name in names if name in self._steps]
+        steps = [(name, self._steps[name]) for name in selected] + list(extra)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        results = []
+        with self._lock:
+            for name, func in steps:
+                if (deadline is not None and time.monotonic() >= deadline) or (stop is not None and stop.is_set()):
+                    results.append(WarmupResult(name, 'skipped'))
+                    continue
+                started = time.perf_counter()
+                try:
+                    func()
+                except Exception as e:
+                    result = WarmupResult(name, 'failed', (time.perf_counter() - started) * 1000, e)
+                    logger.exception("Warm-up step %s failed", name)
+                else:
+                    result = WarmupResult(name, 'ok', (time.perf_counter() - started) * 1000)
+                results.append(result)
+                log_event(logger, 'WARMUP_STEP', name, result.status, round(result.duration_ms, 1),
+                          step=name, status=result.status, duration_ms=round(result.duration_ms, 1))
+            self.last_results = results
+        return results
+
+    def _after_fork_in_child(self):
+        # A fork (gunicorn --preload) during a warm-up run would leave the lock held forever.
+        self._lock = threading.Lock()
+
+
+WARMUP = WarmupRegistry()
+register_warmup = WARMUP.register
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=WARMUP._after_fork_in_child)
+
+
+@WARMUP.register('patterns')
+def _warm_patterns():
+    # Importing the validators compiles the named patterns and the module-level plans.
+    import v2s_common_utils.validations  # noqa: F401
+
+
+@WARMUP.register('error_catalog')
+def _warm_error_catalog():
+    from v2s_common_utils.errors import get_error_catalog
+
+    catalog = get_error_catalog()
+    catalog.load()
+    for locale in [None] + catalog.locales():
+        catalog.messages(locale)
+
+
+@WARMUP.register('schema')
+def _warm_schema():
+    try:
+        import drf_yasg  # noqa: F401
+    except ImportError:
+        return
+    from v2s_common_utils.swagger import schema_cache
+
+    schema_cache.warm(formats=tuple(get_warmup_settings()['SCHEMA_FORMATS']))
+
+
+def _import_step(path):
+    """Returns a step that imports and calls path, so a bad path fails only that step."""
+    def step():
+        from django.utils.module_loading import import_string
+
+        import_string(path)()
+    return step
+
+
+def _extra_steps(paths):
+    return [(path, _import_step(path)) for path in paths]
+
+
+def _report(results, total_ms):
+    summary = ', '.join(f'{r.name} {r.status} {r.duration_ms:.0f} ms' for r in results)
+    log_event(logger, 'WARMUP_DONE', round(total_ms, 1), summary, total_ms=round(total_ms, 1),
+              steps={r.name: [r.status, round(r.duration_ms, 1)] for r in results})
+
+
+def run_warmup(config=None):
+    """
+    Runs the warm-up as configured by settings.V2S_WARMUP (see DEFAULT_WARMUP_SETTINGS).
+
+    Blocks for at most TIMEOUT seconds, or not at all when BACKGROUND is set. When TIMEOUT
+    runs out no further step is started; a step that is still running cannot be
+    interrupted and finishes in the background, after which the thread exits.
+
+    Returns:
+        list: The WarmupResults, or None when the warm-up runs in the background.
+    """
+    config = config or get_warmup_settings()
+    timeout = config['TIMEOUT']
+    extra = _extra_steps(config['CALLABLES'])
+    outcome = {}
+    stop = threading.Event()
+
+    def run():
+        started = time.perf_counter()
+        outcome['results'] = WARMUP.run(config['STEPS'], extra, timeout, stop)
+        _report(outcome['results'], (time.perf_counter() - started) * 1000)
+
+    thread = threading.Thread(target=run, name='v2s-warmup', daemon=True)
+    thread.start()
+    if config['BACKGROUND']:
+        return None
+    thread.join(timeout)
+    if thread.is_alive():
+        stop.set()
+        logger.warning("Warm-up did not finish within %s s; continuing startup.", timeout)
+        return None
+    return outcome['results']
+
+
+def _skipped_command(skip_commands):
+    if 'pytest' in sys.modules:
+        return True
+    if len(sys.argv) < 2:
+        return False
+    command = sys.argv[1]
+    if command == 'runserver':
+        # The autoreloader's parent process only watches files; the child serves requests.
+        return os.environ.get('RUN_MAIN') != 'true' and '--noreload' not in sys.argv
+    return command in skip_commands
+
+
+def run_startup_warmup():
+    """Called from AppConfig.ready(). Runs the warm-up unless it is disabled for this process."""
+    config = get_warmup_settings()
+    if not config['ENABLED'] or _skipped_command(config['SKIP_COMMANDS']):
+        return None
+    return run_warmup(config)